@@ -0,0 +1,75 @@
+"""Benchmark the streaming xlsxwriter export against pandas + openpyxl
+
+Each writer runs in a fresh subprocess so peak RSS is measured per writer.
+
+Usage:
+    python benchmarks/excel_export_benchmark.py [rows] [columns]
+"""
+import os
+import sys
+import time
+import resource
+import subprocess
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pandas as pd
+
+
+def make_frame(rows, columns, seed=42):
+    """Synthetic wide result: a mix of text, numeric, boolean and missing values"""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(columns):
+        kind = i % 4
+        if kind == 0:
+            data[f"text_{i}"] = rng.choice(["Chief Executive Officer", "Sales Manager", "Founder at Acme", None], rows)
+        elif kind == 1:
+            data[f"number_{i}"] = rng.integers(0, 100_000, rows)
+        elif kind == 2:
+            values = rng.random(rows)
+            values[values < 0.3] = np.nan
+            data[f"float_{i}"] = values
+        else:
+            data[f"flag_{i}"] = rng.random(rows) < 0.5
+    return pd.DataFrame(data)
+
+
+def run_writer(writer, rows, columns):
+    df = make_frame(rows, columns)
+    path = os.path.join(tempfile.mkdtemp(), "export.xlsx")
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if writer == "openpyxl":
+        with pd.ExcelWriter(path, engine="openpyxl") as excel_writer:
+            df.to_excel(excel_writer, sheet_name="data", index=False)
+    else:
+        from src.data.excel_writer import write_excel
+        write_excel({"data": df}, path)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux
+    print(f"{writer},{elapsed:.2f},{(peak - baseline) / 1024:.0f},{os.path.getsize(path) / 1e6:.1f}")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_500
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    print(f"Rows: {rows}, columns: {columns}")
+    print(f"{'writer':<10} {'seconds':>8} {'peak RSS growth (MB)':>21} {'file (MB)':>10}")
+    for writer in ("openpyxl", "streaming"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--writer", writer, str(rows), str(columns)],
+            capture_output=True, text=True, check=True
+        ).stdout.strip().splitlines()[-1]
+        name, seconds, peak, size = output.split(",")
+        print(f"{name:<10} {seconds:>8} {peak:>21} {size:>10}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--writer":
+        run_writer(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))
+    else:
+        main()
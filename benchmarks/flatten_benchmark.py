@@ -0,0 +1,132 @@
+"""Benchmark flattening batch profile payloads into a DataFrame
+
+Compares the previous approach (decode every payload, then one
+pandas.json_normalize over all records) with RecordFlattener and with
+DataProcessor.normalize_records' worker-process path, and checks that all
+of them produce the same frame. With --sweep, times serial flattening
+against the caller's share of the worker-process path over a range of
+sizes (see PARALLEL_NORMALIZE_MIN_RECORDS).
+
+Usage:
+    python benchmarks/flatten_benchmark.py [profiles]
+    python benchmarks/flatten_benchmark.py --sweep
+"""
+import os
+import sys
+import json
+import time
+import pickle
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pandas as pd
+from src.data.data_processor import DataProcessor
+from src.data.record_flattener import (
+    flatten_payloads, normalize_records, concat_chunks, _pack, _normalize_packed, _worker_pool
+)
+
+
+def make_payloads(count, seed=42):
+    """Mix of dicts, JSON strings and single-item lists, with optional nested fields"""
+    rng = np.random.default_rng(seed)
+    payloads = []
+    for i in range(count):
+        profile = {
+            "firstName": f"First{i}",
+            "lastName": f"Last{i}",
+            "headline": str(rng.choice(["Chief Executive Officer", "Sales Manager", "Founder"])),
+            "connectionsCount": int(rng.integers(0, 500)),
+            "company": {"name": f"Company {i % 500}", "headcount": {"min": 11, "max": 50}},
+            "experiences": [{"title": "Manager", "company": "Acme"}],
+            "isPremium": bool(i % 2),
+        }
+        if i % 3 == 0:
+            profile["location"] = {"city": "Bangalore", "country": "India"}
+        if i % 2:
+            payloads.append(json.dumps(profile))
+        else:
+            payloads.append([profile] if i % 5 == 0 else profile)
+    return payloads
+
+
+def previous_flatten(payloads):
+    expanded = []
+    for payload in payloads:
+        obj = json.loads(payload) if isinstance(payload, str) else payload
+        if isinstance(obj, list):
+            expanded.extend(obj)
+        else:
+            expanded.append(obj)
+    return pd.json_normalize(expanded)
+
+
+def decoded_records(payloads):
+    records = []
+    for payload in payloads:
+        obj = json.loads(payload) if isinstance(payload, str) else payload
+        records.extend(obj if isinstance(obj, list) else [obj])
+    return records
+
+
+def parallel_flatten(payloads):
+    records = decoded_records(payloads)
+    return DataProcessor.normalize_records(records, min_parallel_records=0, max_workers=max(2, os.cpu_count() or 1))
+
+
+def best_of(func, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def sweep(sizes=(1_000, 2_000, 5_000, 10_000, 20_000, 50_000), workers=4):
+    """Print serial flattening time against the time the caller spends on the worker-process path
+
+    The caller's share is the pool round trip, sending the packed chunks and
+    receiving and concatenating the frames; the flattening itself runs in
+    the workers, outside the caller's GIL.
+    """
+    pool = _worker_pool(workers)
+    tiny = [_pack([{"a": 1}])] * workers
+    list(pool.map(_normalize_packed, tiny))
+    round_trip = best_of(lambda: list(pool.map(_normalize_packed, tiny)), 5)
+    print(f"CPUs: {os.cpu_count()}, pool round trip: {round_trip * 1000:.1f}ms")
+    for count in sizes:
+        records = decoded_records(make_payloads(count))
+        size = -(-count // (workers * 2))
+        parts = [records[start:start + size] for start in range(0, count, size)]
+        frames = [pickle.dumps(_normalize_packed(_pack(part)), protocol=pickle.HIGHEST_PROTOCOL) for part in parts]
+        serial = best_of(lambda: normalize_records(records))
+        send = best_of(lambda: [pickle.dumps(_pack(part), protocol=pickle.HIGHEST_PROTOCOL) for part in parts])
+        receive = best_of(lambda: concat_chunks([pickle.loads(frame) for frame in frames]))
+        caller = round_trip + send + receive
+        print(f"{count:>7} records: serial {serial * 1000:7.1f}ms, caller's share {caller * 1000:6.1f}ms ({caller / serial:.0%})")
+
+
+def main():
+    if sys.argv[1:] == ["--sweep"]:
+        sweep()
+        return
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    payloads = make_payloads(count)
+    timings = {}
+    frames = {}
+    for name, func in (
+        ("json_normalize", previous_flatten), ("RecordFlattener", flatten_payloads), ("worker processes", parallel_flatten)
+    ):
+        start = time.perf_counter()
+        frames[name] = func(payloads)
+        timings[name] = time.perf_counter() - start
+    pd.testing.assert_frame_equal(frames["json_normalize"], frames["RecordFlattener"])
+    pd.testing.assert_frame_equal(frames["json_normalize"], frames["worker processes"])
+    print(f"Profiles: {count}, CPUs: {os.cpu_count()} (identical output)")
+    for name, seconds in timings.items():
+        print(f"{name:<17} {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark reading one column of an uploaded workbook
+
+Compares pandas.read_excel (openpyxl, whole sheet) with read_upload using
+the calamine reader and openpyxl's read-only fallback. Each reader runs in
+a fresh subprocess so peak RSS is measured per reader.
+
+Usage:
+    python benchmarks/ingestion_benchmark.py [rows] [columns]
+"""
+import os
+import sys
+import time
+import resource
+import subprocess
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pandas as pd
+
+READERS = ["pandas-openpyxl", "ingestion-calamine", "ingestion-openpyxl", "ingestion-csv", "ingestion-parquet"]
+
+
+def make_upload(rows, columns, directory, seed=42):
+    """Synthetic profile export with a liPublicProfileURL column among many others"""
+    from src.data.excel_writer import write_excel
+    rng = np.random.default_rng(seed)
+    data = {"liPublicProfileURL": [f"https://www.linkedin.com/in/person-{i}/" for i in range(rows)]}
+    for i in range(columns - 1):
+        data[f"field_{i}"] = rng.choice(["Chief Executive Officer", "Sales Manager", "Bangalore, India", None], rows)
+    df = pd.DataFrame(data)
+    write_excel({"profiles": df}, os.path.join(directory, "upload.xlsx"))
+    df.to_csv(os.path.join(directory, "upload.csv"), index=False)
+    df.to_parquet(os.path.join(directory, "upload.parquet"), index=False)
+
+
+def run_reader(reader, directory):
+    import src.data.ingestion as ingestion
+    if reader == "ingestion-openpyxl":
+        ingestion.CalamineWorkbook = None
+    path = os.path.join(directory, "upload." + {"ingestion-csv": "csv", "ingestion-parquet": "parquet"}.get(reader, "xlsx"))
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if reader == "pandas-openpyxl":
+        df = pd.read_excel(path)
+    else:
+        df = ingestion.read_upload(path, usecols=["liPublicProfileURL"])
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux
+    print(f"{reader},{elapsed:.2f},{(peak - baseline) / 1024:.0f},{len(df)}")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    directory = tempfile.mkdtemp()
+    make_upload(rows, columns, directory)
+    print(f"Rows: {rows}, columns: {columns}")
+    print(f"{'reader':<20} {'seconds':>8} {'peak RSS growth (MB)':>21} {'rows':>8}")
+    for reader in READERS:
+        output = subprocess.run(
+            [sys.executable, __file__, "--reader", reader, directory],
+            capture_output=True, text=True, check=True
+        ).stdout.strip().splitlines()[-1]
+        name, seconds, peak, count = output.split(",")
+        print(f"{name:<20} {seconds:>8} {peak:>21} {count:>8}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--reader":
+        run_reader(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,70 @@
+"""Benchmark the compiled keyword matcher against the per-row lambda filter
+
+Usage:
+    python benchmarks/keyword_matcher_benchmark.py [rows]
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pandas as pd
+from src.data.keyword_matcher import get_matcher
+from src.data.title_taxonomy import DECISION_MAKER_KEYWORDS
+
+FILLER = [
+    "software engineer", "data analyst", "account executive", "student", "consultant",
+    "recruiter", "designer", "product owner", "teacher", "nurse", "at acme corp",
+    "helping brands grow", "| speaker", "open to work", "b2b saas", "mba",
+]
+
+
+def make_headlines(rows, seed=42):
+    """Generate synthetic headlines, roughly a third of which contain a decision-maker title"""
+    rng = random.Random(seed)
+    headlines = []
+    for _ in range(rows):
+        parts = rng.sample(FILLER, 3)
+        if rng.random() < 0.33:
+            parts.insert(rng.randrange(4), rng.choice(DECISION_MAKER_KEYWORDS).title())
+        headlines.append(" ".join(parts))
+    return pd.Series(headlines)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    headlines = make_headlines(rows)
+    keywords = DECISION_MAKER_KEYWORDS
+
+    start = time.perf_counter()
+    lowered = headlines.astype(str).str.lower()
+    lambda_mask = lowered.apply(lambda x: any(k.lower() in x for k in keywords))
+    lambda_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = get_matcher(keywords)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher_mask = matcher.contains(headlines)
+    matcher_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher.extract(headlines)
+    extract_time = time.perf_counter() - start
+
+    assert lambda_mask.equals(matcher_mask), "matcher disagrees with the lambda filter"
+
+    print(f"rows:              {rows:,}")
+    print(f"keywords:          {len(keywords)}")
+    print(f"matched rows:      {int(matcher_mask.sum()):,}")
+    print(f"lambda .apply:     {lambda_time:.3f}s")
+    print(f"matcher compile:   {compile_time * 1000:.1f}ms")
+    print(f"matcher.contains:  {matcher_time:.3f}s ({lambda_time / matcher_time:.1f}x)")
+    print(f"matcher.extract:   {extract_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark vectorized lead scoring on synthetic profiles
+
+Before timing, checks that headlines which only contain a title as part of
+another word are not scored as decision-makers.
+
+Usage:
+    python benchmarks/lead_scoring_benchmark.py [rows]
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pandas as pd
+from src.data.lead_scoring import LeadScorer
+from src.data.title_taxonomy import classify_titles
+from keyword_matcher_benchmark import make_headlines
+
+HEADCOUNTS = ["1-10", "11-50", "51-200", "201-500", "501-1,000", "1,001-5,000", "5,001-10,000", "10,001+", None]
+DEGREES = ["1st", "2nd", "3rd", "3rd+", None]
+LOCATIONS = ["London, England", "Dubai, UAE", "New York, United States", "Singapore", "Berlin, Germany", None]
+
+
+def make_profiles(rows, seed=42):
+    """Generate synthetic people-search rows"""
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        "headline": make_headlines(rows, seed=seed),
+        "headcountRange": [rng.choice(HEADCOUNTS) for _ in range(rows)],
+        "connectionDegree": [rng.choice(DEGREES) for _ in range(rows)],
+        "locationArea": [rng.choice(LOCATIONS) for _ in range(rows)],
+        "isPremium": [rng.random() < 0.2 for _ in range(rows)],
+        "likeCount": [rng.randrange(0, 500) for _ in range(rows)],
+    })
+
+
+# Headline -> expected title score; none of the first ones holds a decision-maker title
+TITLE_SCORE_CHECKS = {
+    "Doctor at City Hospital": 0.0,
+    "Actor and model": 0.0,
+    "Factory supervisor": 0.0,
+    "VPN engineer": 0.0,
+    "Directorate assistant": 0.0,
+    "Director of Sales": 0.6,
+    "Cofounder at Acme": 1.0,
+}
+
+
+def check_title_scores():
+    """Fail if a headline's title score differs from TITLE_SCORE_CHECKS"""
+    headlines = pd.DataFrame({"headline": list(TITLE_SCORE_CHECKS)})
+    scores = LeadScorer().score(headlines)["score_title"].round(2)
+    wrong = {h: s for h, s in zip(headlines["headline"], scores) if s != TITLE_SCORE_CHECKS[h]}
+    assert not wrong, f"Unexpected title scores: {wrong}"
+
+
+def main():
+    check_title_scores()
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    profiles = make_profiles(rows)
+    scorer = LeadScorer(target_locations=["london", "dubai"])
+
+    start = time.perf_counter()
+    ranked = scorer.rank(profiles)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scorer.rank(profiles)
+    warm = time.perf_counter() - start
+
+    classified = classify_titles(profiles, "headline")
+    start = time.perf_counter()
+    scorer.rank(classified)
+    preclassified = time.perf_counter() - start
+
+    print(f"Rows: {rows}")
+    print(f"Cold (classifying titles): {cold:.3f}s")
+    print(f"Warm (classifier cache):   {warm:.3f}s")
+    print(f"Pre-classified titles:     {preclassified:.3f}s")
+    print(ranked[["lead_rank", "lead_score", "headline"]].head(5).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
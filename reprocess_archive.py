@@ -0,0 +1,134 @@
+"""Rebuild reports from archived raw TexAu responses, without running any automation
+
+Archived executions (see src/data/response_archive.py) are grouped into one
+table per automation, then normalized, filtered and exported with the
+current processing code.
+
+Usage:
+    python reprocess_archive.py --list
+    python reprocess_archive.py [--automation ID] [--execution ID ...] [--since YYYY-MM-DD]
+        [--query EXPR] [--min-score N] [--numeric] [--format excel|csv|jsonl|parquet]
+        [--compression gzip|zstd] [--output-dir DIR]
+"""
+import os
+import sys
+import argparse
+from datetime import datetime
+
+# Add parent directory to path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from src.data.data_processor import DataProcessor
+from src.data.export_formats import EXPORT_FORMATS, COMPRESSIONS, export_filename
+from src.data.lead_scoring import LeadScorer
+from src.data.output_manager import OutputManager
+from src.data.record_flattener import payload_records
+from src.data.response_archive import ResponseArchive
+from src.logger import app_logger
+
+
+def archived_records(entries):
+    """Group the records of archived entries by automation
+
+    Returns:
+        Dict of automation ID to (table name, list of record dicts); each
+        record gets an archive_execution_id field naming its execution.
+        Payloads are decoded like the live pages do (JSON strings, lists).
+    """
+    groups = {}
+    for entry in entries:
+        data = (entry.get("response") or {}).get("data")
+        records = payload_records(data)
+        if data and not records:
+            app_logger.warning("Archived execution {} holds no JSON records", entry["execution_id"])
+        automation_id = entry.get("automation_id") or "unknown"
+        name, group = groups.setdefault(automation_id, (entry.get("name") or automation_id, []))
+        group.extend({"archive_execution_id": entry["execution_id"], **record} for record in records)
+    return groups
+
+
+def process_records(records, query=None, min_score=None, numeric=False):
+    """Normalize and filter archived records into a report table"""
+    df = DataProcessor.normalize_records(records)
+    if df.empty:
+        return df
+    df = df.dropna(axis=1, how="all")
+    df = df.loc[:, ~(df == "").all(axis=0)]
+    if numeric:
+        df = DataProcessor.add_numeric_columns(df)
+    if query:
+        df = df.query(query).reset_index(drop=True)
+    if min_score is not None:
+        scorer = LeadScorer()
+        if scorer.signal_columns(df):
+            df = scorer.rank(df, min_score=min_score)
+        else:
+            app_logger.warning("No lead signal columns found, --min-score ignored for {} rows", len(df))
+    return df
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Reprocess archived TexAu responses into reports")
+    parser.add_argument("--archive-dir", help="Response archive directory (RESPONSE_ARCHIVE_DIR by default)")
+    parser.add_argument("--list", action="store_true", help="List archived executions and exit")
+    parser.add_argument("--automation", help="Only executions of this automation ID")
+    parser.add_argument("--execution", nargs="+", help="Only these execution IDs")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="Only executions archived since this date")
+    parser.add_argument("--query", help="pandas query expression rows must match")
+    parser.add_argument("--min-score", type=float, help="Rank leads and drop those scoring below this (0-100)")
+    parser.add_argument("--numeric", action="store_true", help="Add parsed numeric columns")
+    parser.add_argument("--format", default="excel", choices=list(EXPORT_FORMATS), help="Export format")
+    parser.add_argument("--compression", choices=[c for c in COMPRESSIONS if c], help="Compression (CSV, JSON Lines, Parquet)")
+    parser.add_argument(
+        "--output-dir", help="Write the report into this directory instead of a new OUTPUT_DIR job (nothing there is deleted)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Main entry point for reprocessing"""
+    args = parse_args(argv)
+    archive = ResponseArchive(args.archive_dir)
+    entries = archive.entries(automation_id=args.automation, execution_ids=args.execution, since=args.since)
+
+    if args.list:
+        for entry in entries:
+            data = (entry.get("response") or {}).get("data")
+            count = len(payload_records(data))
+            print(f"{entry['archived_at']}  {entry.get('automation_id')}  {entry['execution_id']}  {count} records  {entry.get('name') or ''}")
+        return 0
+
+    groups = archived_records(entries)
+    if not groups:
+        print(f"No archived executions found in {archive.root}")
+        return 1
+
+    tables = {}
+    for automation_id, (name, records) in groups.items():
+        df = process_records(records, query=args.query, min_score=args.min_score, numeric=args.numeric)
+        app_logger.info("Reprocessed {} archived records of automation {} into {} rows", len(records), automation_id, len(df))
+        tables[name] = df
+
+    non_empty = [df for df in tables.values() if not df.empty]
+    zipped = args.format != "excel" and len(non_empty) > 1
+    if args.output_dir:
+        # A plain directory of the user's: write one new file, never apply retention there
+        os.makedirs(args.output_dir, exist_ok=True)
+        stem = f"linkedin_reprocessed_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        path = os.path.join(args.output_dir, export_filename(stem, args.format, args.compression, zipped=zipped))
+        DataProcessor.export_tables(tables, args.format, path, args.compression)
+    else:
+        output_manager = OutputManager()
+        file_name = export_filename("linkedin_reprocessed", args.format, args.compression, zipped=zipped)
+        path = output_manager.write(
+            output_manager.new_job("reprocess"), file_name,
+            lambda target: DataProcessor.export_tables(tables, args.format, target, args.compression)
+        )
+    for name, df in tables.items():
+        print(f"{name}: {len(df)} rows x {len(df.columns)} columns")
+    print(f"Report written to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pandas as pd
+from ..data.entity_store import DEFAULT_FRESHNESS_DAYS
+from ..data.linkedin_urls import LINKEDIN_BASE_URL, company_key, shared_url_index
+from ..logger import app_logger
+
+COMPANY_SCRAPER_AUTOMATION_ID = "63f742037022e05c11a9440e"  # LinkedIn Company Scraper
+
+# Columns of a profile result that can hold the current company URL, in order of preference
+COMPANY_URL_COLUMNS = ["liCompanyPublicUrl", "liCompanyUrl", "companyUrl", "companyLinkedinUrl"]
+
+# Nested company fields that do not belong on a profile row
+_NESTED_COMPANY_FIELDS = ["key_personnel"]
+
+
+def _company_url_column(df):
+    for candidate in COMPANY_URL_COLUMNS:
+        for col in df.columns:
+            if col == candidate or str(col).endswith((f"_{candidate}", f".{candidate}")):
+                return col
+    return None
+
+
+class CompanyEnricher:
+    """Scrape each distinct company of a profile result set once and join it back
+
+    Many profiles share a company, so companies are collected by canonical
+    company key first; numeric IDs and vanity slugs of companies scraped
+    before resolve to one key. Companies scraped within the freshness window
+    come from the entity store; the rest are scraped concurrently and
+    written back to it.
+    """
+
+    def __init__(self, linkedin_api, entity_store, connected_account_id, automation_id=COMPANY_SCRAPER_AUTOMATION_ID,
+                 max_workers=4, max_wait=120, max_age_days=DEFAULT_FRESHNESS_DAYS, timezone="Asia/Kolkata", url_index=None):
+        self.linkedin_api = linkedin_api
+        self.entity_store = entity_store
+        self.connected_account_id = connected_account_id
+        self.automation_id = automation_id
+        self.max_workers = max_workers
+        self.max_wait = max_wait
+        self.max_age_days = max_age_days
+        self.timezone = timezone
+        self.url_index = url_index if url_index is not None else shared_url_index()
+
+    def company_keys(self, df, url_column=None):
+        """Return the canonical company key of each row (None where no company URL)"""
+        url_column = url_column or _company_url_column(df)
+        if url_column is None:
+            return pd.Series(None, index=df.index, dtype=object)
+        codes, uniques = pd.factorize(df[url_column])
+        keys = pd.Series([company_key(self.url_index.canonicalize(u)) for u in uniques], dtype=object).reindex(codes).set_axis(df.index)
+        return keys.where(codes >= 0)
+
+    def _scrape(self, key):
+        started = time.perf_counter()
+        url = f"{LINKEDIN_BASE_URL}/company/{key}/"
+        try:
+            result = self.linkedin_api.run_and_wait(
+                name="Company Enrichment",
+                description="Enrich profiles with LinkedIn company data",
+                automation_id=self.automation_id,
+                connected_account_id=self.connected_account_id,
+                inputs={"liCompanyUrl": url},
+                timezone=self.timezone,
+                max_wait=self.max_wait
+            )
+            data = result.get("data") if result else None
+            status, error = ("ok" if data else "timeout"), None
+        except Exception as e:
+            data, status, error = None, "error", str(e)
+            app_logger.error("Company enrichment failed for {}: {}", url, error)
+        if isinstance(data, list):
+            data = data[0] if data else None
+        self.url_index.register_company(data, url)
+        return key, data, {
+            "company_key": key,
+            "status": status,
+            "seconds": round(time.perf_counter() - started, 1),
+            "error": error,
+        }
+
+    def fetch(self, keys):
+        """Return company records for the given keys, scraping only stale or missing ones
+
+        Args:
+            keys: Iterable of canonical company keys
+
+        Returns:
+            Tuple of (dict of key to company record, report DataFrame with one
+            row per company and its status: cached, ok, timeout or error)
+        """
+        keys = list(dict.fromkeys(k for k in keys if k))
+        fresh, stale = self.entity_store.split_by_freshness("company", keys, self.max_age_days)
+        records = dict(fresh)
+        reports = [{"company_key": key, "status": "cached", "seconds": 0.0, "error": None} for key in fresh]
+
+        scraped = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._scrape, key) for key in stale]
+            for future in as_completed(futures):
+                key, data, report = future.result()
+                reports.append(report)
+                if data:
+                    records[key] = data
+                    scraped.append((key, data))
+        if scraped:
+            self.entity_store.upsert("company", scraped)
+
+        app_logger.info(
+            "Company enrichment: {} companies, {} cached, {} scraped, {} failed",
+            len(keys), len(fresh), len(scraped), len(stale) - len(scraped)
+        )
+        return records, pd.DataFrame(reports, columns=["company_key", "status", "seconds", "error"])
+
+    def enrich(self, df, prefix="company_", url_column=None):
+        """Join company attributes onto every profile row
+
+        Args:
+            df: Profile result DataFrame
+            prefix: Prefix added to the company columns
+            url_column: Column holding the company URL (detected when omitted)
+
+        Returns:
+            Tuple of (copy of df with company columns appended, report DataFrame)
+        """
+        keys = self.company_keys(df, url_column)
+        records, report = self.fetch(keys.dropna().unique())
+        if not records:
+            return df.copy(), report
+
+        companies = pd.json_normalize(list(records.values()))
+        companies = companies.drop(columns=[c for c in _NESTED_COMPANY_FIELDS if c in companies.columns])
+        companies = companies.add_prefix(prefix)
+        companies.index = list(records.keys())
+        # Row-wise lookup by company key; rows without a company get NaN
+        enriched = pd.concat([
+            df.drop(columns=[c for c in companies.columns if c in df.columns]),
+            companies.reindex(keys.to_numpy()).set_axis(df.index),
+        ], axis=1)
+        return enriched, report
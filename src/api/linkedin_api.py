@@ -1,13 +1,30 @@
 # File: src/api/linkedin_api.py
 from .texau_client import TexAuClient
+from ..data.response_archive import ResponseArchive
 from ..logger import app_logger
+import os
 import json
+import time
+from collections import OrderedDict
+
+# Executions remembered per client for archiving; the oldest are forgotten past this
+MAX_TRACKED_EXECUTIONS = int(os.getenv("TEXAU_MAX_TRACKED_EXECUTIONS", "1000"))
 
 class LinkedInAPI:
     """Class for LinkedIn-specific API operations using TexAU"""
 
-    def __init__(self):
+    def __init__(self, archive=None):
+        """
+        Args:
+            archive: ResponseArchive that keeps every raw execution result
+                (the default archive directory when omitted)
+        """
         self.client = TexAuClient()
+        self.archive = archive or ResponseArchive()
+        # Execution ID -> (automation ID, run name, inputs) of runs started by
+        # this client, and IDs already archived; both bounded by MAX_TRACKED_EXECUTIONS
+        self._executions = OrderedDict()
+        self._archived = OrderedDict()
         app_logger.debug("LinkedIn API client initialized")
 
     def get_automations(self, platform_id):
@@ -32,12 +49,80 @@ class LinkedInAPI:
             "inputs": inputs
         }
         app_logger.debug(f"Payload sent to TexAU /run: {json.dumps(payload, indent=2)}")
-        return self.client._make_request(endpoint, method="POST", payload=payload)
+        result = self.client._make_request(endpoint, method="POST", payload=payload)
+        data = result.get("data") if isinstance(result, dict) else None
+        execution_id = (data.get("id") or data.get("workflowId")) if isinstance(data, dict) else None
+        if execution_id:
+            self._executions[execution_id] = (automation_id, name, inputs)
+            # Runs that never returned data (timeouts) would otherwise stay forever
+            while len(self._executions) > MAX_TRACKED_EXECUTIONS:
+                self._executions.popitem(last=False)
+        return result
 
     def get_execution_result(self, execution_id):
-        """Get the result of an execution"""
+        """Get the result of an execution
+
+        Once the result has data, the raw response is archived with the
+        automation and inputs of its run so it can be reprocessed offline.
+        """
         endpoint = f"public/results/{execution_id}"
-        return self.client._make_request(endpoint, method="GET")
+        result = self.client._make_request(endpoint, method="GET")
+        if isinstance(result, dict) and result.get("data"):
+            self._archive_result(execution_id, result)
+        return result
+
+    def _archive_result(self, execution_id, result):
+        if execution_id in self._archived:
+            return
+        self._archived[execution_id] = None
+        while len(self._archived) > MAX_TRACKED_EXECUTIONS:
+            self._archived.popitem(last=False)
+        automation_id, name, inputs = self._executions.pop(execution_id, (None, None, None))
+        try:
+            self.archive.save(execution_id, result, automation_id=automation_id, inputs=inputs, name=name)
+        except Exception as e:
+            # Archiving must never cost the caller its result
+            app_logger.warning("Could not archive TexAu execution {}: {}", execution_id, str(e))
+
+    def wait_for_result(self, execution_id, max_wait=120, interval=1):
+        """Poll an execution until it returns data
+
+        Args:
+            execution_id: TexAu execution ID
+            max_wait: Maximum number of polls
+            interval: Seconds between polls
+
+        Returns:
+            Final result dict with "data", or None on timeout
+        """
+        for _ in range(max_wait):
+            result = self.get_execution_result(execution_id)
+            if result.get("data"):
+                return result
+            time.sleep(interval)
+        app_logger.error("Timeout waiting for TexAu execution {}", execution_id)
+        return None
+
+    def run_and_wait(self, name, description, automation_id, connected_account_id, inputs, timezone="Asia/Kolkata", max_wait=120):
+        """Run an automation and poll for its result
+
+        Returns:
+            Final result dict with "data", or None if no execution was started or it timed out
+        """
+        run_result = self.run_automation(
+            name=name,
+            description=description,
+            automation_id=automation_id,
+            connected_account_id=connected_account_id,
+            timezone=timezone,
+            inputs=inputs
+        )
+        data = run_result.get("data", {})
+        execution_id = data.get("id") or data.get("workflowId")
+        if not execution_id:
+            app_logger.error(f"No execution ID returned from TexAu run_automation. Full response: {json.dumps(run_result, indent=2)}")
+            return None
+        return self.wait_for_result(execution_id, max_wait=max_wait)
 
     # Example: Search posts by keywords (requires correct automationId and connectedAccountId)
     def search_posts_by_keywords(self, keywords, automation_id, connected_account_id, timezone="Asia/Kolkata"):
@@ -55,7 +140,6 @@ class LinkedInAPI:
 
     def extract_post_data(self, post_url, automation_id, connected_account_id, timezone="Asia/Kolkata"):
         app_logger.info("Extracting data from LinkedIn post: {}", post_url)
-        import time
         # Use the correct input key for LinkedIn Post Scraper
         inputs = {"liPostUrl": post_url}
         run_result = self.run_automation(
@@ -0,0 +1,270 @@
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pandas as pd
+from ..data.linkedin_urls import frame_post_keys, frame_profile_keys
+from ..logger import app_logger
+
+POST_SEARCH_AUTOMATION_ID = "64099c6e0936e46db5d76f4c"  # LinkedIn Post Search Export
+EMPLOYEES_EXPORT_AUTOMATION_ID = "645e38f5f74978ad3262f00d"  # LinkedIn Company Employees Export
+
+# Time windows are not sharded: they are nested (all time covers past month
+# covers past week ...), so the newest posts of a narrower window repeat those
+# of a broader one
+SORT_ORDERS = ["date_posted", "relevance"]
+
+
+class ShardedPostSearch:
+    """Split a large post search into several smaller concurrent TexAu executions
+
+    Shards vary the search by keyword variant and sort order, the only
+    dimensions whose results are not nested in one another. Their results can
+    still overlap, so they are merged and deduplicated by canonical post URN,
+    and the unique count may fall short of the requested total.
+    """
+
+    def __init__(self, linkedin_api, connected_account_id, automation_id=POST_SEARCH_AUTOMATION_ID,
+                 max_workers=4, max_wait=120, timezone="Asia/Kolkata"):
+        self.linkedin_api = linkedin_api
+        self.connected_account_id = connected_account_id
+        self.automation_id = automation_id
+        self.max_workers = max_workers
+        self.max_wait = max_wait
+        self.timezone = timezone
+
+    @staticmethod
+    def plan_shards(base_inputs, total, shard_size=500, keyword_variants=None):
+        """Build the inputs of each shard
+
+        A sort order the user already fixed in base_inputs is not varied, and
+        the time window (startTime) is kept as given. At most one shard runs
+        per keyword and sort order, so a plan may have fewer than
+        total / shard_size shards, each asking for more posts.
+
+        Args:
+            base_inputs: Post search inputs of the monolithic request
+            total: Total number of posts requested
+            shard_size: Target number of posts per shard
+            keyword_variants: Extra keywords searched alongside the main one
+
+        Returns:
+            List of input dicts
+        """
+        keywords = [base_inputs["liPostSearchUrl"]] + [k for k in (keyword_variants or []) if k]
+        sort_orders = [base_inputs["sortBy"]] if base_inputs.get("sortBy") else SORT_ORDERS
+
+        # Every keyword variant gets at least one shard
+        wanted = max(math.ceil(total / shard_size), len(keywords))
+        per_keyword = math.ceil(wanted / len(keywords))
+        combinations = []
+        for keyword in keywords:
+            combinations.extend((keyword, sort_by) for sort_by in sort_orders[:per_keyword])
+        per_shard = max(1, math.ceil(total / len(combinations)))
+
+        shards = []
+        for keyword, sort_by in combinations:
+            inputs = dict(base_inputs)
+            inputs["liPostSearchUrl"] = keyword
+            inputs["maxCountPostSearch"] = per_shard
+            inputs["sortBy"] = sort_by
+            shards.append(inputs)
+        return shards
+
+    def _run_shard(self, index, inputs):
+        started = time.perf_counter()
+        try:
+            result = self.linkedin_api.run_and_wait(
+                name=f"Sharded Post Search {index + 1}",
+                description="Shard of a large LinkedIn post search",
+                automation_id=self.automation_id,
+                connected_account_id=self.connected_account_id,
+                inputs=inputs,
+                timezone=self.timezone,
+                max_wait=self.max_wait
+            )
+            data = result.get("data") if result else None
+            status = "ok" if data else "timeout"
+            error = None
+        except Exception as e:
+            data, status, error = None, "error", str(e)
+            app_logger.error("Post search shard {} failed: {}", index + 1, error)
+        if isinstance(data, dict):
+            data = [data]
+        df = pd.json_normalize(data) if data else pd.DataFrame()
+        return df, {
+            "shard": index + 1,
+            "keyword": inputs.get("liPostSearchUrl"),
+            "sortBy": inputs.get("sortBy"),
+            "startTime": inputs.get("startTime") or "all time",
+            "requested": inputs.get("maxCountPostSearch"),
+            "returned": len(df),
+            "seconds": round(time.perf_counter() - started, 1),
+            "status": status,
+            "error": error,
+        }
+
+    def run(self, shards, total=None):
+        """Run the shards concurrently and merge their results
+
+        Args:
+            shards: List of input dicts from plan_shards
+            total: Number of posts requested, to log any shortfall
+
+        Returns:
+            Tuple of (merged posts DataFrame deduplicated by post URN,
+            per-shard report DataFrame)
+        """
+        frames, reports = [], []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._run_shard, i, inputs) for i, inputs in enumerate(shards)]
+            for future in as_completed(futures):
+                df, report = future.result()
+                frames.append((report["shard"], df))
+                reports.append(report)
+
+        frames = [df for _, df in sorted(frames, key=lambda item: item[0]) if not df.empty]
+        merged = pd.concat(frames, ignore_index=True, sort=False) if frames else pd.DataFrame()
+        if not merged.empty:
+            keys = frame_post_keys(merged)
+            merged = merged[keys.isna() | ~keys.duplicated()].reset_index(drop=True)
+
+        report_df = pd.DataFrame(reports).sort_values("shard").reset_index(drop=True)
+        app_logger.info(
+            "Sharded post search: {} shards, {} rows returned, {} unique posts",
+            len(shards), int(report_df["returned"].sum()) if not report_df.empty else 0, len(merged)
+        )
+        if total is not None and len(merged) < total:
+            app_logger.warning("Sharded post search found {} unique posts of {} requested", len(merged), total)
+        return merged, report_df
+
+
+class ShardedEmployeeExport:
+    """Split a company employee export into concurrent runs over groups of titles
+
+    One export with the whole title list as its keyword is slow and fails as
+    a whole; shards of a few titles each finish sooner, and only the shards
+    that failed need to be run again. Results are merged and deduplicated by
+    profile ID.
+    """
+
+    def __init__(self, linkedin_api, connected_account_id, automation_id=EMPLOYEES_EXPORT_AUTOMATION_ID,
+                 max_workers=4, max_wait=600, timezone="Asia/Kolkata"):
+        self.linkedin_api = linkedin_api
+        self.connected_account_id = connected_account_id
+        self.automation_id = automation_id
+        self.max_workers = max_workers
+        self.max_wait = max_wait
+        self.timezone = timezone
+
+    @staticmethod
+    def plan_shards(titles, shard_size=20):
+        """Partition the titles into shards
+
+        Titles are kept as lists, since a title may itself contain a comma;
+        they are joined into the comma-separated keyword only when a shard is
+        sent.
+
+        Args:
+            titles: Iterable of job titles
+            shard_size: Number of titles per shard
+
+        Returns:
+            List of title lists, one per shard
+        """
+        titles = [t.strip() for t in titles if t and t.strip()]
+        shard_size = max(1, int(shard_size))
+        return [titles[i:i + shard_size] for i in range(0, len(titles), shard_size)]
+
+    def _run_shard(self, index, company_url, titles):
+        started = time.perf_counter()
+        keyword = ",".join(titles)
+        try:
+            result = self.linkedin_api.run_and_wait(
+                name=f"Company Employees Export {index + 1}",
+                description="Shard of a LinkedIn company employee export",
+                automation_id=self.automation_id,
+                connected_account_id=self.connected_account_id,
+                inputs={"liCompanyUrl": company_url, "keyword": keyword},
+                timezone=self.timezone,
+                max_wait=self.max_wait
+            )
+            data = result.get("data") if result else None
+            status = "ok" if result else "timeout"
+            error = None
+        except Exception as e:
+            data, status, error = None, "error", str(e)
+            app_logger.error("Employee export shard {} failed: {}", index + 1, error)
+        if isinstance(data, dict):
+            data = [data]
+        df = pd.json_normalize(data) if data else pd.DataFrame()
+        return df, {
+            "shard": index + 1,
+            "titles": len(titles),
+            "keyword": keyword,
+            "returned": len(df),
+            "seconds": round(time.perf_counter() - started, 1),
+            "status": status,
+            "error": error,
+        }
+
+    @staticmethod
+    def merge(frames):
+        """Concatenate employee frames, keeping the first row per profile ID"""
+        frames = [df for df in frames if df is not None and not df.empty]
+        if not frames:
+            return pd.DataFrame()
+        merged = pd.concat(frames, ignore_index=True, sort=False)
+        keys = frame_profile_keys(merged)
+        return merged[keys.isna() | ~keys.duplicated()].reset_index(drop=True)
+
+    def run(self, company_url, shards, shard_numbers=None):
+        """Run the shards concurrently and merge their results
+
+        Args:
+            company_url: LinkedIn company URL
+            shards: List of title lists from plan_shards
+            shard_numbers: Optional 1-based shard numbers to run (all by default)
+
+        Returns:
+            Tuple of (merged employees DataFrame deduplicated by profile ID,
+            per-shard report DataFrame)
+        """
+        selected = [i for i in range(len(shards)) if shard_numbers is None or i + 1 in set(shard_numbers)]
+        frames, reports = [], []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._run_shard, i, company_url, shards[i]) for i in selected]
+            for future in as_completed(futures):
+                df, report = future.result()
+                frames.append((report["shard"], df))
+                reports.append(report)
+
+        merged = self.merge(df for _, df in sorted(frames, key=lambda item: item[0]))
+        report_df = pd.DataFrame(reports, columns=["shard", "titles", "keyword", "returned", "seconds", "status", "error"])
+        report_df = report_df.sort_values("shard").reset_index(drop=True)
+        app_logger.info(
+            "Sharded employee export for {}: {} shards, {} failed, {} unique employees",
+            company_url, len(selected), int((report_df["status"] != "ok").sum()), len(merged)
+        )
+        return merged, report_df
+
+    def retry_failed(self, company_url, shards, employees_df, report_df):
+        """Re-run only the shards whose last run failed or timed out
+
+        Args:
+            company_url: LinkedIn company URL
+            shards: Title lists of the original plan
+            employees_df: Employees merged so far
+            report_df: Report of the previous run
+
+        Returns:
+            Tuple of (merged employees DataFrame, report DataFrame with the
+            retried shards' rows replaced)
+        """
+        failed = report_df.loc[report_df["status"] != "ok", "shard"].tolist()
+        if not failed:
+            return employees_df, report_df
+        retried_df, retried_report = self.run(company_url, shards, shard_numbers=failed)
+        report_df = pd.concat(
+            [report_df[~report_df["shard"].isin(failed)], retried_report], ignore_index=True
+        ).sort_values("shard").reset_index(drop=True)
+        return self.merge([employees_df, retried_df]), report_df
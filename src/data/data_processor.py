@@ -1,8 +1,44 @@
 import pandas as pd
 import os
+import re
 import json
 from datetime import datetime
 from ..logger import app_logger
+from .linkedin_urls import profile_keys, frame_profile_keys
+from .excel_writer import write_excel
+from .export_formats import EXPORT_FORMATS, export_filename, export_mime, write_table, write_tables_zip
+from .record_flattener import normalize_records, normalize_records_parallel
+
+# Column name words used to pick a parser in DataProcessor.add_numeric_columns; a
+# column matches when these appear as whole words of its name (an optional plural
+# "s" allowed), so "postDate" and "followersCount" match but "candidateName" does not
+NUMERIC_COLUMN_PARSERS = {
+    "headcount_range": "range",
+    "tenure": "tenure",
+    "follower": "count",
+    "connections_count": "count",
+    "date": "date",
+    "timestamp": "date",
+}
+
+_NUMERIC_COLUMN_PATTERNS = {
+    re.compile(rf"(?:^|_){fragment}s?(?:_|$)"): parser for fragment, parser in NUMERIC_COLUMN_PARSERS.items()
+}
+
+
+def _column_words(name):
+    """Return a column name as lowercase words joined by "_" ("author.followerCount" -> "author_follower_count")"""
+    words = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", str(name))
+    return re.sub(r"[^a-z0-9]+", "_", words.lower()).strip("_")
+
+_COUNT_SUFFIXES = {"k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+
+# Record count from which DataProcessor.normalize_records flattens in worker processes.
+# Measured with benchmarks/flatten_benchmark.py --sweep: from 5,000 profile records the
+# caller spends under half the serial time (sending chunks, receiving frames), while
+# at 1,000 the pool round trip makes it slower than flattening in process
+PARALLEL_NORMALIZE_MIN_RECORDS = int(os.getenv("PARALLEL_NORMALIZE_MIN_RECORDS", "5000"))
+PARALLEL_NORMALIZE_MAX_WORKERS = 8
 
 class DataProcessor:
     """Class for processing and exporting LinkedIn data"""
@@ -100,20 +136,237 @@ class DataProcessor:
             filename = f"linkedin_{data_type}_{timestamp}.xlsx"
             filepath = os.path.join(downloads_dir, filename)
             
-            # Export to Excel
-            with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-                if isinstance(data, dict):
-                    # Multiple sheets for different data types
-                    for sheet_name, df in data.items():
-                        if not df.empty:
-                            df.to_excel(writer, sheet_name=sheet_name, index=False)
-                else:
-                    # Single sheet for simple data
-                    data.to_excel(writer, sheet_name=data_type, index=False)
+            # Export to Excel (one sheet per table, empty tables skipped)
+            write_excel(data, filepath, sheet_name=data_type)
             
             app_logger.info("Data exported to {}", filepath)
             return filepath
             
         except Exception as e:
             app_logger.error("Error exporting data to Excel: {}", str(e))
-            raise
\ No newline at end of file
+            raise
+
+    @staticmethod
+    def export_tables(tables, export_format="excel", target=None, compression=None):
+        """Export one or several tables in the chosen format
+
+        Excel puts every table on its own sheet of one workbook. The other
+        formats write a single table directly and several tables as a zip
+        with one file per table.
+
+        Args:
+            tables: DataFrame, or dict of table name to DataFrame (or iterable of chunks)
+            export_format: "excel", "csv", "jsonl" or "parquet"
+            target: File path or binary file object (in memory when omitted)
+            compression: None, "gzip" or "zstd" (ignored for Excel)
+
+        Returns:
+            Tuple of (bytes, or target when given; file extension; MIME type)
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {export_format}")
+        if isinstance(tables, pd.DataFrame):
+            tables = {"data": tables}
+        tables = {name: df for name, df in tables.items() if df is not None and not (isinstance(df, pd.DataFrame) and df.empty)}
+        app_logger.info("Exporting {} tables as {} (compression: {})", len(tables), export_format, compression)
+
+        if export_format == "excel":
+            return write_excel(tables, target), ".xlsx", export_mime("excel")
+        if len(tables) > 1:
+            return write_tables_zip(tables, export_format, target, compression), ".zip", export_mime(export_format, zipped=True)
+        data = next(iter(tables.values()), pd.DataFrame())
+        extension = export_filename("", export_format, compression)
+        return write_table(data, export_format, target, compression), extension, export_mime(export_format)
+
+    @staticmethod
+    def parse_range(series):
+        """Parse range strings such as "51-200", "10,001+" or "500" into numbers
+
+        Args:
+            series: Pandas Series of range strings
+
+        Returns:
+            DataFrame with float "min" and "max" columns; open-ended ranges
+            ("10,001+") have a NaN max
+        """
+        text = series.astype(str).str.replace(",", "", regex=False)
+        parts = text.str.extract(r"(?P<min>\d+(?:\.\d+)?)\s*(?:(?:-|–|to)\s*(?P<max>\d+(?:\.\d+)?))?\s*(?P<plus>\+)?")
+        low = pd.to_numeric(parts["min"], errors="coerce")
+        high = pd.to_numeric(parts["max"], errors="coerce")
+        high = high.where(high.notna() | parts["plus"].notna(), low)
+        return pd.DataFrame({"min": low.astype(float), "max": high.astype(float)}, index=series.index)
+
+    @staticmethod
+    def parse_tenure(series):
+        """Parse tenure strings such as "2 years 3 months" or "1 yr 2 mos" into months
+
+        Args:
+            series: Pandas Series of tenure strings
+
+        Returns:
+            Float Series of total months (NaN when nothing could be parsed)
+        """
+        text = series.astype(str).str.lower()
+        years = pd.to_numeric(text.str.extract(r"(\d+(?:\.\d+)?)\s*(?:years?|yrs?)\b", expand=False), errors="coerce")
+        months = pd.to_numeric(text.str.extract(r"(\d+)\s*(?:months?|mos?)\b", expand=False), errors="coerce")
+        total = years.fillna(0) * 12 + months.fillna(0)
+        return total.where(years.notna() | months.notna()).astype(float)
+
+    @staticmethod
+    def parse_count(series):
+        """Parse count strings such as "1,234 followers", "12K" or "1.2M" into numbers
+
+        Args:
+            series: Pandas Series of counts (strings or numbers)
+
+        Returns:
+            Float Series of counts
+        """
+        if pd.api.types.is_numeric_dtype(series):
+            return series.astype(float)
+        text = series.astype(str).str.replace(",", "", regex=False).str.lower()
+        parts = text.str.extract(r"(?P<value>\d+(?:\.\d+)?)\s*(?P<suffix>[kmb])?\b")
+        value = pd.to_numeric(parts["value"], errors="coerce")
+        multiplier = parts["suffix"].map(_COUNT_SUFFIXES).fillna(1)
+        return (value * multiplier).astype(float)
+
+    @staticmethod
+    def parse_dates(series):
+        """Parse date strings or epoch milliseconds into UTC timestamps
+
+        Timestamps are returned timezone-naive (in UTC) so they can be written
+        to Excel.
+
+        Args:
+            series: Pandas Series of dates
+
+        Returns:
+            datetime64 Series (NaT when unparseable)
+        """
+        if pd.api.types.is_numeric_dtype(series):
+            parsed = pd.to_datetime(series, unit="ms", errors="coerce", utc=True)
+        else:
+            parsed = pd.to_datetime(series, errors="coerce", utc=True, format="mixed")
+        return parsed.dt.tz_localize(None)
+
+    @staticmethod
+    def add_numeric_columns(df, columns=None):
+        """Add typed numeric columns parsed from enrichment text columns
+
+        Adds <col>_min/<col>_max for ranges, <col>_months for tenure,
+        <col>_count for counts and <col>_parsed for dates.
+
+        Args:
+            df: DataFrame to enrich
+            columns: Optional dict of column name to parser ("range", "tenure",
+                "count" or "date"); detected from column names when omitted
+
+        Returns:
+            Copy of df with the parsed columns added
+        """
+        if columns is None:
+            columns = {}
+            for col in df.columns:
+                words = _column_words(col)
+                for pattern, parser in _NUMERIC_COLUMN_PATTERNS.items():
+                    if pattern.search(words):
+                        columns[col] = parser
+                        break
+
+        parsed = {}
+        for col, parser in columns.items():
+            if col not in df.columns:
+                continue
+            if parser == "range":
+                bounds = DataProcessor.parse_range(df[col])
+                parsed[f"{col}_min"] = bounds["min"]
+                parsed[f"{col}_max"] = bounds["max"]
+            elif parser == "tenure":
+                parsed[f"{col}_months"] = DataProcessor.parse_tenure(df[col])
+            elif parser == "count":
+                parsed[f"{col}_count"] = DataProcessor.parse_count(df[col])
+            elif parser == "date":
+                parsed[f"{col}_parsed"] = DataProcessor.parse_dates(df[col])
+            else:
+                raise ValueError(f"Unknown column parser: {parser}")
+
+        if not parsed:
+            return df.copy()
+        app_logger.debug("Parsed numeric columns: {}", list(parsed))
+        return pd.concat([df.drop(columns=[c for c in parsed if c in df.columns]), pd.DataFrame(parsed, index=df.index)], axis=1)
+
+    @staticmethod
+    def normalize_records(records, min_parallel_records=PARALLEL_NORMALIZE_MIN_RECORDS, max_workers=None):
+        """Flatten API records into a DataFrame, in worker processes for large inputs
+
+        Gives the same frame as pd.json_normalize(records). From
+        min_parallel_records records on, when more than one CPU is available,
+        records are flattened in a shared pool of worker processes (see
+        record_flattener.normalize_records_parallel), so a Streamlit session
+        holds the GIL only while sending chunks and receiving frames. The
+        output is identical either way.
+
+        Args:
+            records: Record dict or list of record dicts
+            min_parallel_records: Record count from which worker processes are used
+            max_workers: Worker processes (defaults to the CPU count, at most 8)
+
+        Returns:
+            Flat DataFrame
+        """
+        if isinstance(records, dict):
+            records = [records]
+        workers = max_workers or min(os.cpu_count() or 1, PARALLEL_NORMALIZE_MAX_WORKERS)
+        if len(records) < min_parallel_records or workers < 2:
+            return normalize_records(records)
+        try:
+            df = normalize_records_parallel(records, workers)
+            app_logger.info("Normalized {} records in {} worker processes", len(records), workers)
+            return df
+        except Exception as e:
+            app_logger.warning("Parallel normalization failed, normalizing serially: {}", str(e))
+            return normalize_records(records)
+
+    @staticmethod
+    def join_on_profile_key(input_df, input_url_col, profiles_df, prefix="profile_", profile_key_columns=None):
+        """Join uploaded rows to scraped profiles on their canonical profile key
+
+        Rows are matched by LinkedIn public ID (derived from the profile URLs)
+        with a hash join, so failed or skipped scrapes never shift rows onto
+        the wrong profile.
+
+        Args:
+            input_df: Uploaded DataFrame
+            input_url_col: Column of input_df holding profile URLs
+            profiles_df: Scraped profiles DataFrame
+            prefix: Prefix added to every profile column in the result
+            profile_key_columns: Candidate key columns of profiles_df
+
+        Returns:
+            Tuple of (merged DataFrame with one row per input row,
+            unmatched input rows, unmatched profile rows)
+        """
+        key_col = "_profile_key"
+        left = input_df.reset_index(drop=True)
+        left_keys = profile_keys(left[input_url_col])
+
+        right = profiles_df.reset_index(drop=True)
+        right_keys = frame_profile_keys(right, profile_key_columns)
+        right = right.add_prefix(prefix)
+        right[key_col] = right_keys
+        # Keep the latest scrape when the same profile was returned more than once
+        right = right[right[key_col].notna()].drop_duplicates(subset=key_col, keep="last")
+
+        merged = left.assign(**{key_col: left_keys}).merge(
+            right, on=key_col, how="left", validate="many_to_one", indicator=True
+        )
+        matched = merged["_merge"] == "both"
+        unmatched_inputs = left[~matched.to_numpy()]
+        unmatched_profiles = profiles_df.reset_index(drop=True)[~right_keys.isin(set(left_keys.dropna())).to_numpy()]
+        merged = merged.drop(columns=[key_col, "_merge"])
+
+        app_logger.info(
+            "Joined {} input rows to {} profiles: {} unmatched inputs, {} unmatched profiles",
+            len(left), len(right), len(unmatched_inputs), len(unmatched_profiles)
+        )
+        return merged, unmatched_inputs, unmatched_profiles
@@ -0,0 +1,256 @@
+import os
+import json
+import uuid
+import tempfile
+from datetime import datetime
+import pandas as pd
+import pyarrow.parquet as pq
+from ..logger import app_logger
+
+DEFAULT_STORE_DIR = os.getenv("DATASET_STORE_DIR", "data_store")
+
+
+def _storable_value(value):
+    if isinstance(value, (list, dict, tuple)):
+        return json.dumps(value, default=str)
+    if value is None or (not isinstance(value, str) and pd.api.types.is_scalar(value) and pd.isna(value)):
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+def to_storable(df):
+    """Return a copy of df whose object columns hold only strings or None
+
+    Nested lists/dicts are serialized to JSON so mixed-type API columns can
+    be written to Parquet.
+    """
+    df = df.copy()
+    df.columns = [str(c) for c in df.columns]
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].map(_storable_value)
+    return df
+
+
+class DatasetStore:
+    """Local columnar store of every extraction result
+
+    Results are appended as Parquet files partitioned by result type and
+    extraction date::
+
+        <root>/result_type=<type>/date=<YYYY-MM-DD>/<run_id>.parquet
+
+    Each row carries the _run_id and _extracted_at of the run that produced
+    it, so past runs can be filtered, joined and exported locally.
+    """
+
+    def __init__(self, root=None):
+        self.root = root or DEFAULT_STORE_DIR
+        os.makedirs(self.root, exist_ok=True)
+
+    def _partition_dir(self, result_type, day):
+        return os.path.join(self.root, f"result_type={result_type}", f"date={day}")
+
+    def append(self, result_type, df, run_id=None, source=None):
+        """Append one run's result table
+
+        Args:
+            result_type: Result type (e.g. "people_search", "post_reactors")
+            df: DataFrame to store
+            run_id: Identifier shared by all tables of the run (generated if omitted)
+            source: Optional description of the run input (keyword, URL, ...)
+
+        Returns:
+            Path of the written file, or None when df is empty
+        """
+        if df is None or df.empty:
+            return None
+        run_id = run_id or uuid.uuid4().hex
+        extracted_at = datetime.now()
+
+        table = to_storable(df)
+        table["_run_id"] = run_id
+        table["_extracted_at"] = extracted_at
+        if source is not None:
+            table["_source"] = str(source)
+
+        partition = self._partition_dir(result_type, extracted_at.date().isoformat())
+        os.makedirs(partition, exist_ok=True)
+        path = os.path.join(partition, f"{run_id}.parquet")
+        # Written to a temporary file first so readers never see a partial
+        # run and a crash mid-write leaves no corrupt .parquet behind
+        fd, temp_path = tempfile.mkstemp(dir=partition, suffix=".partial")
+        os.close(fd)
+        try:
+            table.to_parquet(temp_path, index=False)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        app_logger.info("Stored {} {} rows in {}", len(table), result_type, path)
+        return path
+
+    def append_tables(self, result_type, tables, run_id=None, source=None):
+        """Append several tables of one run, stored as <result_type>_<name>
+
+        Args:
+            result_type: Prefix for the result types
+            tables: Dict of table name to DataFrame
+            run_id: Identifier shared by all tables (generated if omitted)
+            source: Optional description of the run input
+
+        Returns:
+            The run_id used
+        """
+        run_id = run_id or uuid.uuid4().hex
+        for name, df in tables.items():
+            self.append(f"{result_type}_{name}", df, run_id=run_id, source=source)
+        return run_id
+
+    def result_types(self):
+        """Return the result types present in the store"""
+        return sorted(
+            entry.split("=", 1)[1] for entry in os.listdir(self.root)
+            if entry.startswith("result_type=") and os.path.isdir(os.path.join(self.root, entry))
+        )
+
+    def list_runs(self, result_type=None, start=None, end=None):
+        """List stored files
+
+        Args:
+            result_type: Restrict to one result type
+            start: Earliest extraction date (date or ISO string, inclusive)
+            end: Latest extraction date (date or ISO string, inclusive)
+
+        Returns:
+            DataFrame with result_type, date, run_id and path columns
+        """
+        start = str(start) if start else None
+        end = str(end) if end else None
+        rows = []
+        for rtype in ([result_type] if result_type else self.result_types()):
+            type_dir = os.path.join(self.root, f"result_type={rtype}")
+            if not os.path.isdir(type_dir):
+                continue
+            for partition in sorted(os.listdir(type_dir)):
+                day = partition.split("=", 1)[-1]
+                if (start and day < start[:10]) or (end and day > end[:10]):
+                    continue
+                for filename in sorted(os.listdir(os.path.join(type_dir, partition))):
+                    if filename.endswith(".parquet"):
+                        rows.append({
+                            "result_type": rtype,
+                            "date": day,
+                            "run_id": filename[:-len(".parquet")],
+                            "path": os.path.join(type_dir, partition, filename),
+                        })
+        return pd.DataFrame(rows, columns=["result_type", "date", "run_id", "path"])
+
+    def query(self, result_type, start=None, end=None, columns=None, filters=None, where=None, run_ids=None):
+        """Load stored rows of one result type across runs
+
+        Args:
+            result_type: Result type to read
+            start: Earliest extraction date (inclusive)
+            end: Latest extraction date (inclusive)
+            columns: Columns to load (others are not read from disk)
+            filters: Dict of column to a value or list of accepted values
+            where: Optional pandas query expression applied after loading
+            run_ids: Restrict to these runs
+
+        Returns:
+            DataFrame of matching rows (empty if nothing matched)
+
+        Raises:
+            ValueError: A filter names a column none of the stored runs have
+        """
+        runs = self.list_runs(result_type, start=start, end=end)
+        if run_ids is not None:
+            runs = runs[runs["run_id"].isin(list(run_ids))]
+        if runs.empty:
+            return pd.DataFrame(columns=columns or [])
+
+        filters = filters or {}
+        # Filter columns are read as well, even when not among the requested columns
+        wanted = list(dict.fromkeys(list(columns) + list(filters))) if columns else None
+        frames = []
+        stored_columns = set()
+        for path in runs["path"]:
+            available = set(pq.read_schema(path).names)
+            stored_columns |= available
+            if wanted:
+                frame = pd.read_parquet(path, columns=[c for c in wanted if c in available])
+            else:
+                frame = pd.read_parquet(path)
+            frames.append(frame)
+        unknown = [col for col in filters if col not in stored_columns]
+        if unknown:
+            raise ValueError(f"Unknown filter column(s) for {result_type}: {', '.join(map(str, unknown))}")
+        df = pd.concat(frames, ignore_index=True, sort=False)
+
+        for col, accepted in filters.items():
+            if isinstance(accepted, (list, tuple, set)):
+                df = df[df[col].isin(list(accepted))]
+            else:
+                df = df[df[col] == accepted]
+        if where:
+            df = df.query(where)
+        if columns:
+            df = df[[c for c in columns if c in df.columns]]
+        return df.reset_index(drop=True)
+
+    def latest(self, result_type, key, **query_kwargs):
+        """Return the most recently extracted row per key across runs"""
+        df = self.query(result_type, **query_kwargs)
+        if df.empty or key not in df.columns:
+            return df
+        return df.sort_values("_extracted_at").drop_duplicates(subset=key, keep="last").reset_index(drop=True)
+
+    def join(self, left_type, right_type, on, how="inner", left_query=None, right_query=None):
+        """Join two stored result types
+
+        Args:
+            left_type: Left result type
+            right_type: Right result type
+            on: Join column(s), or a (left_column, right_column) tuple
+            how: Join type passed to DataFrame.merge
+            left_query: Keyword arguments for query() on the left side
+            right_query: Keyword arguments for query() on the right side
+
+        Returns:
+            Joined DataFrame
+        """
+        left = self.query(left_type, **(left_query or {}))
+        right = self.query(right_type, **(right_query or {}))
+        if isinstance(on, tuple):
+            return left.merge(right, left_on=on[0], right_on=on[1], how=how, suffixes=("", f"_{right_type}"))
+        return left.merge(right, on=on, how=how, suffixes=("", f"_{right_type}"))
+
+    @staticmethod
+    def export(df, path):
+        """Export a query result to .parquet, .csv, .jsonl or .xlsx based on the file extension
+
+        .csv and .jsonl paths may end in .gz or .zst for compressed output.
+        Files are written with the same writers as the app's downloads.
+
+        Returns:
+            The path written
+        """
+        # Imported here because export_formats imports to_storable from this module
+        from .export_formats import EXPORT_FORMATS, COMPRESSIONS, write_table
+        from .excel_writer import write_excel
+
+        stem, extension = os.path.splitext(path.lower())
+        compression = next((c for c, suffix in COMPRESSIONS.items() if suffix and suffix == extension), None)
+        if compression:
+            stem, extension = os.path.splitext(stem)
+        export_format = next((fmt for fmt, (ext, _) in EXPORT_FORMATS.items() if ext == extension), None)
+        if export_format is None or (compression and export_format not in ("csv", "jsonl")):
+            raise ValueError(f"Unsupported export format: {os.path.basename(path)}")
+        if export_format == "excel":
+            write_excel(df, path)
+        else:
+            write_table(df, export_format, path, compression)
+        app_logger.info("Exported {} rows to {}", len(df), path)
+        return path
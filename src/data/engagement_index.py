@@ -0,0 +1,253 @@
+import numpy as np
+import pandas as pd
+from .linkedin_urls import canonical_key, frame_profile_keys, profile_key_columns
+from ..logger import app_logger
+
+INTERACTION_TYPES = ["reaction", "comment", "like"]
+
+# Post extraction tables and the interaction each row represents
+INTERACTION_TABLES = {
+    "reactors": "reaction",
+    "commenters": "comment",
+    "likers": "like",
+    "comments_export": "comment",
+}
+
+# Bit offsets of the person and post codes in an edge's int64 ID (interaction type in the low 8 bits)
+_PERSON_SHIFT = 32
+_POST_SHIFT = 8
+
+_NAME_COLUMNS = ["fullName", "name", "authorName", "commenterName", "reactorName"]
+_HEADLINE_COLUMNS = ["headline", "authorHeadline", "commenterHeadline", "reactorHeadline", "occupation"]
+
+
+def _first_column(df, candidates):
+    for col in candidates:
+        if col in df.columns:
+            return df[col]
+    for col in df.columns:
+        if any(str(col).endswith(f".{candidate}") for candidate in candidates):
+            return df[col]
+    return None
+
+
+class EngagementIndex:
+    """Integer-encoded (person, post, interaction) edges across extracted posts
+
+    People and posts are mapped to dense integer codes and edges are kept in
+    NumPy arrays, so cross-post questions ("top engagers across these
+    posts", "people who engaged with at least 3 posts") are answered with
+    bincount passes instead of joins over the per-post tables.
+    """
+
+    def __init__(self):
+        self.person_codes = {}
+        self.post_codes = {}
+        self.person_keys = []
+        self.post_keys = []
+        self.person_info = []
+        # One int64 ID per edge (see _edge_id_array), to skip edges already added
+        self._edge_ids = set()
+        self._size = 0
+        self._persons = np.empty(1024, dtype=np.int32)
+        self._posts = np.empty(1024, dtype=np.int32)
+        self._types = np.empty(1024, dtype=np.int8)
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def edges(self):
+        """Tuple of (person codes, post codes, interaction codes) arrays"""
+        return self._persons[:self._size], self._posts[:self._size], self._types[:self._size]
+
+    def _post_code(self, post_key):
+        code = self.post_codes.get(post_key)
+        if code is None:
+            code = self.post_codes[post_key] = len(self.post_keys)
+            self.post_keys.append(post_key)
+        return code
+
+    def _person_code(self, person_key, name=None, headline=None):
+        code = self.person_codes.get(person_key)
+        if code is None:
+            code = self.person_codes[person_key] = len(self.person_keys)
+            self.person_keys.append(person_key)
+            self.person_info.append((name, headline))
+        elif name and not self.person_info[code][0]:
+            self.person_info[code] = (name, headline)
+        return code
+
+    @staticmethod
+    def _edge_id_array(persons, post_code, type_code):
+        """Encode edges as int64 IDs: person << 32 | post << 8 | interaction type"""
+        return (persons.astype(np.int64) << _PERSON_SHIFT) | (post_code << _POST_SHIFT) | type_code
+
+    def _grow(self, extra):
+        needed = self._size + extra
+        if needed <= len(self._persons):
+            return
+        capacity = max(needed, 2 * len(self._persons))
+        for attr in ("_persons", "_posts", "_types"):
+            array = getattr(self, attr)
+            grown = np.empty(capacity, dtype=array.dtype)
+            grown[:self._size] = array[:self._size]
+            setattr(self, attr, grown)
+
+    def add_interactions(self, post_url, interaction, df):
+        """Add one post's engagement table
+
+        Args:
+            post_url: URL or URN of the post
+            interaction: One of INTERACTION_TYPES
+            df: DataFrame with one row per reactor/commenter/liker
+
+        Returns:
+            Number of new edges added
+        """
+        post_key = canonical_key(post_url)
+        if post_key is None or df is None or df.empty:
+            return 0
+        key_columns = profile_key_columns(df)
+        if not key_columns:
+            app_logger.warning("No profile column found in {} table of {}", interaction, post_url)
+            return 0
+
+        keys = frame_profile_keys(df, key_columns)
+        names = _first_column(df, _NAME_COLUMNS)
+        headlines = _first_column(df, _HEADLINE_COLUMNS)
+        post_code = self._post_code(post_key)
+        type_code = INTERACTION_TYPES.index(interaction)
+
+        valid = keys.notna().to_numpy()
+        codes, uniques = pd.factorize(keys[valid])
+        first_rows = np.flatnonzero(valid)[pd.Series(codes).drop_duplicates().index.to_numpy()]
+        first_names = names.to_numpy()[first_rows] if names is not None else [None] * len(uniques)
+        first_headlines = headlines.to_numpy()[first_rows] if headlines is not None else [None] * len(uniques)
+        unique_codes = np.array([
+            self._person_code(
+                key,
+                name if isinstance(name, str) else None,
+                headline if isinstance(headline, str) else None,
+            )
+            for key, name, headline in zip(uniques, first_names, first_headlines)
+        ], dtype=np.int32)
+        persons = np.unique(unique_codes[codes]) if len(codes) else np.empty(0, dtype=np.int32)
+        new_ids = [
+            edge_id for edge_id in self._edge_id_array(persons, post_code, type_code).tolist()
+            if edge_id not in self._edge_ids
+        ]
+        self._edge_ids.update(new_ids)
+        new_persons = np.array(new_ids, dtype=np.int64) >> _PERSON_SHIFT
+
+        self._grow(len(new_persons))
+        end = self._size + len(new_persons)
+        self._persons[self._size:end] = new_persons
+        self._posts[self._size:end] = post_code
+        self._types[self._size:end] = type_code
+        self._size = end
+        return len(new_persons)
+
+    def add_post(self, post_url, tables):
+        """Add the engagement tables of one extracted post
+
+        Args:
+            post_url: URL or URN of the post
+            tables: Dict of table name to DataFrame, as built by the post extraction page
+
+        Returns:
+            Number of new edges added
+        """
+        return sum(
+            self.add_interactions(post_url, interaction, tables.get(name))
+            for name, interaction in INTERACTION_TABLES.items()
+        )
+
+    @classmethod
+    def from_dataset_store(cls, dataset_store, result_prefix="post"):
+        """Build the index from every post extraction stored in the dataset store
+
+        Args:
+            dataset_store: DatasetStore holding "<result_prefix>_<table>" results
+            result_prefix: Result type prefix the post tables were stored under
+
+        Returns:
+            EngagementIndex
+        """
+        index = cls()
+        stored_types = set(dataset_store.result_types())
+        for name, interaction in INTERACTION_TABLES.items():
+            result_type = f"{result_prefix}_{name}"
+            if result_type not in stored_types:
+                continue
+            df = dataset_store.query(result_type)
+            if df.empty or "_source" not in df.columns:
+                continue
+            for post_url, post_df in df.groupby("_source", sort=False):
+                index.add_interactions(post_url, interaction, post_df.reset_index(drop=True))
+        app_logger.info(
+            "Built engagement index: {} people, {} posts, {} edges",
+            len(index.person_keys), len(index.post_keys), len(index)
+        )
+        return index
+
+    def _select(self, post_keys=None, interactions=None):
+        persons, posts, types = self.edges
+        mask = np.ones(len(persons), dtype=bool)
+        if post_keys is not None:
+            codes = [self.post_codes[k] for k in (canonical_key(u) for u in post_keys) if k in self.post_codes]
+            mask &= np.isin(posts, codes)
+        if interactions is not None:
+            mask &= np.isin(types, [INTERACTION_TYPES.index(i) for i in interactions])
+        return persons[mask], posts[mask], types[mask]
+
+    def engagement_summary(self, post_keys=None, interactions=None):
+        """Count each person's engagement across the selected posts
+
+        Args:
+            post_keys: Post URLs/URNs to restrict to (all posts by default)
+            interactions: Interaction types to count (all by default)
+
+        Returns:
+            DataFrame with person_key, name, headline, posts_engaged,
+            interactions and one count column per interaction type, sorted
+            by posts_engaged and interactions descending
+        """
+        persons, posts, types = self._select(post_keys, interactions)
+        n_people = len(self.person_keys)
+        columns = ["person_key", "name", "headline", "posts_engaged", "interactions"] + INTERACTION_TYPES
+        if not len(persons):
+            return pd.DataFrame(columns=columns)
+
+        # Several interaction types on one post count as one post engaged
+        person_posts = np.unique(persons.astype(np.int64) * max(len(self.post_keys), 1) + posts)
+        posts_engaged = np.bincount(person_posts // max(len(self.post_keys), 1), minlength=n_people)
+        interaction_counts = np.bincount(persons, minlength=n_people)
+        per_type = {
+            name: np.bincount(persons[types == code], minlength=n_people)
+            for code, name in enumerate(INTERACTION_TYPES)
+        }
+
+        engaged = np.flatnonzero(interaction_counts)
+        order = np.lexsort((-interaction_counts[engaged], -posts_engaged[engaged]))
+        engaged = engaged[order]
+        info = [self.person_info[i] for i in engaged]
+        summary = pd.DataFrame({
+            "person_key": [self.person_keys[i] for i in engaged],
+            "name": [name for name, _ in info],
+            "headline": [headline for _, headline in info],
+            "posts_engaged": posts_engaged[engaged],
+            "interactions": interaction_counts[engaged],
+        })
+        for name, counts in per_type.items():
+            summary[name] = counts[engaged]
+        return summary
+
+    def top_engagers(self, n=20, post_keys=None, interactions=None):
+        """Return the n people who engaged with the most of the selected posts"""
+        return self.engagement_summary(post_keys, interactions).head(n).reset_index(drop=True)
+
+    def engaged_with_at_least(self, min_posts, post_keys=None, interactions=None):
+        """Return the people who engaged with at least min_posts of the selected posts"""
+        summary = self.engagement_summary(post_keys, interactions)
+        return summary[summary["posts_engaged"] >= min_posts].reset_index(drop=True)
@@ -0,0 +1,107 @@
+import json
+import hashlib
+import pandas as pd
+from .record_flattener import payload_records
+from ..logger import app_logger
+
+# Fields compared between scrapes of the same entity; None compares every field
+TRACKED_FIELDS = {
+    "profile": [
+        "firstName", "lastName", "headline", "jobTitle", "companyName", "liCompanyPublicUrl",
+        "locationArea", "locationCountry", "profileLocationCity", "profileLocationCountry",
+        "jobLocationArea", "jobTenure", "headcountRange", "industry", "isPremium",
+    ],
+    "company": None,
+}
+
+CHANGE_COLUMNS = ["entity_type", "entity_id", "field", "old_value", "new_value"]
+
+_MISSING = "\x00"
+
+
+def _as_text(df):
+    """Render values as comparable strings (integral floats as ints, missing as a sentinel)"""
+    df = df.copy()
+    for col in df.columns:
+        values = df[col]
+        if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+            df[col] = values.astype("Int64")
+    return df.astype(object).where(df.notna(), _MISSING).astype(str)
+
+
+def entity_record(payload):
+    """Return the record dict of one entity payload (dict, single-item list or JSON string), or None"""
+    records = payload_records(payload)
+    return records[0] if records else None
+
+
+def record_hash(record, fields=None):
+    """Return a stable hash of a record, optionally restricted to some top-level fields"""
+    if fields is not None and isinstance(record, dict):
+        record = {field: record.get(field) for field in fields}
+    payload = json.dumps(record, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def diff_frames(old_df, new_df, fields=None, entity_type=None):
+    """Compute field-level changes between two snapshots indexed by entity id
+
+    Rows whose field hashes are equal are dropped before any column is
+    compared, and the remaining rows are compared column-wise in bulk.
+
+    Args:
+        old_df: Previous snapshot, indexed by entity id
+        new_df: New snapshot, indexed by entity id
+        fields: Columns to compare (defaults to the union of both frames)
+        entity_type: Value for the entity_type column of the result
+
+    Returns:
+        DataFrame with entity_type, entity_id, field, old_value and new_value columns
+    """
+    common = old_df.index.intersection(new_df.index)
+    if fields is None:
+        fields = list(dict.fromkeys([*old_df.columns, *new_df.columns]))
+    if common.empty or not fields:
+        return pd.DataFrame(columns=CHANGE_COLUMNS)
+
+    old = _as_text(old_df.reindex(index=common, columns=fields))
+    new = _as_text(new_df.reindex(index=common, columns=fields))
+
+    changed_rows = pd.util.hash_pandas_object(old, index=False).to_numpy() != pd.util.hash_pandas_object(new, index=False).to_numpy()
+    old, new = old[changed_rows], new[changed_rows]
+    if old.empty:
+        return pd.DataFrame(columns=CHANGE_COLUMNS)
+
+    mask = old.ne(new).stack()
+    changes = pd.DataFrame({"old_value": old.stack()[mask], "new_value": new.stack()[mask]}).reset_index()
+    changes.columns = ["entity_id", "field", "old_value", "new_value"]
+    changes = changes.replace(_MISSING, None)
+    changes.insert(0, "entity_type", entity_type)
+    app_logger.info("Detected {} field changes across {} {} entities", len(changes), int(changed_rows.sum()), entity_type)
+    return changes[CHANGE_COLUMNS]
+
+
+def diff_records(entity_type, previous, current, fields=None):
+    """Compute field-level changes between two sets of raw entity records
+
+    Args:
+        entity_type: Entity type (selects TRACKED_FIELDS when fields is None)
+        previous: Dict of entity_id to previous record (or raw payload, see entity_record)
+        current: Dict of entity_id to current record (or raw payload)
+        fields: Fields to compare
+
+    Returns:
+        Changes DataFrame (see diff_frames)
+    """
+    fields = fields if fields is not None else TRACKED_FIELDS.get(entity_type)
+    # Payloads may arrive as JSON strings or wrapped in a list, as the API returns them
+    previous = {i: record for i, record in ((i, entity_record(p)) for i, p in previous.items()) if record is not None}
+    current = {i: record for i, record in ((i, entity_record(p)) for i, p in current.items()) if record is not None}
+    ids = [i for i in current if i in previous and record_hash(previous[i], fields) != record_hash(current[i], fields)]
+    if not ids:
+        return pd.DataFrame(columns=CHANGE_COLUMNS)
+    old_df = pd.json_normalize([previous[i] for i in ids]).set_axis(ids)
+    new_df = pd.json_normalize([current[i] for i in ids]).set_axis(ids)
+    if fields is not None:
+        fields = [f for f in fields if f in old_df.columns or f in new_df.columns]
+    return diff_frames(old_df, new_df, fields=fields, entity_type=entity_type)
@@ -0,0 +1,201 @@
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+import pandas as pd
+from .dataset_store import DEFAULT_STORE_DIR
+from .entity_diff import record_hash, diff_records, entity_record
+from ..logger import app_logger
+
+DEFAULT_FRESHNESS_DAYS = float(os.getenv("ENTITY_FRESHNESS_DAYS", "7"))
+
+
+class EntityStore:
+    """SQLite store of the latest scraped record per LinkedIn entity
+
+    Profiles are keyed by public ID and companies by slug/numeric ID (see
+    linkedin_urls.profile_key and company_key). Each entity keeps its latest
+    raw record and the time it was scraped, so runs only need to submit
+    entities that are older than a freshness window. Every distinct version
+    of a record is also kept as a snapshot for change detection.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(DEFAULT_STORE_DIR, "entities.sqlite")
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS entities (
+                    entity_type TEXT NOT NULL,
+                    entity_id TEXT NOT NULL,
+                    record TEXT NOT NULL,
+                    scraped_at TEXT NOT NULL,
+                    PRIMARY KEY (entity_type, entity_id)
+                )"""
+            )
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(entities)")]
+            if "record_hash" not in columns:
+                conn.execute("ALTER TABLE entities ADD COLUMN record_hash TEXT")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS entity_snapshots (
+                    entity_type TEXT NOT NULL,
+                    entity_id TEXT NOT NULL,
+                    scraped_at TEXT NOT NULL,
+                    record_hash TEXT NOT NULL,
+                    record TEXT NOT NULL
+                )"""
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_snapshots_entity ON entity_snapshots (entity_type, entity_id, scraped_at)"
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def upsert(self, entity_type, records, scraped_at=None):
+        """Insert or replace the latest record of each entity
+
+        Args:
+            entity_type: "profile", "company", ...
+            records: Iterable of (entity_id, record) pairs; records may be raw
+                payloads (JSON strings or single-item lists), which are decoded
+                before hashing, and payloads holding no record are skipped
+            scraped_at: Scrape time (defaults to now)
+
+        Returns:
+            Number of entities written
+        """
+        scraped_at = (scraped_at or datetime.now()).isoformat()
+        decoded = ((entity_id, entity_record(payload)) for entity_id, payload in records if entity_id)
+        rows = [
+            (entity_type, str(entity_id), json.dumps(record, default=str), scraped_at, record_hash(record))
+            for entity_id, record in decoded if record is not None
+        ]
+        if not rows:
+            return 0
+        with self._lock, self._connect() as conn:
+            known_hashes = self._hashes(conn, entity_type, [row[1] for row in rows])
+            conn.executemany(
+                """INSERT INTO entities (entity_type, entity_id, record, scraped_at, record_hash) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(entity_type, entity_id) DO UPDATE SET
+                    record = excluded.record, scraped_at = excluded.scraped_at, record_hash = excluded.record_hash""",
+                rows,
+            )
+            # Only new versions become snapshots; unchanged re-scrapes just refresh scraped_at
+            conn.executemany(
+                """INSERT INTO entity_snapshots (entity_type, entity_id, scraped_at, record_hash, record)
+                VALUES (?, ?, ?, ?, ?)""",
+                [
+                    (etype, entity_id, at, digest, record)
+                    for etype, entity_id, record, at, digest in rows
+                    if known_hashes.get(entity_id) != digest
+                ],
+            )
+        app_logger.info("Upserted {} {} entities", len(rows), entity_type)
+        return len(rows)
+
+    def upsert_with_changes(self, entity_type, records, scraped_at=None, fields=None):
+        """Upsert records and return the field-level changes against the stored versions
+
+        Args:
+            entity_type: Entity type
+            records: Iterable of (entity_id, record) pairs; records may be raw
+                payloads (JSON strings or single-item lists), which are decoded
+            scraped_at: Scrape time (defaults to now)
+            fields: Fields to compare (defaults to entity_diff.TRACKED_FIELDS)
+
+        Returns:
+            Changes DataFrame with entity_type, entity_id, field, old_value and new_value
+        """
+        current = {}
+        for entity_id, payload in records:
+            record = entity_record(payload)
+            if entity_id and record is not None:
+                current[str(entity_id)] = record
+        previous = {entity_id: record for entity_id, (record, _) in self.get(entity_type, current).items()}
+        changes = diff_records(entity_type, previous, current, fields=fields)
+        self.upsert(entity_type, current.items(), scraped_at=scraped_at)
+        return changes
+
+    @staticmethod
+    def _hashes(conn, entity_type, entity_ids):
+        hashes = {}
+        for start in range(0, len(entity_ids), 500):
+            chunk = entity_ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            hashes.update(conn.execute(
+                f"SELECT entity_id, record_hash FROM entities WHERE entity_type = ? AND entity_id IN ({placeholders})",
+                [entity_type, *chunk],
+            ).fetchall())
+        return hashes
+
+    def snapshots(self, entity_type, entity_id):
+        """Return every stored version of an entity, oldest first
+
+        Returns:
+            List of (scraped_at datetime, record dict) tuples
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                """SELECT scraped_at, record FROM entity_snapshots
+                WHERE entity_type = ? AND entity_id = ? ORDER BY scraped_at""",
+                [entity_type, str(entity_id)],
+            ).fetchall()
+        return [(datetime.fromisoformat(at), json.loads(record)) for at, record in rows]
+
+    def _select(self, entity_type, entity_ids):
+        entity_ids = [str(i) for i in dict.fromkeys(entity_ids) if i]
+        found = {}
+        with self._connect() as conn:
+            # Stay below SQLite's bound-parameter limit
+            for start in range(0, len(entity_ids), 500):
+                chunk = entity_ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for entity_id, record, scraped_at in conn.execute(
+                    f"SELECT entity_id, record, scraped_at FROM entities WHERE entity_type = ? AND entity_id IN ({placeholders})",
+                    [entity_type, *chunk],
+                ):
+                    found[entity_id] = (record, datetime.fromisoformat(scraped_at))
+        return found
+
+    def get(self, entity_type, entity_ids):
+        """Return the stored records of the given entities
+
+        Returns:
+            Dict of entity_id to (record dict, scraped_at datetime); missing ids are omitted
+        """
+        return {
+            entity_id: (json.loads(record), scraped_at)
+            for entity_id, (record, scraped_at) in self._select(entity_type, entity_ids).items()
+        }
+
+    def split_by_freshness(self, entity_type, entity_ids, max_age_days=DEFAULT_FRESHNESS_DAYS):
+        """Split entities into those with a fresh stored record and those to scrape
+
+        Args:
+            entity_type: Entity type
+            entity_ids: Iterable of entity ids
+            max_age_days: Freshness window in days (0 forces a re-scrape of everything)
+
+        Returns:
+            Tuple of (dict of fresh entity_id to record, list of stale or unknown ids)
+        """
+        entity_ids = [str(i) for i in dict.fromkeys(entity_ids) if i]
+        cutoff = datetime.now() - timedelta(days=max_age_days)
+        stored = self.get(entity_type, entity_ids) if max_age_days > 0 else {}
+        fresh = {i: record for i, (record, scraped_at) in stored.items() if scraped_at >= cutoff}
+        stale = [i for i in entity_ids if i not in fresh]
+        app_logger.info(
+            "{} {} entities fresh within {} days, {} to scrape", len(fresh), entity_type, max_age_days, len(stale)
+        )
+        return fresh, stale
+
+    def to_frame(self, entity_type):
+        """Return all stored entities of a type as a DataFrame of entity_id, scraped_at and record"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT entity_id, scraped_at, record FROM entities WHERE entity_type = ?", [entity_type]
+            ).fetchall()
+        return pd.DataFrame(rows, columns=["entity_id", "scraped_at", "record"])
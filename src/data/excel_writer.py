@@ -0,0 +1,200 @@
+import io
+import re
+import json
+import math
+import pickle
+import tempfile
+from datetime import date, datetime
+import numpy as np
+import pandas as pd
+import xlsxwriter
+from ..logger import app_logger
+
+# Excel's hard limit, header row included
+EXCEL_MAX_ROWS = 1_048_576
+EXCEL_MAX_SHEET_NAME = 31
+EXCEL_MAX_CELL_CHARS = 32_767
+
+_INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+
+def _sheet_name(name, used):
+    """Return a valid, unused worksheet name derived from name"""
+    base = _INVALID_SHEET_CHARS.sub("_", str(name)).strip("'") or "Sheet"
+    candidate = base[:EXCEL_MAX_SHEET_NAME]
+    counter = 2
+    while candidate.lower() in used:
+        suffix = f"_{counter}"
+        candidate = base[:EXCEL_MAX_SHEET_NAME - len(suffix)] + suffix
+        counter += 1
+    used.add(candidate.lower())
+    return candidate
+
+
+class _FrameSpool:
+    """DataFrame chunks pickled to a temporary file, with the union of their columns
+
+    A worksheet header cannot be changed once rows follow it in
+    constant-memory mode, so chunks are spooled first to learn every column
+    while holding only one chunk in memory.
+    """
+
+    def __init__(self, chunks):
+        self.file = tempfile.TemporaryFile()
+        self.columns = {}
+        self.count = 0
+        for chunk in chunks:
+            if chunk is None or chunk.empty:
+                continue
+            # Columns in order of first appearance
+            self.columns.update(dict.fromkeys(chunk.columns))
+            pickle.dump(chunk, self.file, protocol=pickle.HIGHEST_PROTOCOL)
+            self.count += 1
+
+    def chunks(self):
+        """Yield the spooled chunks in order, one at a time"""
+        self.file.seek(0)
+        for _ in range(self.count):
+            yield pickle.load(self.file)
+
+    def close(self):
+        self.file.close()
+
+
+class StreamingExcelWriter:
+    """Write DataFrames to .xlsx row by row in xlsxwriter's constant-memory mode
+
+    Each row is flushed to a temporary file as soon as the next row starts,
+    so memory stays flat regardless of sheet size (openpyxl keeps every
+    cell object alive until the workbook is saved). Tables can be passed as
+    one DataFrame or as an iterable of chunks as they arrive, and tables
+    longer than Excel's row limit continue on <name>_2, <name>_3, ...
+    """
+
+    def __init__(self, target, max_rows=EXCEL_MAX_ROWS):
+        """Open the workbook
+
+        Args:
+            target: File path or writable binary file object (e.g. io.BytesIO)
+            max_rows: Rows per worksheet including the header (Excel's limit by default)
+        """
+        self.workbook = xlsxwriter.Workbook(target, {
+            "constant_memory": True,
+            "strings_to_numbers": False,
+            "strings_to_formulas": False,
+            "strings_to_urls": False,
+            "nan_inf_to_errors": True,
+        })
+        self.max_rows = max_rows
+        self.datetime_format = self.workbook.add_format({"num_format": "yyyy-mm-dd hh:mm:ss"})
+        self.date_format = self.workbook.add_format({"num_format": "yyyy-mm-dd"})
+        self.header_format = self.workbook.add_format({"bold": True})
+        self.sheet_names = set()
+        self.rows_written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _new_sheet(self, name, columns):
+        sheet = self.workbook.add_worksheet(_sheet_name(name, self.sheet_names))
+        for col, header in enumerate(columns):
+            sheet.write_string(0, col, str(header), self.header_format)
+        return sheet
+
+    def _write_cell(self, sheet, row, col, value):
+        if value is None:
+            return
+        if isinstance(value, str):
+            if value:
+                sheet.write_string(row, col, value[:EXCEL_MAX_CELL_CHARS])
+        elif isinstance(value, (bool, np.bool_)):
+            sheet.write_boolean(row, col, bool(value))
+        elif isinstance(value, (int, float, np.integer, np.floating)):
+            if not math.isnan(value):
+                sheet.write_number(row, col, value)
+        elif isinstance(value, datetime):
+            if not pd.isna(value):
+                sheet.write_datetime(row, col, value.replace(tzinfo=None), self.datetime_format)
+        elif isinstance(value, date):
+            sheet.write_datetime(row, col, datetime(value.year, value.month, value.day), self.date_format)
+        elif isinstance(value, (list, dict, tuple)):
+            sheet.write_string(row, col, json.dumps(value, default=str)[:EXCEL_MAX_CELL_CHARS])
+        elif pd.api.types.is_scalar(value) and pd.isna(value):
+            return
+        else:
+            sheet.write_string(row, col, str(value)[:EXCEL_MAX_CELL_CHARS])
+
+    def write_table(self, name, data, chunk_rows=10_000):
+        """Write one table, splitting it across sheets past the row limit
+
+        Args:
+            name: Worksheet name (made valid and unique)
+            data: DataFrame, or iterable of DataFrame chunks; columns first
+                appearing in a later chunk are added, left empty for earlier rows
+            chunk_rows: Rows converted to Python values at a time
+
+        Returns:
+            Number of data rows written
+        """
+        spool = None
+        if isinstance(data, pd.DataFrame):
+            columns, chunks = list(data.columns), [data]
+        else:
+            spool = _FrameSpool(data)
+            columns, chunks = list(spool.columns), spool.chunks()
+        sheet, row, part, written = None, 0, 1, 0
+        try:
+            for chunk in chunks:
+                if chunk is None or chunk.empty:
+                    continue
+                if sheet is None:
+                    sheet, row = self._new_sheet(name, columns), 1
+                chunk = chunk.reindex(columns=columns)
+                for start in range(0, len(chunk), chunk_rows):
+                    for values in chunk.iloc[start:start + chunk_rows].itertuples(index=False, name=None):
+                        if row >= self.max_rows:
+                            part += 1
+                            sheet, row = self._new_sheet(f"{name}_{part}", columns), 1
+                        for col, value in enumerate(values):
+                            self._write_cell(sheet, row, col, value)
+                        row += 1
+                        written += 1
+        finally:
+            if spool is not None:
+                spool.close()
+        self.rows_written += written
+        if part > 1:
+            app_logger.info("Split {} rows of {} across {} sheets", written, name, part)
+        return written
+
+    def close(self):
+        """Finish the workbook"""
+        self.workbook.close()
+
+
+def write_excel(tables, target=None, sheet_name="data"):
+    """Write one or several tables to an .xlsx workbook with the streaming writer
+
+    Args:
+        tables: DataFrame, or dict of sheet name to DataFrame or iterable of
+            chunks (empty tables are skipped)
+        target: File path or binary file object; when omitted the workbook is built in memory
+        sheet_name: Sheet name used when tables is a single DataFrame
+
+    Returns:
+        Workbook bytes when target is omitted, otherwise target
+    """
+    if isinstance(tables, pd.DataFrame):
+        tables = {sheet_name: tables}
+    buffer = io.BytesIO() if target is None else None
+    with StreamingExcelWriter(buffer if buffer is not None else target) as writer:
+        for name, df in tables.items():
+            if df is not None and not (isinstance(df, pd.DataFrame) and df.empty):
+                writer.write_table(name, df)
+        if not writer.sheet_names:
+            # An .xlsx needs at least one sheet
+            writer.workbook.add_worksheet(_sheet_name(sheet_name, writer.sheet_names))
+    return buffer.getvalue() if buffer is not None else target
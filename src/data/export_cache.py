@@ -0,0 +1,112 @@
+import hashlib
+import threading
+from collections import OrderedDict
+import pandas as pd
+from .dataset_store import to_storable
+from ..logger import app_logger
+
+DEFAULT_EXPORT_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def frame_fingerprint(df):
+    """Return a content hash of a DataFrame (column names, dtypes and values)
+
+    Two frames with the same contents get the same fingerprint, so a rerun
+    that rebuilds an identical result maps to the same cached export.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\x1f".join(f"{col}:{dtype}" for col, dtype in df.dtypes.items()).encode("utf-8"))
+    try:
+        hashes = pd.util.hash_pandas_object(df, index=False)
+    except TypeError:
+        # Nested list/dict cells are unhashable; hash their JSON form instead
+        hashes = pd.util.hash_pandas_object(to_storable(df), index=False)
+    digest.update(hashes.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def export_key(tables, *options):
+    """Return the cache key of an export of tables with the given options (format, compression, ...)
+
+    tables maps names to DataFrames or result_store.ResultHandle objects.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name, df in tables.items():
+        if df is not None and not df.empty:
+            # Result handles carry the fingerprint of the table they refer to
+            fingerprint = df.fingerprint if hasattr(df, "fingerprint") else frame_fingerprint(df)
+            digest.update(f"{name}={fingerprint};".encode("utf-8"))
+    digest.update(repr(options).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ExportCache:
+    """Size-bounded LRU cache of generated export files
+
+    Entries are keyed by content hash, so an export is serialized once per
+    version of the data however often the page reruns. The least recently
+    used entries are evicted once the cached bytes exceed max_bytes. The
+    cache is thread-safe, so one instance can serve every session.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_EXPORT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        """Return the cached value for key (None when missing) and mark it recently used"""
+        with self._lock:
+            if key not in self.entries:
+                return None
+            self.entries.move_to_end(key)
+            return self.entries[key][0]
+
+    def put(self, key, value, size):
+        """Cache value, counting size bytes against the budget
+
+        A value larger than the whole budget is not cached.
+        """
+        with self._lock:
+            if key in self.entries:
+                self.total_bytes -= self.entries.pop(key)[1]
+            if size > self.max_bytes:
+                app_logger.debug("Export of {} bytes exceeds the cache budget; not cached", size)
+                return value
+            self.entries[key] = (value, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                evicted, (_, evicted_size) = self.entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                app_logger.debug("Evicted export {} ({} bytes) from cache", evicted, evicted_size)
+        return value
+
+    def get_or_create(self, key, build):
+        """Return the cached value for key, calling build() to create it on a miss
+
+        Args:
+            key: Cache key (see export_key)
+            build: Callable returning (value, size in bytes)
+        """
+        value = self.get(key)
+        if value is None:
+            value, size = build()
+            self.put(key, value, size)
+        return value
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def shared_export_cache():
+    """Return the export cache shared by all sessions of this process, so its budget is per process"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ExportCache()
+        return _shared_cache
@@ -0,0 +1,276 @@
+import io
+import zipfile
+import tempfile
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from .dataset_store import to_storable
+from .excel_writer import write_excel
+
+# Format -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    "excel": (".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "csv": (".csv", "text/csv"),
+    "jsonl": (".jsonl", "application/x-ndjson"),
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+}
+
+# Compression -> file extension suffix. Parquet compresses its column chunks
+# internally instead, so its file name does not change.
+COMPRESSIONS = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+ZIP_MIME = "application/zip"
+
+
+class _NonClosingSink(io.RawIOBase):
+    """Binary sink that leaves the wrapped file open when a compressor closes it"""
+
+    def __init__(self, target):
+        self.target = target
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.target.write(data)
+
+
+def _unified_type(current, new):
+    """Common Arrow type of two chunk types: null adopts the other, int and float widen, other conflicts become string"""
+    if current is None or pa.types.is_null(current):
+        return new
+    if pa.types.is_null(new) or current == new:
+        return current
+    try:
+        return pa.unify_schemas(
+            [pa.schema([("value", current)]), pa.schema([("value", new)])], promote_options="permissive"
+        ).field("value").type
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.string()
+
+
+class _ChunkSpool:
+    """Arrow IPC segments in a temporary file, with a schema unified across all chunks
+
+    Lets a writer accept chunks as they arrive, with columns appearing late
+    and types varying between chunks, and still write one consistent table
+    at the end while holding only one chunk in memory.
+    """
+
+    def __init__(self):
+        self.file = tempfile.TemporaryFile()
+        self.segments = []
+        self.types = {}
+
+    def append(self, table):
+        offset = self.file.tell()
+        with pa.ipc.new_stream(self.file, table.schema) as writer:
+            writer.write_table(table)
+        self.segments.append((offset, self.file.tell() - offset))
+        for field in table.schema:
+            self.types[field.name] = _unified_type(self.types.get(field.name), field.type)
+
+    def schema(self):
+        """Unified schema; columns that were empty in every chunk are strings"""
+        return pa.schema([
+            pa.field(name, pa.string() if pa.types.is_null(type_) else type_) for name, type_ in self.types.items()
+        ])
+
+    def tables(self):
+        """Yield the spooled chunks cast to the unified schema, one at a time"""
+        schema = self.schema()
+        for offset, length in self.segments:
+            self.file.seek(offset)
+            table = pa.ipc.open_stream(self.file.read(length)).read_all()
+            columns = [
+                table.column(field.name).cast(field.type) if field.name in table.column_names
+                else pa.nulls(table.num_rows, field.type)
+                for field in schema
+            ]
+            yield pa.Table.from_arrays(columns, schema=schema)
+
+    def close(self):
+        self.file.close()
+
+
+def _storable_table(chunk):
+    return pa.Table.from_pandas(to_storable(chunk), preserve_index=False).replace_schema_metadata(None)
+
+
+class TableExportWriter:
+    """Write one table to a binary sink as record batches arrive
+
+    Subclasses encode a DataFrame chunk at a time, so an export never needs
+    the whole table in one frame. Chunks may differ in columns and types;
+    formats with a fixed header or schema unify them (see _ChunkSpool).
+    """
+
+    def __init__(self, sink, compression=None):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        self.sink = sink
+        self.compression = compression
+        self.rows_written = 0
+        self.stream = pa.CompressedOutputStream(_NonClosingSink(sink), compression) if compression else sink
+
+    def write(self, chunk):
+        """Append a DataFrame chunk"""
+        if chunk is None or chunk.empty:
+            return
+        self._write_chunk(chunk.rename(columns=str))
+        self.rows_written += len(chunk)
+
+    def _write_chunk(self, chunk):
+        raise NotImplementedError
+
+    def close(self):
+        """Flush the compressor; the sink itself stays open"""
+        if self.compression:
+            self.stream.close()
+
+
+# Integer and boolean columns with nulls keep their CSV rendering ("1", not "1.0")
+_CSV_PANDAS_TYPES = {
+    pa.int8(): pd.Int8Dtype(), pa.int16(): pd.Int16Dtype(), pa.int32(): pd.Int32Dtype(), pa.int64(): pd.Int64Dtype(),
+    pa.uint8(): pd.UInt8Dtype(), pa.uint16(): pd.UInt16Dtype(), pa.uint32(): pd.UInt32Dtype(),
+    pa.uint64(): pd.UInt64Dtype(), pa.bool_(): pd.BooleanDtype(),
+}
+
+
+class CsvExportWriter(TableExportWriter):
+    """CSV whose header covers every column of every chunk
+
+    Chunks are spooled as they arrive and written on close, once the full
+    column set is known.
+    """
+
+    def __init__(self, sink, compression=None):
+        super().__init__(sink, compression)
+        self.spool = _ChunkSpool()
+
+    def _write_chunk(self, chunk):
+        # Nested list/dict cells are written as JSON, as in the Excel export
+        self.spool.append(_storable_table(chunk))
+
+    def close(self):
+        try:
+            header = True
+            for table in self.spool.tables():
+                df = table.to_pandas(types_mapper=_CSV_PANDAS_TYPES.get)
+                self.stream.write(df.to_csv(index=False, header=header).encode("utf-8"))
+                header = False
+            if header and self.spool.types:
+                self.stream.write(pd.DataFrame(columns=list(self.spool.types)).to_csv(index=False).encode("utf-8"))
+        finally:
+            self.spool.close()
+        super().close()
+
+
+class JsonlExportWriter(TableExportWriter):
+    """JSON Lines; every row carries only its own chunk's columns, so no alignment is needed"""
+
+    def _write_chunk(self, chunk):
+        text = chunk.to_json(orient="records", lines=True, date_format="iso")
+        self.stream.write((text if text.endswith("\n") else text + "\n").encode("utf-8"))
+
+
+class ParquetExportWriter(TableExportWriter):
+    """Parquet row groups, one per chunk; compression applies to the column chunks
+
+    Chunks are spooled as they arrive and written on close with a schema
+    unified across all of them, so a column that is int in one chunk and
+    float in the next is written as float, and late columns are kept.
+    """
+
+    def __init__(self, sink, compression=None):
+        super().__init__(sink, compression=None)
+        self.codec = compression or "snappy"
+        self.spool = _ChunkSpool()
+
+    def _write_chunk(self, chunk):
+        self.spool.append(_storable_table(chunk))
+
+    def close(self):
+        try:
+            with pq.ParquetWriter(self.sink, self.spool.schema(), compression=self.codec) as writer:
+                for table in self.spool.tables():
+                    writer.write_table(table)
+        finally:
+            self.spool.close()
+
+
+TABLE_WRITERS = {
+    "csv": CsvExportWriter,
+    "jsonl": JsonlExportWriter,
+    "parquet": ParquetExportWriter,
+}
+
+
+def export_filename(stem, export_format, compression=None, zipped=False):
+    """Return the download file name for an export"""
+    if zipped:
+        return f"{stem}.zip"
+    extension = EXPORT_FORMATS[export_format][0]
+    if export_format in ("csv", "jsonl"):
+        extension += COMPRESSIONS[compression]
+    return f"{stem}{extension}"
+
+
+def export_mime(export_format, zipped=False):
+    """Return the MIME type of an export"""
+    return ZIP_MIME if zipped else EXPORT_FORMATS[export_format][1]
+
+
+def _chunks(data):
+    return [data] if isinstance(data, pd.DataFrame) else data
+
+
+def write_table(data, export_format, target=None, compression=None):
+    """Write one table as CSV, JSON Lines or Parquet
+
+    Args:
+        data: DataFrame, or iterable of DataFrame chunks
+        export_format: "csv", "jsonl" or "parquet"
+        target: File path or binary file object (in memory when omitted)
+        compression: None, "gzip" or "zstd"
+
+    Returns:
+        Bytes when target is omitted, otherwise target
+    """
+    if export_format not in TABLE_WRITERS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+    sink = io.BytesIO() if target is None else (open(target, "wb") if isinstance(target, str) else target)
+    try:
+        writer = TABLE_WRITERS[export_format](sink, compression)
+        for chunk in _chunks(data):
+            writer.write(chunk)
+        writer.close()
+    finally:
+        if isinstance(target, str):
+            sink.close()
+    return sink.getvalue() if target is None else target
+
+
+def write_tables_zip(tables, export_format, target=None, compression=None):
+    """Write several tables into one zip archive, one member per table
+
+    Args:
+        tables: Dict of table name to DataFrame (or iterable of chunks); empty tables are skipped
+        export_format: Any EXPORT_FORMATS key
+        target: File path or binary file object (in memory when omitted)
+        compression: None, "gzip" or "zstd" for the member files
+
+    Returns:
+        Bytes when target is omitted, otherwise target
+    """
+    buffer = io.BytesIO() if target is None else None
+    with zipfile.ZipFile(buffer if buffer is not None else target, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in tables.items():
+            if data is None or (isinstance(data, pd.DataFrame) and data.empty):
+                continue
+            with archive.open(export_filename(name, export_format, compression), "w", force_zip64=True) as member:
+                if export_format == "excel":
+                    write_excel({name: data}, member)
+                else:
+                    write_table(data, export_format, member, compression)
+    return buffer.getvalue() if buffer is not None else target
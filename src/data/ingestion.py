@@ -0,0 +1,178 @@
+import os
+from datetime import date, datetime, time, timedelta
+import pandas as pd
+import pyarrow.parquet as pq
+from ..logger import app_logger
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # Optional Rust reader; openpyxl's read-only mode is used without it
+    CalamineWorkbook = None
+
+UPLOAD_TYPES = ["xlsx", "xls", "csv", "parquet"]
+
+DEFAULT_CHUNK_ROWS = 50_000
+
+
+def upload_format(file_name):
+    """Return the upload format ("excel", "csv" or "parquet") from a file name"""
+    extension = os.path.splitext(str(file_name))[1].lower().lstrip(".")
+    if extension in ("xlsx", "xlsm", "xls"):
+        return "excel"
+    if extension in ("csv", "parquet"):
+        return extension
+    raise ValueError(f"Unsupported file type: .{extension}")
+
+
+def _rewind(source):
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+def _excel_value(value):
+    """Convert a cell value the way pandas.read_excel does
+
+    Integral floats become ints, dates and datetimes become Timestamps and
+    durations Timedeltas, so the DataFrame constructor infers the same
+    column dtypes as read_excel. calamine's "" for empty cells becomes None.
+    """
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if isinstance(value, datetime):
+        return pd.Timestamp(value)
+    if isinstance(value, date):
+        return pd.Timestamp(datetime.combine(value, time()))
+    if isinstance(value, timedelta):
+        return pd.Timedelta(value)
+    if isinstance(value, str) and value == "":
+        return None
+    return value
+
+
+def _excel_rows(source):
+    """Yield the rows of the first worksheet as tuples of converted values, header first"""
+    if CalamineWorkbook is not None:
+        workbook = CalamineWorkbook.from_filelike(source) if hasattr(source, "read") else CalamineWorkbook.from_path(source)
+        try:
+            for row in workbook.get_sheet_by_index(0).iter_rows():
+                yield tuple(map(_excel_value, row))
+        finally:
+            workbook.close()
+        return
+
+    import openpyxl
+    workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+    try:
+        for row in workbook.worksheets[0].iter_rows(values_only=True):
+            yield tuple(map(_excel_value, row))
+    finally:
+        workbook.close()
+
+
+def _dedupe_header(names):
+    """Rename duplicate column names to "name.1", "name.2", ... as pandas.read_excel does
+
+    A suffixed name that is already a column of the sheet is skipped, so
+    ["a", "a", "a.1"] becomes ["a", "a.2", "a.1"].
+    """
+    names = list(names)
+    original = set(names)
+    counts = {}
+    for i, name in enumerate(names):
+        base, count = name, counts.get(name, 0)
+        while count > 0:
+            counts[base] = count + 1
+            name = f"{base}.{count}"
+            count = count + 1 if name in original else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+
+def _iter_excel(source, usecols, chunk_rows):
+    rows = _excel_rows(source)
+    header = next(rows, None)
+    if header is None:
+        yield pd.DataFrame()
+        return
+    header = _dedupe_header([f"Unnamed: {i}" if name is None else str(name) for i, name in enumerate(header)])
+    positions = [i for i, name in enumerate(header) if usecols is None or name in usecols]
+    names = [header[i] for i in positions]
+
+    batch, blank, emitted = [], 0, False
+    for row in rows:
+        # Like pandas.read_excel, blank rows between data rows are kept and trailing ones dropped
+        if all(value is None for value in row):
+            blank += 1
+            continue
+        for _ in range(blank):
+            batch.append([None] * len(positions))
+        blank = 0
+        batch.append([row[i] if i < len(row) else None for i in positions])
+        if len(batch) >= chunk_rows:
+            yield pd.DataFrame(batch, columns=names)
+            batch, emitted = [], True
+    if batch or not emitted:
+        yield pd.DataFrame(batch, columns=names)
+
+
+def iter_upload(source, usecols=None, chunk_rows=DEFAULT_CHUNK_ROWS, file_name=None):
+    """Read an uploaded Excel, CSV or Parquet file in chunks, keeping only the needed columns
+
+    Args:
+        source: File path or file-like object (e.g. a Streamlit UploadedFile)
+        usecols: Column names to keep; columns missing from the file are
+            ignored, so callers check for required columns themselves
+        chunk_rows: Rows per yielded DataFrame
+        file_name: File name used to detect the format (defaults to source.name or source)
+
+    Yields:
+        DataFrames of at most chunk_rows rows (Excel uses the first worksheet)
+    """
+    upload = upload_format(file_name or getattr(source, "name", source))
+    usecols = set(usecols) if usecols is not None else None
+    source = _rewind(source)
+
+    if upload == "csv":
+        yield from pd.read_csv(
+            source, usecols=(lambda col: col in usecols) if usecols is not None else None, chunksize=chunk_rows
+        )
+    elif upload == "parquet":
+        parquet_file = pq.ParquetFile(source)
+        names = parquet_file.schema_arrow.names
+        columns = [name for name in names if usecols is None or name in usecols]
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from _iter_excel(source, usecols, chunk_rows)
+
+
+def read_upload(source, usecols=None, file_name=None):
+    """Read a whole uploaded Excel, CSV or Parquet file, keeping only the needed columns
+
+    Memory grows with the selected columns rather than the full sheet.
+
+    Args:
+        source: File path or file-like object (e.g. a Streamlit UploadedFile)
+        usecols: Column names to keep (see iter_upload)
+        file_name: File name used to detect the format (defaults to source.name or source)
+
+    Returns:
+        DataFrame
+    """
+    upload = upload_format(file_name or getattr(source, "name", source))
+    source = _rewind(source)
+    if upload == "csv":
+        wanted = set(usecols) if usecols is not None else None
+        df = pd.read_csv(source, usecols=(lambda col: col in wanted) if wanted is not None else None)
+    elif upload == "parquet":
+        names = pq.read_schema(source).names
+        columns = [name for name in names if usecols is None or name in usecols]
+        df = pd.read_parquet(_rewind(source), columns=columns)
+    else:
+        chunks = list(_iter_excel(source, set(usecols) if usecols is not None else None, DEFAULT_CHUNK_ROWS))
+        # A column that is empty in one chunk is untyped there; type it again over all rows
+        df = pd.concat(chunks, ignore_index=True).infer_objects() if len(chunks) > 1 else chunks[0]
+    app_logger.info("Read {} rows x {} columns from {} upload", len(df), len(df.columns), upload)
+    return df
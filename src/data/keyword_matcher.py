@@ -0,0 +1,122 @@
+import re
+from functools import lru_cache
+from ..logger import app_logger
+
+
+class KeywordMatcher:
+    """Multi-keyword matcher compiled once into a single regular expression
+
+    The keywords are folded into a prefix trie and emitted as one pattern, so a
+    whole column is scanned by a single vectorized ``str`` operation instead of
+    a Python-level ``any(k in x for k in keywords)`` per row.
+    """
+
+    def __init__(self, keywords, word_boundary=False, categories=None):
+        """Compile the matcher
+
+        Args:
+            keywords: Iterable of keywords (matched case-insensitively)
+            word_boundary: Only match keywords that are not part of a larger word
+            categories: Optional dict mapping keyword to category label
+        """
+        self.keywords = sorted({k.strip().lower() for k in keywords if k and k.strip()})
+        self.word_boundary = word_boundary
+        self.categories = {k.strip().lower(): v for k, v in (categories or {}).items()}
+
+        pattern = self._trie_pattern(self.keywords)
+        if word_boundary:
+            pattern = rf"(?<!\w)(?:{pattern})(?!\w)"
+        self.pattern = pattern
+        self.regex = re.compile(f"(?:{pattern})")
+        self.group_regex = re.compile(f"({pattern})")
+        app_logger.debug("Compiled keyword matcher with {} keywords", len(self.keywords))
+
+    @staticmethod
+    def _trie_pattern(keywords):
+        """Build a regex alternation from a prefix trie of the keywords
+
+        Shared prefixes are factored out so the regex engine does not retry
+        every keyword at every position, and longer keywords win over their
+        own prefixes (``vp of product`` before ``vp``).
+        """
+        trie = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = True
+
+        def render(node):
+            is_end = "" in node
+            branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            if is_end:
+                if len(branches) == 1 and len(body) > 1:
+                    body = "(?:" + body + ")"
+                body += "?"
+            return body
+
+        return render(trie) if keywords else r"(?!x)x"
+
+    @staticmethod
+    def _normalize(series):
+        return series.astype(str).str.lower()
+
+    def contains(self, series):
+        """Return a boolean mask of values containing any keyword
+
+        Args:
+            series: Pandas Series of text values
+
+        Returns:
+            Boolean Series aligned with the input
+        """
+        return self._normalize(series).str.contains(self.regex, na=False)
+
+    def extract(self, series):
+        """Return the first (leftmost, longest) keyword matched in each value
+
+        Args:
+            series: Pandas Series of text values
+
+        Returns:
+            Series of matched keywords, NaN where nothing matched
+        """
+        return self._normalize(series).str.extract(self.group_regex, expand=False)
+
+    def categorize(self, series):
+        """Return the category of the first keyword matched in each value
+
+        Args:
+            series: Pandas Series of text values
+
+        Returns:
+            Series of category labels, NaN where nothing matched
+        """
+        return self.extract(series).map(self.categories)
+
+    def match(self, text):
+        """Return the first keyword matched in a single string, or None"""
+        found = self.regex.search(str(text).lower())
+        return found.group(0) if found else None
+
+
+@lru_cache(maxsize=32)
+def _cached_matcher(keywords, word_boundary, categories):
+    return KeywordMatcher(keywords, word_boundary=word_boundary, categories=dict(categories))
+
+
+def get_matcher(keywords, word_boundary=False, categories=None):
+    """Return a compiled matcher, reusing it across calls with the same keywords
+
+    Args:
+        keywords: Iterable of keywords
+        word_boundary: Only match whole words
+        categories: Optional dict mapping keyword to category label (part of the cache key)
+
+    Returns:
+        KeywordMatcher instance
+    """
+    return _cached_matcher(tuple(keywords), word_boundary, tuple(sorted((categories or {}).items())))
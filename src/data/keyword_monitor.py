@@ -0,0 +1,163 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+import pandas as pd
+from .dataset_store import DEFAULT_STORE_DIR
+from .linkedin_urls import frame_post_keys
+from ..logger import app_logger
+
+# Narrowest TexAu startTime window covering a gap, smallest first
+START_TIME_WINDOWS = [
+    (timedelta(hours=24), "past-24h"),
+    (timedelta(days=7), "past-week"),
+    (timedelta(days=30), "past-month"),
+]
+
+POST_DATE_COLUMNS = ["postDate", "postTimestamp", "publishedAt", "postedAt", "date"]
+
+
+def start_time_for_gap(last_run_at, now=None):
+    """Return the narrowest startTime value covering the time since last_run_at
+
+    Returns:
+        "past-24h", "past-week", "past-month", or None (all time) when the
+        monitor never ran or the gap exceeds a month
+    """
+    if last_run_at is None:
+        return None
+    gap = (now or datetime.now()) - last_run_at
+    for window, value in START_TIME_WINDOWS:
+        if gap <= window:
+            return value
+    return None
+
+
+class KeywordMonitorStore:
+    """Saved keyword searches that only keep posts not seen in earlier runs
+
+    Each monitor remembers the canonical keys (and post dates, when
+    available) of every post it returned, and when it last ran, so the next
+    run can request the narrowest time window and store only new posts.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(DEFAULT_STORE_DIR, "monitors.sqlite")
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS monitors (
+                    monitor_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    keyword TEXT NOT NULL,
+                    sort_by TEXT,
+                    posted_by TEXT,
+                    max_count INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    last_run_at TEXT
+                )"""
+            )
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS monitor_seen_posts (
+                    monitor_id INTEGER NOT NULL,
+                    post_key TEXT NOT NULL,
+                    posted_at TEXT,
+                    first_seen_at TEXT NOT NULL,
+                    PRIMARY KEY (monitor_id, post_key)
+                )"""
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def create(self, keyword, max_count=100, sort_by=None, posted_by=None):
+        """Save a new monitor and return its id"""
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO monitors (keyword, sort_by, posted_by, max_count, created_at) VALUES (?, ?, ?, ?, ?)",
+                [keyword, sort_by or None, posted_by or None, int(max_count), datetime.now().isoformat()],
+            )
+        app_logger.info("Created keyword monitor {} for '{}'", cursor.lastrowid, keyword)
+        return cursor.lastrowid
+
+    def delete(self, monitor_id):
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM monitors WHERE monitor_id = ?", [monitor_id])
+            conn.execute("DELETE FROM monitor_seen_posts WHERE monitor_id = ?", [monitor_id])
+
+    def list(self):
+        """Return all monitors with their seen-post counts as a DataFrame"""
+        with self._connect() as conn:
+            return pd.read_sql_query(
+                """SELECT m.monitor_id, m.keyword, m.sort_by, m.posted_by, m.max_count, m.created_at, m.last_run_at,
+                       COUNT(s.post_key) AS seen_posts
+                FROM monitors m LEFT JOIN monitor_seen_posts s ON s.monitor_id = m.monitor_id
+                GROUP BY m.monitor_id ORDER BY m.monitor_id""",
+                conn,
+            )
+
+    def get(self, monitor_id):
+        """Return a monitor as a dict, or None"""
+        monitors = self.list()
+        match = monitors[monitors["monitor_id"] == monitor_id]
+        if match.empty:
+            return None
+        return {key: (None if pd.isna(value) else value) for key, value in match.iloc[0].to_dict().items()}
+
+    def search_inputs(self, monitor, now=None):
+        """Build the post search automation inputs for the next run of a monitor"""
+        inputs = {"liPostSearchUrl": monitor["keyword"], "maxCountPostSearch": int(monitor["max_count"])}
+        last_run_at = monitor.get("last_run_at")
+        start_time = start_time_for_gap(datetime.fromisoformat(last_run_at) if last_run_at else None, now)
+        if start_time:
+            inputs["startTime"] = start_time
+        if monitor.get("sort_by"):
+            inputs["sortBy"] = monitor["sort_by"]
+        if monitor.get("posted_by"):
+            inputs["postedBy"] = monitor["posted_by"]
+        return inputs
+
+    def record_run(self, monitor_id, posts_df, run_at=None):
+        """Keep only posts this monitor has not seen before and remember them
+
+        Args:
+            monitor_id: Monitor id
+            posts_df: Posts returned by the search
+            run_at: Time of the run (defaults to now)
+
+        Returns:
+            DataFrame of new posts
+        """
+        run_at = (run_at or datetime.now()).isoformat()
+        keys = pd.Series(dtype=object)
+        if not posts_df.empty:
+            # Posts without a usable URL/URN are keyed by a hash of their content
+            content_keys = pd.util.hash_pandas_object(posts_df.astype(str), index=False).astype(str)
+            keys = frame_post_keys(posts_df).fillna(content_keys)
+
+        posted_at = pd.Series(None, index=posts_df.index, dtype=object)
+        for col in POST_DATE_COLUMNS:
+            if col in posts_df.columns:
+                posted_at = posts_df[col].astype(str)
+                break
+
+        with self._lock, self._connect() as conn:
+            seen = set()
+            unique_keys = list(keys.dropna().unique())
+            for start in range(0, len(unique_keys), 500):
+                chunk = unique_keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                seen.update(row[0] for row in conn.execute(
+                    f"SELECT post_key FROM monitor_seen_posts WHERE monitor_id = ? AND post_key IN ({placeholders})",
+                    [monitor_id, *chunk],
+                ))
+            is_new = ~keys.isin(seen) & ~keys.duplicated()
+            new_posts = posts_df[is_new]
+            conn.executemany(
+                "INSERT OR IGNORE INTO monitor_seen_posts (monitor_id, post_key, posted_at, first_seen_at) VALUES (?, ?, ?, ?)",
+                [(monitor_id, key, date, run_at) for key, date in zip(keys[is_new], posted_at[is_new])],
+            )
+            conn.execute("UPDATE monitors SET last_run_at = ? WHERE monitor_id = ?", [run_at, monitor_id])
+
+        app_logger.info("Monitor {} run: {} posts returned, {} new", monitor_id, len(posts_df), len(new_posts))
+        return new_posts
@@ -0,0 +1,186 @@
+import numpy as np
+import pandas as pd
+from .data_processor import DataProcessor
+from .keyword_matcher import get_matcher
+from .title_taxonomy import SENIORITY_LEVELS, get_classifier
+from ..logger import app_logger
+
+# Relative weight of each signal; signals whose columns are missing are left out
+DEFAULT_WEIGHTS = {
+    "title": 0.40,
+    "headcount": 0.20,
+    "engagement": 0.15,
+    "connection": 0.10,
+    "location": 0.10,
+    "premium": 0.05,
+}
+
+# Candidate source columns per signal, in order of preference. Prefixed
+# ("profile_headline") and nested ("author.headline") forms also match.
+SIGNAL_COLUMNS = {
+    "title": ["headline", "liProfileHeadline", "jobTitle", "title"],
+    "headcount": ["headcountRange", "companyHeadcountRange", "headcount"],
+    "connection": ["connectionDegree", "degree"],
+    "location": ["locationArea", "profileLocationArea", "profileLocationCountry", "jobLocationArea", "location"],
+    "premium": ["isPremium", "premium"],
+    "engagement": ["engagementCount", "posts_engaged", "likeCount", "numLikes", "reactionCount", "commentCount", "numComments"],
+}
+
+# Score of a 1st, 2nd and 3rd+ degree connection
+CONNECTION_SCORES = {1: 1.0, 2: 0.6, 3: 0.2}
+
+# Headcount at which the headcount signal saturates (log scale)
+HEADCOUNT_SATURATION = 10_000
+
+SCORE_COLUMNS = [f"score_{signal}" for signal in DEFAULT_WEIGHTS] + ["lead_score"]
+
+# Title score per seniority priority (1-based): founders 1.0 down to specialists
+_SENIORITY_SCORES = np.linspace(1.0, 0.3, len(SENIORITY_LEVELS))
+
+
+def _find_column(df, candidates):
+    lowered = {str(col).lower(): col for col in df.columns}
+    for candidate in candidates:
+        if candidate.lower() in lowered:
+            return lowered[candidate.lower()]
+    for candidate in candidates:
+        suffixes = (f"_{candidate.lower()}", f".{candidate.lower()}")
+        for name, col in lowered.items():
+            if name.endswith(suffixes):
+                return col
+    return None
+
+
+def _by_unique(series, func):
+    """Apply a Series -> array function to the distinct values only and broadcast back"""
+    codes, uniques = pd.factorize(series)
+    values = np.asarray(func(pd.Series(uniques)), dtype=float)
+    result = np.take(np.append(values, np.nan), codes)
+    return result
+
+
+class LeadScorer:
+    """Weighted lead score computed column-wise over a whole frame
+
+    Each signal is scaled to 0-1 with vectorized pandas/NumPy operations over
+    the distinct values of its column, then combined into a 0-100 score.
+    Signals without a source column are dropped and the remaining weights
+    renormalized, so profiles, post authors and batch results can share one
+    scorer.
+    """
+
+    def __init__(self, weights=None, target_locations=None, headcount_saturation=HEADCOUNT_SATURATION):
+        """Configure the scorer
+
+        Args:
+            weights: Dict of signal to weight, merged over DEFAULT_WEIGHTS
+            target_locations: Locations that earn the location signal (no location signal if empty)
+            headcount_saturation: Headcount that earns the full headcount signal
+        """
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.target_locations = [loc for loc in (target_locations or []) if loc and loc.strip()]
+        self.headcount_saturation = headcount_saturation
+
+    def title_signal(self, df, column):
+        priority_col = _find_column(df, ["title_priority"])
+        if priority_col is not None:
+            priority = pd.to_numeric(df[priority_col], errors="coerce").to_numpy(dtype=float)
+        else:
+            priority = pd.to_numeric(
+                get_classifier().classify_series(df[column], prefix="title_")["title_priority"], errors="coerce"
+            ).to_numpy(dtype=float)
+        scores = np.zeros(len(df))
+        matched = ~np.isnan(priority)
+        scores[matched] = _SENIORITY_SCORES[priority[matched].astype(int) - 1]
+        return scores
+
+    def headcount_signal(self, df, column):
+        def parse(values):
+            bounds = DataProcessor.parse_range(values)
+            return bounds["max"].fillna(bounds["min"])
+        headcount = _by_unique(df[column], parse)
+        return np.clip(np.log1p(np.nan_to_num(headcount)) / np.log1p(self.headcount_saturation), 0, 1)
+
+    def connection_signal(self, df, column):
+        def parse(values):
+            degree = pd.to_numeric(values.astype(str).str.extract(r"(\d)", expand=False), errors="coerce")
+            return degree.map(CONNECTION_SCORES).fillna(0)
+        return np.nan_to_num(_by_unique(df[column], parse))
+
+    def location_signal(self, df, column):
+        matcher = get_matcher(tuple(loc.strip() for loc in self.target_locations))
+        return np.nan_to_num(_by_unique(df[column], lambda values: matcher.contains(values).astype(float)))
+
+    def premium_signal(self, df, column):
+        def parse(values):
+            return values.astype(str).str.strip().str.lower().isin(["true", "1", "yes"]).astype(float)
+        return np.nan_to_num(_by_unique(df[column], parse))
+
+    def engagement_signal(self, df, column):
+        counts = np.nan_to_num(DataProcessor.parse_count(df[column]).to_numpy(dtype=float))
+        top = counts.max() if len(counts) else 0
+        if top <= 0:
+            return np.zeros(len(df))
+        return np.log1p(counts) / np.log1p(top)
+
+    def signal_columns(self, df):
+        """Return the source column of each signal the scorer uses on df
+
+        Args:
+            df: DataFrame of leads
+
+        Returns:
+            Dict of signal name to column name, for signals with a column and a positive weight
+        """
+        columns = {}
+        for signal, weight in self.weights.items():
+            column = _find_column(df, SIGNAL_COLUMNS.get(signal, []))
+            if column is None or weight <= 0 or (signal == "location" and not self.target_locations):
+                continue
+            columns[signal] = column
+        return columns
+
+    def score(self, df):
+        """Compute the signal and lead score columns
+
+        Args:
+            df: DataFrame of leads
+
+        Returns:
+            DataFrame with score_<signal> columns (0-1, NaN for unavailable
+            signals) and lead_score (0-100), aligned with df
+        """
+        scores = pd.DataFrame(index=df.index, columns=SCORE_COLUMNS, dtype=float)
+        total = np.zeros(len(df))
+        used_weight = 0.0
+        for signal, column in self.signal_columns(df).items():
+            weight = self.weights[signal]
+            values = getattr(self, f"{signal}_signal")(df, column)
+            scores[f"score_{signal}"] = values
+            total += weight * values
+            used_weight += weight
+        scores["lead_score"] = np.round(100 * total / used_weight, 1) if used_weight else 0.0
+        return scores
+
+    def rank(self, df, min_score=0):
+        """Score leads and order them best first
+
+        Args:
+            df: DataFrame of leads
+            min_score: Drop leads scoring below this (0-100)
+
+        Returns:
+            Copy of df with score columns and a 1-based lead_rank, sorted by lead_score
+        """
+        scores = self.score(df)
+        ranked = pd.concat([df.drop(columns=[c for c in SCORE_COLUMNS + ["lead_rank"] if c in df.columns]), scores], axis=1)
+        ranked = ranked[ranked["lead_score"] >= min_score]
+        ranked = ranked.sort_values("lead_score", ascending=False, kind="stable").reset_index(drop=True)
+        ranked.insert(0, "lead_rank", np.arange(1, len(ranked) + 1))
+        app_logger.info("Ranked {} of {} leads (min score {})", len(ranked), len(df), min_score)
+        return ranked
+
+
+def rank_leads(df, min_score=0, **scorer_kwargs):
+    """Rank a lead DataFrame with a LeadScorer built from scorer_kwargs"""
+    return LeadScorer(**scorer_kwargs).rank(df, min_score=min_score)
@@ -0,0 +1,297 @@
+import re
+from urllib.parse import unquote
+import pandas as pd
+
+# Columns of a scraped profile that can identify it, in order of preference
+PROFILE_KEY_COLUMNS = [
+    "liPublicProfileUrl", "liProfileUrl", "profileUrl", "url", "liProfilePublicId", "publicIdentifier",
+]
+
+# Columns of a post search result that can identify the post, in order of preference
+POST_KEY_COLUMNS = [
+    "postUrl", "liPostUrl", "postUrn", "urn", "activityUrn", "shareUrn", "url",
+]
+
+# Fields of a scraped company record holding its LinkedIn URL or vanity slug URL
+COMPANY_RECORD_URL_FIELDS = ["liCompanyUrl", "liCompanyPublicUrl", "companyUrl", "companyLinkedinUrl", "url"]
+
+# Fields of a scraped company record holding its numeric LinkedIn ID
+COMPANY_RECORD_ID_FIELDS = ["companyId", "liCompanyId"]
+
+LINKEDIN_BASE_URL = "https://www.linkedin.com"
+
+_LINKEDIN_HOST = re.compile(r"^(?:https?://)?(?:[a-z0-9-]+\.)*linkedin\.com", re.IGNORECASE)
+_PROFILE_SLUG = re.compile(r"linkedin\.com/in/([^/?#\s]+)", re.IGNORECASE)
+_COMPANY_SLUG = re.compile(r"linkedin\.com/(company|showcase|school)/([^/?#\s]+)", re.IGNORECASE)
+_ACTIVITY_ID = re.compile(r"(?:urn:li:activity:|activity[-:])(\d{10,})", re.IGNORECASE)
+_OTHER_POST_URN = re.compile(r"urn:li:(share|ugcPost):(\d{10,})", re.IGNORECASE)
+
+
+def _is_empty(value):
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return True
+    text = str(value).strip()
+    return not text or text.lower() in ("nan", "none")
+
+
+def canonical_key(url):
+    """Return a stable identity key for a LinkedIn URL
+
+    Equivalent URL forms collapse to the same key: trailing slashes, query
+    strings, fragments, locale/mobile subdomains and letter case are
+    ignored, and post URLs are keyed by their activity ID whether given as
+    a /posts/ slug, a /feed/update/ URL or a bare URN.
+
+    Args:
+        url: LinkedIn URL, URN or bare profile public ID
+
+    Returns:
+        Key such as "profile:john-doe", "company:acme", "post:7123..." or
+        "url:<normalized url>"; None for empty values
+    """
+    if _is_empty(url):
+        return None
+    text = unquote(str(url).strip())
+
+    found = _ACTIVITY_ID.search(text)
+    if found:
+        return f"post:{found.group(1)}"
+    found = _OTHER_POST_URN.search(text)
+    if found:
+        return f"{found.group(1).lower()}:{found.group(2)}"
+    found = _PROFILE_SLUG.search(text)
+    if found:
+        return f"profile:{found.group(1).strip().lower()}"
+    found = _COMPANY_SLUG.search(text)
+    if found:
+        return f"company:{found.group(2).strip().lower()}"
+    if "/" not in text and " " not in text and ":" not in text:
+        # Bare public ID
+        return f"profile:{text.lower()}"
+
+    normalized = _LINKEDIN_HOST.sub("linkedin.com", text.split("?")[0].split("#")[0]).rstrip("/").lower()
+    return f"url:{normalized}"
+
+
+def _key_url(key):
+    """Return the canonical URL of a canonical key (see canonical_key)"""
+    if key is None:
+        return None
+    kind, _, value = key.partition(":")
+    if kind == "profile":
+        return f"{LINKEDIN_BASE_URL}/in/{value}/"
+    if kind == "company":
+        return f"{LINKEDIN_BASE_URL}/company/{value}/"
+    if kind == "post":
+        return f"{LINKEDIN_BASE_URL}/feed/update/urn:li:activity:{value}/"
+    if kind in ("share", "ugcpost"):
+        urn_type = "ugcPost" if kind == "ugcpost" else "share"
+        return f"{LINKEDIN_BASE_URL}/feed/update/urn:li:{urn_type}:{value}/"
+    value = value if value.startswith("http") else f"https://{value}"
+    return _LINKEDIN_HOST.sub(LINKEDIN_BASE_URL, value)
+
+
+def canonicalize_url(url):
+    """Return the canonical https://www.linkedin.com form of a LinkedIn URL
+
+    Args:
+        url: LinkedIn URL, URN or bare profile public ID
+
+    Returns:
+        Canonical URL string, or None for empty values
+    """
+    return _key_url(canonical_key(url))
+
+
+def profile_key(url):
+    """Return the lowercase public ID of a LinkedIn profile URL
+
+    Bare public IDs are accepted as well. Returns None for empty values;
+    non-profile URLs fall back to their canonical key.
+    """
+    key = canonical_key(url)
+    if key is None:
+        return None
+    kind, _, value = key.partition(":")
+    return value if kind == "profile" else key
+
+
+def company_key(url):
+    """Return the lowercase slug or numeric ID of a LinkedIn company URL, or None"""
+    key = canonical_key(url)
+    if key is None:
+        return None
+    kind, _, value = key.partition(":")
+    return value if kind == "company" else None
+
+
+def profile_key_columns(df):
+    """Return the columns of a frame that can identify a person, in order of preference
+
+    Besides PROFILE_KEY_COLUMNS, nested or prefixed profile URL columns
+    (e.g. "author.profileUrl", "commenterProfileUrl") are accepted.
+    """
+    columns = [c for c in PROFILE_KEY_COLUMNS if c in df.columns]
+    columns += [
+        c for c in df.columns
+        if c not in columns and str(c).lower().replace(".", "").endswith(("profileurl", "publicidentifier"))
+    ]
+    return columns
+
+
+def profile_keys(series):
+    """Vectorized profile_key over a Series (NaN where no key could be derived)"""
+    codes, uniques = pd.factorize(series)
+    keys = pd.Series([profile_key(u) for u in uniques], dtype=object)
+    result = keys.reindex(codes).set_axis(series.index)
+    return result.where(codes >= 0)
+
+
+def frame_profile_keys(df, columns=None):
+    """Derive one profile key per row, coalescing the first usable key column
+
+    Args:
+        df: DataFrame of scraped profiles
+        columns: Candidate key columns (defaults to PROFILE_KEY_COLUMNS)
+
+    Returns:
+        Series of profile keys aligned with df
+    """
+    keys = pd.Series(None, index=df.index, dtype=object)
+    for col in columns or PROFILE_KEY_COLUMNS:
+        if col in df.columns:
+            keys = keys.fillna(profile_keys(df[col]))
+    return keys
+
+
+class UrlDedupeIndex:
+    """Set-based index of canonical LinkedIn keys used to skip redundant submissions
+
+    Aliases can be registered for forms that cannot be unified from the URL
+    alone, such as a company's numeric ID and its vanity slug. Indexes made
+    with shared_url_index() share one process-wide alias map, so aliases
+    learnt from any scraped company apply to every later submission.
+    """
+
+    def __init__(self, urls=None, aliases=None):
+        self.seen = set()
+        self.aliases = {} if aliases is None else aliases
+        for url in urls or []:
+            self.add(url)
+
+    def register_alias(self, url, same_as):
+        """Treat url as the same entity as same_as"""
+        key, target = self.key(url), self.key(same_as)
+        if key and target and key != target:
+            self.aliases[key] = target
+
+    def register_company(self, record, url=None):
+        """Alias the URLs and numeric ID named by a scraped company record to one company
+
+        The vanity slug is preferred as the company's key, so numeric ID URLs
+        resolve to the same key as the slug URL.
+
+        Args:
+            record: Company record as returned by the company scraper
+            url: URL the company was scraped from
+        """
+        if isinstance(record, list):
+            record = record[0] if record else None
+        if not isinstance(record, dict):
+            return
+        forms = [url] + [record.get(field) for field in COMPANY_RECORD_URL_FIELDS]
+        forms += [
+            f"{LINKEDIN_BASE_URL}/company/{record[field]}/"
+            for field in COMPANY_RECORD_ID_FIELDS if str(record.get(field) or "").strip().isdigit()
+        ]
+        keys = list(dict.fromkeys(
+            key for key in (canonical_key(form) for form in forms if not _is_empty(form))
+            if key and key.startswith("company:")
+        ))
+        if len(keys) < 2:
+            return
+        slugs = [key for key in keys if not key.partition(":")[2].isdigit()]
+        target = _key_url(slugs[0] if slugs else keys[0])
+        for key in keys:
+            self.register_alias(_key_url(key), target)
+
+    def key(self, url):
+        """Return the canonical key of url, resolved through the registered aliases"""
+        key = canonical_key(url)
+        visited = set()
+        while key in self.aliases and key not in visited:
+            visited.add(key)
+            key = self.aliases[key]
+        return key
+
+    def canonicalize(self, url):
+        """Return the canonical URL of url, resolved through the registered aliases
+
+        URLs of no known kind (profile, company or post) are returned as
+        given, since their paths may be case-sensitive.
+        """
+        key = self.key(url)
+        if key is not None and key.startswith("url:"):
+            return str(url).strip()
+        return _key_url(key)
+
+    def __contains__(self, url):
+        return self.key(url) in self.seen
+
+    def __len__(self):
+        return len(self.seen)
+
+    def add(self, url):
+        """Add a URL, returning True if its entity had not been seen before"""
+        key = self.key(url)
+        if key is None or key in self.seen:
+            return False
+        self.seen.add(key)
+        return True
+
+    def dedupe(self, urls):
+        """Collapse equivalent URLs, keeping first-seen order
+
+        Args:
+            urls: Iterable of LinkedIn URLs
+
+        Returns:
+            Tuple of (list of canonical URLs to submit, number of duplicates skipped)
+        """
+        unique_urls = []
+        duplicates = 0
+        for url in urls:
+            if _is_empty(url):
+                continue
+            if self.add(url):
+                unique_urls.append(self.canonicalize(url))
+            else:
+                duplicates += 1
+        return unique_urls, duplicates
+
+
+_shared_aliases = {}
+
+
+def shared_url_index(urls=None):
+    """Return a new dedupe index using the alias map shared by all sessions of this process"""
+    return UrlDedupeIndex(urls, aliases=_shared_aliases)
+
+
+def frame_post_keys(df, columns=None):
+    """Derive one canonical post key per row from the first usable post column
+
+    Args:
+        df: DataFrame of posts
+        columns: Candidate key columns (defaults to POST_KEY_COLUMNS)
+
+    Returns:
+        Series of canonical keys (e.g. "post:7123...") aligned with df
+    """
+    keys = pd.Series(None, index=df.index, dtype=object)
+    for col in columns or POST_KEY_COLUMNS:
+        if col in df.columns:
+            codes, uniques = pd.factorize(df[col])
+            col_keys = pd.Series([canonical_key(u) for u in uniques], dtype=object).reindex(codes).set_axis(df.index)
+            keys = keys.fillna(col_keys.where(codes >= 0))
+    return keys
@@ -0,0 +1,148 @@
+import os
+import re
+import time
+import uuid
+import hashlib
+import tempfile
+from datetime import datetime
+from ..logger import app_logger
+
+DEFAULT_OUTPUT_DIR = os.getenv("OUTPUT_DIR", "outputs")
+DEFAULT_OUTPUT_MAX_BYTES = int(float(os.getenv("OUTPUT_MAX_MB", "1024")) * 1024 * 1024)
+DEFAULT_OUTPUT_MAX_AGE_DAYS = float(os.getenv("OUTPUT_MAX_AGE_DAYS", "7"))
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+# Retention only touches what OutputManager itself created
+_JOB_DIR_PATTERN = re.compile(r"^\d{8}_\d{6}_.+_[0-9a-f]{8}$")
+_OUTPUT_FILE_PATTERN = re.compile(r"^(.+_[0-9a-f]{16}(\..*)?|tmp[^.]*\.partial)$")
+
+
+class OutputManager:
+    """Per-job storage of generated report files with size and age retention
+
+    Every pipeline run gets its own job directory, and each file is named
+    after a hash of its contents::
+
+        <root>/<job_id>/<stem>_<content hash><extension>
+
+    Concurrent users never write to the same path, identical exports within a
+    job share one file, and files are moved into place atomically so a reader
+    never sees a partial file. Old files are removed once they pass
+    max_age_days or the directory grows past max_bytes (oldest first).
+    Only job directories and stored files named as above are considered, so
+    other files under root are never deleted.
+    """
+
+    def __init__(self, root=None, max_bytes=DEFAULT_OUTPUT_MAX_BYTES, max_age_days=DEFAULT_OUTPUT_MAX_AGE_DAYS):
+        self.root = root or DEFAULT_OUTPUT_DIR
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        os.makedirs(self.root, exist_ok=True)
+
+    @staticmethod
+    def new_job(name="job"):
+        """Return a new, unique job ID"""
+        return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{name}_{uuid.uuid4().hex[:8]}"
+
+    @staticmethod
+    def _file_hash(path):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()[:16]
+
+    def write(self, job_id, file_name, write_fn):
+        """Store a file generated by write_fn in the job directory
+
+        Args:
+            job_id: Job ID from new_job
+            file_name: Download file name; its extension is kept
+            write_fn: Callable that writes the contents to the file path it is given
+
+        Returns:
+            Path of the stored file
+        """
+        job_dir = os.path.join(self.root, job_id)
+        os.makedirs(job_dir, exist_ok=True)
+        stem, dot, extension = file_name.partition(".")
+        fd, temp_path = tempfile.mkstemp(dir=job_dir, suffix=".partial")
+        os.close(fd)
+        try:
+            write_fn(temp_path)
+            path = os.path.join(job_dir, f"{stem}_{self._file_hash(temp_path)}{dot}{extension}")
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        app_logger.info("Stored output {} ({} bytes)", path, os.path.getsize(path))
+        self.apply_retention(keep=path)
+        return path
+
+    def write_bytes(self, job_id, file_name, data):
+        """Store in-memory file contents in the job directory; returns the stored path"""
+        def write_fn(path):
+            with open(path, "wb") as f:
+                f.write(data)
+        return self.write(job_id, file_name, write_fn)
+
+    def _job_dirs(self):
+        try:
+            names = os.listdir(self.root)
+        except FileNotFoundError:
+            return []
+        return [
+            os.path.join(self.root, name) for name in names
+            if _JOB_DIR_PATTERN.match(name) and os.path.isdir(os.path.join(self.root, name))
+        ]
+
+    def apply_retention(self, keep=None):
+        """Delete stored files past max_age_days, then the oldest ones until the total fits max_bytes
+
+        Args:
+            keep: Path of a file never deleted in this pass (the file just
+                stored, even if it alone exceeds max_bytes)
+
+        Returns:
+            Number of files deleted
+        """
+        files = []
+        for job_dir in self._job_dirs():
+            for filename in os.listdir(job_dir):
+                path = os.path.join(job_dir, filename)
+                if not _OUTPUT_FILE_PATTERN.match(filename) or not os.path.isfile(path):
+                    continue
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        cutoff = time.time() - self.max_age_days * 86400
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for mtime, size, path in files:
+            if mtime >= cutoff and total <= self.max_bytes:
+                break
+            # Files still being written by another session are left alone until they age out
+            if (path.endswith(".partial") and mtime >= cutoff) or path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+
+        for job_dir in self._job_dirs():
+            try:
+                if not os.listdir(job_dir):
+                    os.rmdir(job_dir)
+            except OSError:
+                pass
+        if removed:
+            app_logger.info("Output retention removed {} files ({} bytes kept)", removed, total)
+        return removed
@@ -0,0 +1,215 @@
+import re
+import unicodedata
+from difflib import SequenceMatcher
+import numpy as np
+import pandas as pd
+from .linkedin_urls import frame_profile_keys, profile_key_columns
+from ..logger import app_logger
+
+FIRST_NAME_COLUMNS = ["firstName", "first_name"]
+LAST_NAME_COLUMNS = ["lastName", "last_name"]
+FULL_NAME_COLUMNS = ["fullName", "name", "authorName", "commenterName", "reactorName"]
+COMPANY_COLUMNS = ["companyName", "company", "currentCompany", "liCompanyName"]
+
+_COMPANY_SUFFIXES = re.compile(
+    r"\b(?:inc|incorporated|ltd|limited|llc|llp|plc|corp|corporation|co|company|gmbh|ag|sa|srl|bv|pvt|private|group|holdings)\b"
+)
+# Degrees and certifications people append to their display name
+_NAME_SUFFIXES = re.compile(r"\b(?:phd|mba|cpa|cfa|pmp|md|jr|sr|ii|iii|dr|mr|mrs|ms|prof)\b")
+
+# Profile keys that are LinkedIn member IDs rather than vanity slugs
+_MEMBER_ID_PREFIXES = ("acoa", "acwa")
+
+
+def _first_present(df, candidates):
+    for col in candidates:
+        if col in df.columns:
+            return df[col]
+    for col in df.columns:
+        if any(str(col).endswith((f".{c}", f"_{c}")) for c in candidates):
+            return df[col]
+    return None
+
+
+def _fold(series):
+    """Lowercase, strip accents and keep only letters, digits and single spaces"""
+    text = series.fillna("").astype(str).map(
+        lambda value: unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    )
+    return text.str.lower().str.replace(r"[^a-z0-9 ]+", " ", regex=True).str.replace(r"\s+", " ", regex=True).str.strip()
+
+
+def normalize_people(df):
+    """Derive the matching fields of each person row
+
+    Args:
+        df: DataFrame of people from any source (search results, post
+            authors, likers, commenters, employees)
+
+    Returns:
+        DataFrame aligned with df with person_key, first, last, full_name and
+        company columns (empty strings where unknown)
+    """
+    empty = pd.Series("", index=df.index)
+    first, last, full = (_first_present(df, cols) for cols in (FIRST_NAME_COLUMNS, LAST_NAME_COLUMNS, FULL_NAME_COLUMNS))
+    full = _fold(full).str.split(",").str[0] if full is not None else empty
+    full = full.str.replace(_NAME_SUFFIXES, "", regex=True).str.replace(r"\s+", " ", regex=True).str.strip()
+    first = _fold(first) if first is not None else full.str.split(" ").str[0].fillna("")
+    last = _fold(last).str.replace(_NAME_SUFFIXES, "", regex=True).str.strip() if last is not None else empty
+    # Without a lastName column the last token of the full name is the surname
+    last = last.where(last != "", full.str.split(" ").str[-1].fillna(""))
+    full = full.where(full != "", (first + " " + last).str.strip())
+
+    company = _first_present(df, COMPANY_COLUMNS)
+    company = _fold(company).str.replace(_COMPANY_SUFFIXES, "", regex=True).str.replace(r"\s+", " ", regex=True).str.strip() \
+        if company is not None else empty
+
+    key_columns = profile_key_columns(df)
+    keys = frame_profile_keys(df, key_columns) if key_columns else pd.Series(None, index=df.index, dtype=object)
+    return pd.DataFrame({
+        "person_key": keys,
+        "first": first,
+        "last": last.str.split(" ").str[-1].fillna(""),
+        "full_name": full,
+        "company": company,
+    }, index=df.index)
+
+
+def _is_vanity_slug(key):
+    return isinstance(key, str) and not key.startswith(_MEMBER_ID_PREFIXES)
+
+
+class _UnionFind:
+    """Union-find that never merges two clusters holding different vanity slugs"""
+
+    def __init__(self, size, slugs=None):
+        self.parent = np.arange(size)
+        # Vanity slugs of each cluster, kept on its root
+        self.slugs = slugs if slugs is not None else [set() for _ in range(size)]
+
+    def find(self, item):
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a, b):
+        """Merge the clusters of a and b; returns False when their slugs conflict"""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return True
+        slugs = self.slugs[root_a] | self.slugs[root_b]
+        if len(slugs) > 1:
+            return False
+        root, child = min(root_a, root_b), max(root_a, root_b)
+        self.parent[child] = root
+        self.slugs[root], self.slugs[child] = slugs, set()
+        return True
+
+
+class PersonDeduper:
+    """Merge the same person seen across several sources
+
+    Rows with the same profile key are merged directly. Remaining rows are
+    grouped into blocks by normalized last name plus company, and names are
+    compared fuzzily only within a block, so the number of comparisons grows
+    with block sizes rather than with the square of the row count.
+    """
+
+    def __init__(self, name_threshold=0.85):
+        """
+        Args:
+            name_threshold: Minimum full-name similarity (0-1) for two rows in a block to be merged
+        """
+        self.name_threshold = name_threshold
+
+    @staticmethod
+    def _keys_conflict(key_a, key_b):
+        """Two different vanity slugs are two different people; member IDs may alias a slug"""
+        if not isinstance(key_a, str) or not isinstance(key_b, str) or key_a == key_b:
+            return False
+        return _is_vanity_slug(key_a) and _is_vanity_slug(key_b)
+
+    def _same_person(self, a, b):
+        if self._keys_conflict(a.person_key, b.person_key):
+            return False
+        if a.first and b.first and a.first[0] != b.first[0]:
+            return False
+        if a.full_name == b.full_name:
+            return True
+        # "J Smith" vs "John Smith"
+        if len(a.first) == 1 or len(b.first) == 1:
+            return True
+        return SequenceMatcher(None, a.full_name, b.full_name).ratio() >= self.name_threshold
+
+    def cluster(self, people):
+        """Assign a cluster number to each row of a normalize_people frame
+
+        Returns:
+            Integer array of cluster numbers (the lowest row position in each cluster)
+        """
+        people = people.reset_index(drop=True)
+        union_find = _UnionFind(len(people), [{key} if _is_vanity_slug(key) else set() for key in people["person_key"]])
+
+        for positions in people[people["person_key"].notna()].groupby("person_key", sort=False).indices.values():
+            for position in positions[1:]:
+                union_find.union(positions[0], position)
+
+        rows = list(people.itertuples(index=False))
+        comparisons = 0
+        blockable = (people["last"] != "") & (people["company"] != "")
+        blocks = people[blockable].groupby(["last", "company"], sort=False).indices
+        for positions in blocks.values():
+            if len(positions) < 2:
+                continue
+            # Compare each row with one representative per cluster found so far in the block;
+            # a merge that would join two different vanity slugs is refused for the whole cluster
+            representatives = []
+            for position in positions:
+                for rep_position in representatives:
+                    comparisons += 1
+                    if self._same_person(rows[rep_position], rows[position]) and union_find.union(rep_position, position):
+                        break
+                else:
+                    representatives.append(position)
+
+        clusters = np.array([union_find.find(i) for i in range(len(people))])
+        app_logger.debug("Person dedupe: {} rows, {} blocks, {} name comparisons", len(people), len(blocks), comparisons)
+        return clusters
+
+    def dedupe(self, frames):
+        """Merge people from several sources into one record per person
+
+        Args:
+            frames: Dict of source name to DataFrame, in order of preference
+                (earlier sources win when values conflict)
+
+        Returns:
+            DataFrame with one row per person: person_id, sources,
+            source_rows, then the first non-empty value of every column
+        """
+        tables = [
+            df.assign(_source=source) for source, df in frames.items()
+            if df is not None and not df.empty
+        ]
+        if not tables:
+            return pd.DataFrame(columns=["person_id", "sources", "source_rows"])
+        combined = pd.concat(tables, ignore_index=True, sort=False)
+        people = pd.concat([normalize_people(df) for df in tables], ignore_index=True)
+        combined["person_id"] = self.cluster(people)
+
+        grouped = combined.groupby("person_id", sort=False)
+        merged = grouped.first()
+        merged.insert(0, "sources", grouped["_source"].agg(lambda s: ", ".join(dict.fromkeys(s))))
+        merged.insert(1, "source_rows", grouped.size())
+        merged = merged.drop(columns="_source").reset_index()
+        merged["person_id"] = np.arange(1, len(merged) + 1)
+        app_logger.info("Merged {} person rows from {} sources into {} people", len(combined), len(tables), len(merged))
+        return merged
+
+
+def dedupe_people(frames, name_threshold=0.85):
+    """Merge people across sources with a PersonDeduper"""
+    return PersonDeduper(name_threshold=name_threshold).dedupe(frames)
@@ -0,0 +1,275 @@
+import json
+import marshal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_all_start_methods, get_context
+import pandas as pd
+from ..logger import app_logger
+
+DEFAULT_FLATTEN_CHUNK_SIZE = 2_000
+
+# Process pool shared by all normalize_records_parallel calls of this process
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def payload_records(payload):
+    """Return the record dicts of one API payload
+
+    A payload is a dict, a JSON string, or a list (or JSON list) of either.
+    Undecodable strings and non-dict items yield no records.
+    """
+    def decode(value):
+        if isinstance(value, (str, bytes)):
+            try:
+                return json.loads(value)
+            except ValueError:
+                return None
+        return value
+
+    payload = decode(payload)
+    items = payload if isinstance(payload, list) else [payload]
+    return [item for item in map(decode, items) if isinstance(item, dict)]
+
+
+def _flatten_nested(record, sep, prefix, flat):
+    for key, value in record.items():
+        name = f"{prefix}{sep}{key}"
+        if isinstance(value, dict):
+            # Like json_normalize, an empty nested dict adds no column
+            _flatten_nested(value, sep, name, flat)
+        else:
+            flat[name] = value
+
+
+def _flatten_record(record, sep):
+    """Flatten nested dicts into one level, as pandas.json_normalize does (lists are kept as values)
+
+    Top-level scalar fields come first, then the flattened nested fields,
+    matching json_normalize's column order.
+    """
+    flat = {key: value for key, value in record.items() if not isinstance(value, dict)}
+    if len(flat) < len(record):
+        for key, value in record.items():
+            if isinstance(value, dict):
+                _flatten_nested(value, sep, str(key), flat)
+    return flat
+
+
+def flatten_records(records, sep="."):
+    """Flatten each record dict into a one-level dict (nested keys joined with sep)"""
+    return [_flatten_record(record, sep) for record in records]
+
+
+def normalize_records(records, sep="."):
+    """Flatten a list of record dicts into a DataFrame (nested keys joined with sep)
+
+    Gives the same frame as pandas.json_normalize(records, sep=sep) with its
+    default arguments.
+    """
+    return pd.DataFrame(flatten_records(records, sep))
+
+
+def _pack(records):
+    """Serialize a record chunk for a worker
+
+    JSON-decoded records are sent with marshal, which is several times
+    faster than pickle for plain dicts, lists and strings; records holding
+    other objects fall back to pickling by the pool.
+    """
+    try:
+        return marshal.dumps(records)
+    except ValueError:
+        return records
+
+
+def _unpack(packed):
+    return marshal.loads(packed) if isinstance(packed, bytes) else packed
+
+
+def _normalize_packed(packed):
+    return normalize_records(_unpack(packed))
+
+
+def _raw_columns(task):
+    packed, columns = task
+    # Untyped values, with NaN where a record lacks the field (as the DataFrame constructor fills them)
+    return pd.DataFrame(flatten_records(_unpack(packed)), dtype=object).reindex(columns=columns)
+
+
+def _worker_pool(workers):
+    """Return the shared worker pool, starting it on first use
+
+    Workers are started through a forkserver (spawn where that is not
+    available), never forked from the calling process, so the pool can be
+    used from a multi-threaded server such as Streamlit. The forkserver
+    preloads this module, so each worker starts with pandas imported.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            method = "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+            context = get_context(method)
+            if method == "forkserver":
+                context.set_forkserver_preload([__name__])
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            _pool_workers = workers
+            app_logger.debug("Started {} normalization worker processes ({})", workers, method)
+        return _pool
+
+
+def _discard_pool(pool):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def normalize_records_parallel(records, workers, chunks_per_worker=2):
+    """Flatten records in worker processes, with the same result as normalize_records
+
+    Record chunks are sent to a shared pool of workers (see _pack) and come
+    back as typed frames. A column whose dtype differs between chunks, or that is
+    missing from some of them, could be typed differently than over all
+    rows at once; those columns alone are fetched again untyped and typed
+    over all rows, so chunk boundaries never change the result.
+
+    Args:
+        records: List of record dicts
+        workers: Number of worker processes
+        chunks_per_worker: Chunks per worker, to even out uneven records
+
+    Returns:
+        DataFrame identical to normalize_records(records)
+    """
+    size = max(1, -(-len(records) // (workers * chunks_per_worker)))
+    parts = [_pack(records[start:start + size]) for start in range(0, len(records), size)]
+    pool = _worker_pool(workers)
+    try:
+        chunks = list(pool.map(_normalize_packed, parts))
+        combined = concat_chunks(chunks)
+        retype = [
+            col for col in combined.columns
+            if any(col not in chunk.columns for chunk in chunks)
+            or len({chunk[col].dtype for chunk in chunks}) > 1
+        ]
+        if retype:
+            raw = concat_chunks(list(pool.map(_raw_columns, [(part, retype) for part in parts])))
+            for col in retype:
+                combined[col] = pd.Series(raw[col].tolist(), index=combined.index)
+    except BrokenProcessPool:
+        # A worker died; the next call starts a new pool
+        _discard_pool(pool)
+        raise
+    return combined
+
+
+def concat_chunks(chunks):
+    """Concatenate normalized chunks; columns keep their order of first appearance"""
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, ignore_index=True, sort=False)
+
+
+class RecordFlattener:
+    """Flatten API payloads into one DataFrame as they arrive
+
+    Payloads may be dicts, JSON strings, or lists (or JSON lists) of either. Records
+    are buffered and normalized chunk_size at a time, so building the frame
+    is one concat of pre-normalized chunks instead of a json_normalize pass
+    over every record at the end. Decoded JSON strings are cached, so a
+    payload that arrives twice is parsed once.
+
+    Columns are typed as json_normalize types them, with one difference: an
+    integer field with gaps in one chunk and text in another keeps the
+    chunk's floats (1.0 rather than 1) in the resulting object column.
+    """
+
+    def __init__(self, chunk_size=DEFAULT_FLATTEN_CHUNK_SIZE, sep="."):
+        """
+        Args:
+            chunk_size: Records normalized at a time
+            sep: Separator of nested key names in column names
+        """
+        self.chunk_size = chunk_size
+        self.sep = sep
+        self.records = 0
+        self.skipped = 0
+        self._buffer = []
+        self._chunks = []
+        self._decoded = {}
+
+    def __len__(self):
+        return self.records + len(self._buffer)
+
+    def _decode(self, payload):
+        if not isinstance(payload, (str, bytes)):
+            return payload
+        decoded = self._decoded.get(payload)
+        if decoded is None:
+            try:
+                decoded = json.loads(payload)
+            except ValueError:
+                self.skipped += 1
+                return None
+            self._decoded[payload] = decoded
+        return decoded
+
+    def add(self, payload):
+        """Add one payload (dict, JSON string, or list of either); non-record items are skipped"""
+        decoded = self._decode(payload)
+        if decoded is None:
+            return
+        for record in decoded if isinstance(decoded, list) else [decoded]:
+            if isinstance(record, (str, bytes)):
+                record = self._decode(record)
+                if record is None:
+                    continue
+            if isinstance(record, dict):
+                self._buffer.append(record)
+            else:
+                self.skipped += 1
+        if len(self._buffer) >= self.chunk_size:
+            self._flush()
+
+    def extend(self, payloads):
+        """Add several payloads; returns self"""
+        for payload in payloads:
+            self.add(payload)
+        return self
+
+    def _flush(self):
+        if self._buffer:
+            self._chunks.append(normalize_records(self._buffer, self.sep))
+            self.records += len(self._buffer)
+            self._buffer = []
+
+    def to_frame(self):
+        """Return every record added so far as one flat DataFrame"""
+        self._flush()
+        if self.skipped:
+            app_logger.warning("Skipped {} payload items that were not JSON records", self.skipped)
+        frame = concat_chunks(self._chunks)
+        if len(self._chunks) > 1:
+            # A column missing or typed differently in some chunk (e.g. all None there) is
+            # object after the concat; one dtype pass over all rows types it as a single
+            # json_normalize would
+            mixed = [
+                col for col in frame.columns if frame[col].dtype == object
+                and any(col not in chunk.columns or chunk[col].dtype != object for chunk in self._chunks)
+            ]
+            if mixed:
+                frame[mixed] = frame[mixed].infer_objects()
+        return frame
+
+
+def flatten_payloads(payloads, chunk_size=DEFAULT_FLATTEN_CHUNK_SIZE, sep="."):
+    """Flatten a list of payloads with a RecordFlattener"""
+    return RecordFlattener(chunk_size=chunk_size, sep=sep).extend(payloads).to_frame()
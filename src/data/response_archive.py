@@ -0,0 +1,136 @@
+import os
+import json
+import gzip
+import hashlib
+import tempfile
+from datetime import datetime
+from ..logger import app_logger
+
+DEFAULT_ARCHIVE_DIR = os.getenv("RESPONSE_ARCHIVE_DIR", os.path.join("data_store", "responses"))
+
+UNKNOWN_AUTOMATION = "unknown"
+
+_ARCHIVE_SUFFIX = ".json.gz"
+
+
+def inputs_key(inputs):
+    """Return a short stable hash of automation inputs (key order does not matter)"""
+    canonical = json.dumps(inputs or {}, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def _safe_name(value):
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in str(value)) or "_"
+
+
+class ResponseArchive:
+    """Gzip-compressed store of raw TexAu execution results
+
+    Every result is kept as it came from the API, wrapped in an entry with
+    the request that produced it::
+
+        <root>/<automation_id>/<inputs hash>/<execution_id>.json.gz
+
+    so payloads can be looked up by execution, automation and inputs, and
+    normalized again offline (see reprocess_archive.py) when processing
+    changes, without running the automation again.
+    """
+
+    def __init__(self, root=None):
+        self.root = root or DEFAULT_ARCHIVE_DIR
+
+    def path_for(self, execution_id, automation_id=None, inputs=None):
+        """Return the archive path of an execution"""
+        return os.path.join(
+            self.root, _safe_name(automation_id or UNKNOWN_AUTOMATION), inputs_key(inputs),
+            f"{_safe_name(execution_id)}{_ARCHIVE_SUFFIX}"
+        )
+
+    def save(self, execution_id, response, automation_id=None, inputs=None, name=None):
+        """Archive a raw execution result
+
+        Args:
+            execution_id: TexAu execution ID
+            response: Raw result dict as returned by the API
+            automation_id: Automation that produced it (None if unknown)
+            inputs: Automation inputs of the run
+            name: Run name given to TexAu
+
+        Returns:
+            Path of the archived entry
+        """
+        entry = {
+            "execution_id": execution_id,
+            "automation_id": automation_id,
+            "name": name,
+            "inputs": inputs,
+            "inputs_key": inputs_key(inputs),
+            "archived_at": datetime.now().isoformat(timespec="seconds"),
+            "response": response,
+        }
+        path = self.path_for(execution_id, automation_id, inputs)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".partial")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(json.dumps(entry, default=str).encode("utf-8"))
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        app_logger.debug("Archived TexAu execution {} to {} ({} bytes)", execution_id, path, os.path.getsize(path))
+        return path
+
+    @staticmethod
+    def load(path):
+        """Read an archived entry (dict with execution_id, automation_id, inputs, response, ...)"""
+        with gzip.open(path, "rb") as f:
+            return json.loads(f.read())
+
+    def paths(self, automation_id=None, inputs=None):
+        """Archived entry paths, oldest first, optionally for one automation and inputs"""
+        if automation_id is None:
+            if inputs is not None:
+                raise ValueError("inputs can only be matched together with automation_id")
+            base = self.root
+        else:
+            base = os.path.join(self.root, _safe_name(automation_id))
+            if inputs is not None:
+                base = os.path.join(base, inputs_key(inputs))
+        found = []
+        for dirpath, _, filenames in os.walk(base):
+            for filename in filenames:
+                if filename.endswith(_ARCHIVE_SUFFIX):
+                    path = os.path.join(dirpath, filename)
+                    found.append((os.path.getmtime(path), path))
+        return [path for _, path in sorted(found)]
+
+    def entries(self, automation_id=None, inputs=None, execution_ids=None, since=None):
+        """Yield archived entries, oldest first
+
+        Args:
+            automation_id: Only entries of this automation
+            inputs: Only entries run with these inputs (requires automation_id)
+            execution_ids: Only these execution IDs
+            since: Only entries archived at or after this datetime
+
+        Yields:
+            Entry dicts (see save); unreadable files are logged and skipped
+        """
+        wanted = {_safe_name(e) for e in execution_ids} if execution_ids else None
+        for path in self.paths(automation_id, inputs):
+            if wanted is not None and os.path.basename(path)[:-len(_ARCHIVE_SUFFIX)] not in wanted:
+                continue
+            if since is not None and datetime.fromtimestamp(os.path.getmtime(path)) < since:
+                continue
+            try:
+                yield self.load(path)
+            except (OSError, ValueError) as e:
+                app_logger.warning("Skipping unreadable archive entry {}: {}", path, str(e))
+
+    def latest(self, automation_id, inputs):
+        """Return the most recent entry for an automation and inputs, or None"""
+        paths = self.paths(automation_id, inputs)
+        return self.load(paths[-1]) if paths else None
@@ -0,0 +1,298 @@
+import os
+import json
+import time
+import uuid
+import atexit
+import pickle
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+import pandas as pd
+import pyarrow as pa
+from .export_cache import frame_fingerprint
+from ..logger import app_logger
+
+DEFAULT_RESULT_MEMORY_BYTES = int(float(os.getenv("RESULT_MEMORY_MB", "256")) * 1024 * 1024)
+DEFAULT_RESULT_SPILL_DIR = os.getenv("RESULT_SPILL_DIR", os.path.join(tempfile.gettempdir(), "linkedin_results"))
+DEFAULT_PREVIEW_ROWS = 100
+DEFAULT_SPILL_CHUNK_ROWS = 10_000
+
+# Spill directories of processes that did not exit cleanly are removed after this long
+_STALE_SPILL_SECONDS = 24 * 3600
+
+_METADATA_KEY = b"result_store"
+
+
+def _is_str_column(series):
+    """True for object columns holding only strings and None, which Arrow stores losslessly"""
+    if pd.api.types.infer_dtype(series, skipna=True) not in ("string", "empty"):
+        return False
+    return all(value is None for value in series[series.isna()])
+
+
+def _encode(df):
+    """Convert a frame to an Arrow table that decodes back to an identical frame
+
+    Typed columns are stored natively. Object columns of strings become
+    Arrow strings; any other object column (nested lists/dicts, mixed types)
+    is pickled cell by cell, since Arrow would change its values or dtype.
+    """
+    encoded = df.copy(deep=False)
+    str_columns, pickled_columns = [], []
+    for position in range(df.shape[1]):
+        series = df.iloc[:, position]
+        if series.dtype != object:
+            continue
+        if _is_str_column(series):
+            str_columns.append(position)
+        else:
+            encoded.isetitem(position, pd.Series(
+                [pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL) for value in series], index=df.index, dtype=object
+            ))
+            pickled_columns.append(position)
+    table = pa.Table.from_pandas(encoded, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_METADATA_KEY] = json.dumps({"str": str_columns, "pickled": pickled_columns}).encode("utf-8")
+    return table.replace_schema_metadata(metadata)
+
+
+def _decode(table, layout):
+    frame = table.to_pandas()
+    for position in layout["str"]:
+        series = frame.iloc[:, position].astype(object)
+        frame.isetitem(position, series.where(series.notna(), None))
+    for position in layout["pickled"]:
+        frame.isetitem(position, pd.Series(
+            [pickle.loads(value) for value in frame.iloc[:, position]], index=frame.index, dtype=object
+        ))
+    return frame
+
+
+class ResultHandle:
+    """Reference to a result table kept by a ResultStore
+
+    Holds only a preview and the table's shape; the full table is fetched
+    with to_frame() or iter_chunks(). Handles of identical tables share one
+    stored copy, which is removed when the last handle is garbage collected.
+    """
+
+    def __init__(self, store, key, name, preview, rows, nbytes):
+        self.store = store
+        self.key = key
+        self.name = name
+        self.preview = preview
+        self.rows = rows
+        self.nbytes = nbytes
+        weakref.finalize(self, store.release, key)
+
+    @property
+    def fingerprint(self):
+        """Content hash of the table (see export_cache.frame_fingerprint)"""
+        return self.key
+
+    @property
+    def columns(self):
+        return self.preview.columns
+
+    @property
+    def shape(self):
+        return self.rows, len(self.preview.columns)
+
+    @property
+    def empty(self):
+        return self.rows == 0 or len(self.preview.columns) == 0
+
+    def __len__(self):
+        return self.rows
+
+    def __repr__(self):
+        return f"ResultHandle({self.name!r}, rows={self.rows}, columns={len(self.preview.columns)})"
+
+    def to_frame(self):
+        """Return a copy of the full table"""
+        return self.store.load(self.key)
+
+    def iter_chunks(self, chunk_rows=DEFAULT_SPILL_CHUNK_ROWS):
+        """Yield the table as DataFrame chunks without loading a spilled table whole"""
+        return self.store.iter_chunks(self.key, chunk_rows)
+
+
+class ResultStore:
+    """Process-wide store of result tables with a memory budget
+
+    Every table is written to an uncompressed Arrow IPC file on local disk,
+    read back through a memory map. Recently used tables also stay in memory
+    until their combined size exceeds max_bytes; the least recently used ones
+    are then dropped from memory and served from their files. Callers keep a
+    ResultHandle, so a session holds only a preview of each result.
+    """
+
+    def __init__(self, root=None, max_bytes=DEFAULT_RESULT_MEMORY_BYTES, preview_rows=DEFAULT_PREVIEW_ROWS):
+        """
+        Args:
+            root: Spill directory (a per-process subdirectory is used)
+            max_bytes: Memory budget of tables kept in memory
+            preview_rows: Rows kept in each handle's preview
+        """
+        root = root or DEFAULT_RESULT_SPILL_DIR
+        os.makedirs(root, exist_ok=True)
+        self._remove_stale(root)
+        self.root = os.path.join(root, f"{os.getpid()}_{uuid.uuid4().hex[:8]}")
+        os.makedirs(self.root)
+        self.max_bytes = max_bytes
+        self.preview_rows = preview_rows
+        self.resident = OrderedDict()
+        self.resident_bytes = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+        atexit.register(shutil.rmtree, self.root, True)
+
+    @staticmethod
+    def _remove_stale(root):
+        cutoff = time.time() - _STALE_SPILL_SECONDS
+        for name in os.listdir(root):
+            path = os.path.join(root, name)
+            try:
+                if os.path.isdir(path) and os.path.getmtime(path) < cutoff:
+                    shutil.rmtree(path, ignore_errors=True)
+            except OSError:
+                continue
+
+    def _path(self, key):
+        return os.path.join(self.root, f"{key}.arrow")
+
+    def put(self, df, name="result"):
+        """Store a result table and return a handle to it
+
+        Args:
+            df: DataFrame (its index is not kept)
+            name: Table name, kept on the handle
+
+        Returns:
+            ResultHandle
+        """
+        if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1:
+            df = df.reset_index(drop=True)
+        key = frame_fingerprint(df)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry["refs"] += 1
+                nbytes = entry["nbytes"]
+        if entry is None:
+            nbytes = int(df.memory_usage(index=False, deep=True).sum())
+            table = _encode(df)
+            fd, temp_path = tempfile.mkstemp(dir=self.root, suffix=".partial")
+            try:
+                with os.fdopen(fd, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table, max_chunksize=DEFAULT_SPILL_CHUNK_ROWS)
+                # Moving the file into place and registering it under the lock keeps
+                # a concurrent release of the same table from deleting the new file
+                with self._lock:
+                    os.replace(temp_path, self._path(key))
+                    entry = self._entries.setdefault(key, {"refs": 0, "nbytes": nbytes})
+                    entry["refs"] += 1
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+            app_logger.debug("Stored result {} ({} rows, {} bytes in memory)", name, len(df), nbytes)
+        # The store keeps its own copy, so later edits by the caller cannot make it differ from the spilled file
+        self._keep(key, df.copy(), nbytes)
+        return ResultHandle(self, key, name, df.head(self.preview_rows).copy(), len(df), nbytes)
+
+    def _keep(self, key, df, nbytes):
+        """Keep df in memory as the most recently used table, evicting others over budget"""
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key not in self._entries:
+                return
+            if key in self.resident:
+                self.resident.move_to_end(key)
+                return
+            self.resident[key] = (df, nbytes)
+            self.resident_bytes += nbytes
+            while self.resident_bytes > self.max_bytes:
+                evicted, (_, evicted_bytes) = self.resident.popitem(last=False)
+                self.resident_bytes -= evicted_bytes
+                app_logger.debug("Evicted result {} ({} bytes) from memory", evicted, evicted_bytes)
+
+    def _read(self, key):
+        source = pa.memory_map(self._path(key))
+        reader = pa.ipc.open_file(source)
+        return reader, json.loads(reader.schema.metadata[_METADATA_KEY])
+
+    def load(self, key):
+        """Return a copy of the full table of key, from memory or its memory-mapped file"""
+        with self._lock:
+            if key not in self._entries:
+                raise KeyError(f"Result {key} is no longer stored")
+            resident = self.resident.get(key)
+            if resident is not None:
+                self.resident.move_to_end(key)
+                nbytes = None
+            else:
+                nbytes = self._entries[key]["nbytes"]
+        if resident is not None:
+            return resident[0].copy()
+        reader, layout = self._read(key)
+        df = _decode(reader.read_all(), layout)
+        self._keep(key, df, nbytes)
+        return df.copy()
+
+    def iter_chunks(self, key, chunk_rows=DEFAULT_SPILL_CHUNK_ROWS):
+        """Yield the table of key in chunks of at most chunk_rows rows
+
+        A table still in memory is sliced; a spilled one is decoded one
+        record batch at a time from its memory-mapped file. Chunks may share
+        memory with the stored table and must not be modified.
+        """
+        with self._lock:
+            if key not in self._entries:
+                raise KeyError(f"Result {key} is no longer stored")
+            resident = self.resident.get(key)
+        if resident is not None:
+            df = resident[0]
+            for start in range(0, max(len(df), 1), chunk_rows):
+                yield df.iloc[start:start + chunk_rows]
+            return
+        reader, layout = self._read(key)
+        for index in range(reader.num_record_batches):
+            batch = pa.Table.from_batches([reader.get_batch(index)])
+            for start in range(0, max(batch.num_rows, 1), chunk_rows):
+                yield _decode(batch.slice(start, chunk_rows), layout)
+
+    def release(self, key):
+        """Drop one reference to key; the table is deleted once no handle refers to it"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry["refs"] -= 1
+            if entry["refs"] > 0:
+                return
+            del self._entries[key]
+            resident = self.resident.pop(key, None)
+            if resident is not None:
+                self.resident_bytes -= resident[1]
+            # Unlinked under the lock, so a concurrent put cannot have replaced the file in between
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_result_store():
+    """Return the result store shared by all sessions of this process"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ResultStore()
+        return _default_store
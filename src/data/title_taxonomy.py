@@ -0,0 +1,249 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from ..logger import app_logger
+
+# Decision-maker titles grouped by business function
+TITLE_TAXONOMY = {
+    "executive": [
+        "founder", "co-founder", "chairman", "executive chairman", "president", "executive vice president",
+        "ceo", "chief executive officer", "group chief executive officer", "chief executive office",
+        "global chairman", "board member", "managing director", "group managing director",
+        "business unit director", "director", "associate director", "deputy director",
+        "svp", "senior vice president", "vp", "vice president", "avp", "assistant vice president",
+        "chief administrative officer", "chief transformation officer", "chief development officer",
+    ],
+    "operations": [
+        "coo", "chief operating officer", "group chief operating officer", "chief operations officer",
+        "head of operations", "vp of operations", "head of quality", "chief supply chain officer",
+        "chief supply chain and industrial officer", "chief merchandising officer",
+    ],
+    "finance": [
+        "cfo", "chief financial officer", "group chief financial officer", "group cfo",
+        "finance director", "head of finance", "vp of finance", "finance manager",
+        "head of finance & operations", "head of commercial banking", "global assurance leader",
+    ],
+    "technology": [
+        "cto", "chief technology officer", "chief innovation officer", "chief technology & strategy officer",
+        "chief digital officer", "chief information officer", "cio", "chief information architect",
+        "chief technology architect", "chief digital & information officer", "chief architect",
+        "vp of it and mis", "vp of engineering", "group it infrastructure manager",
+    ],
+    "data_security": [
+        "chief data officer", "chief analytics officer", "chief technology & chief analytics officer",
+        "chief information security officer", "group ciso",
+    ],
+    "people": [
+        "chro", "chief human resources officer", "chief people officer", "chief people and sustainability officer",
+        "chief human resources and corporate officer", "interim chief people and culture officer",
+        "group director of people & purpose", "head of talent", "head of talent acquisition",
+        "svp of people & culture", "head of hr", "head of hr & engagement",
+    ],
+    "product_customer": [
+        "cpo", "chief product officer", "chief product & customer officer", "chief customer officer",
+        "vp of product", "customer experience director", "customer experience manager", "svp customer services",
+    ],
+    "sales": [
+        "cro", "chief revenue officer", "chief commercial officer", "group chief commercial officer",
+        "group managing director, business development", "vp - sales", "svp of sales",
+        "business development manager", "senior business specialist", "director of insurance & partnerships",
+        "head of china & asia",
+    ],
+    "marketing": [
+        "cmo", "chief marketing officer", "group brand director", "marketing director", "head of marketing",
+        "marketing manager", "vp of global marketing", "vp of global demand generation",
+        "head of marketing and data", "head of membership and marketing", "head of event content",
+    ],
+    "legal_risk": [
+        "clo", "chief legal officer", "group general counsel", "general counsel", "chief legal counsel",
+        "chief risk officer", "chief compliance officer", "group chief risk and regulatory officer",
+        "group senior legal manager",
+    ],
+    "strategy": [
+        "chief strategy officer", "group strategy director", "vp strategy", "director of strategy",
+        "director of strategy & programmers", "strategic advisor", "chief growth officer",
+        "group corporate development director", "group advisory leader",
+    ],
+    "science_medical": [
+        "chief scientific officer", "chief science officer", "chief medical officer",
+        "lcms technical manager", "senior lc technical specialist",
+    ],
+    "communications": [
+        "group communication director", "vp of communications", "media enquiries lead",
+        "director of production and content",
+    ],
+    "sustainability_policy": [
+        "chief sustainability officer", "group esg", "sustainable development director", "chief policy officer",
+    ],
+}
+
+# Seniority levels in rank order; the priority of a title is the rank of its seniority
+SENIORITY_LEVELS = ["founder", "c_level", "board", "vp", "director", "head", "manager", "specialist"]
+
+# Compound spellings of taxonomy titles, expanded into the title's tokens before matching
+TITLE_TOKEN_ALIASES = {
+    "cofounder": ("co", "founder"),
+    "cofounders": ("co", "founder"),
+    "chairwoman": ("chairman",),
+    "chairperson": ("chairman",),
+    "vicepresident": ("vice", "president"),
+}
+
+_C_LEVEL_ACRONYMS = {"ceo", "coo", "cfo", "cto", "cio", "chro", "cpo", "cro", "cmo", "clo", "ciso"}
+
+TitleClass = namedtuple("TitleClass", ["title", "function", "seniority", "priority"])
+
+_EMPTY_CLASS = TitleClass(None, None, None, None)
+
+
+def _tokenize(text):
+    return tuple(re.findall(r"[a-z0-9]+", str(text).lower()))
+
+
+def seniority_for_title(title):
+    """Derive the seniority level of a taxonomy title
+
+    Args:
+        title: Lowercase title from TITLE_TAXONOMY
+
+    Returns:
+        One of SENIORITY_LEVELS
+    """
+    tokens = set(_tokenize(title))
+    if "founder" in tokens:
+        return "founder"
+    if "chief" in tokens or tokens & _C_LEVEL_ACRONYMS or title in ("president", "managing director",
+                                                                    "group managing director", "general counsel",
+                                                                    "group general counsel"):
+        return "c_level"
+    if tokens & {"chairman", "board"}:
+        return "board"
+    if tokens & {"vp", "svp", "avp", "president"}:
+        return "vp"
+    if "director" in tokens:
+        return "director"
+    if "head" in tokens:
+        return "head"
+    if tokens & {"manager", "lead", "leader"}:
+        return "manager"
+    return "specialist"
+
+
+def _build_entries():
+    entries = {}
+    for function, titles in TITLE_TAXONOMY.items():
+        for title in titles:
+            title = title.lower()
+            seniority = seniority_for_title(title)
+            entries[title] = TitleClass(title, function, seniority, SENIORITY_LEVELS.index(seniority) + 1)
+    return entries
+
+
+TITLE_ENTRIES = _build_entries()
+
+# Flat keyword list used for yes/no decision-maker filtering and TexAu keyword inputs
+DECISION_MAKER_KEYWORDS = list(TITLE_ENTRIES)
+
+
+class TitleClassifier:
+    """Classify headlines into function, seniority and priority using the title taxonomy
+
+    Titles are indexed by their first token, so a headline is classified by one
+    pass over its own tokens rather than a scan of every title. Results are
+    memoized per distinct headline for the lifetime of the process.
+    """
+
+    def __init__(self, entries=None):
+        self.entries = entries or TITLE_ENTRIES
+        self.token_index = {}
+        for title, entry in self.entries.items():
+            tokens = _tokenize(title)
+            if tokens:
+                self.token_index.setdefault(tokens[0], []).append((tokens, entry))
+        self.classify = lru_cache(maxsize=200_000)(self._classify)
+        app_logger.debug("Title classifier indexed {} titles under {} tokens", len(self.entries), len(self.token_index))
+
+    @staticmethod
+    def _better(candidate, best):
+        if best is None:
+            return True
+        return (candidate.priority, -len(candidate.title)) < (best.priority, -len(best.title))
+
+    def _classify(self, headline):
+        """Classify a single headline, returning a TitleClass (all None when no title matched)
+
+        Titles match whole tokens only, so "doctor" is not a "cto" and "vpn"
+        is not a "vp"; compound spellings such as "cofounder" are expanded
+        through TITLE_TOKEN_ALIASES first. A title nested inside a longer
+        matched title ("president" in "vice president") is not a match of
+        its own. Priority only decides between the remaining, non-nested
+        matches.
+        """
+        tokens = tuple(
+            part for token in _tokenize(headline) for part in TITLE_TOKEN_ALIASES.get(token, (token,))
+        )
+        matches = []
+        for i, token in enumerate(tokens):
+            for title_tokens, entry in self.token_index.get(token, ()):
+                if tokens[i:i + len(title_tokens)] == title_tokens:
+                    matches.append((i, i + len(title_tokens), entry))
+        best = None
+        for start, end, entry in matches:
+            nested = any(
+                other_start <= start and end <= other_end and other_end - other_start > end - start
+                for other_start, other_end, _ in matches
+            )
+            if not nested and self._better(entry, best):
+                best = entry
+        return best or _EMPTY_CLASS
+
+    def classify_series(self, series, prefix="title_"):
+        """Classify a column of headlines
+
+        Each distinct headline is classified once; rows are filled by position.
+
+        Args:
+            series: Pandas Series of headlines
+            prefix: Prefix for the output column names
+
+        Returns:
+            DataFrame with <prefix>match, <prefix>function, <prefix>seniority
+            and <prefix>priority columns, aligned with the input index
+        """
+        codes, uniques = pd.factorize(series.fillna("").astype(str), use_na_sentinel=False)
+        classes = [self.classify(headline) for headline in uniques]
+        columns = {}
+        for position, field in enumerate(["match", "function", "seniority", "priority"]):
+            values = np.array([c[position] for c in classes], dtype=object)
+            columns[f"{prefix}{field}"] = values[codes] if len(values) else values
+        result = pd.DataFrame(columns, index=series.index)
+        result[f"{prefix}priority"] = pd.to_numeric(result[f"{prefix}priority"], errors="coerce").astype("Int64")
+        return result
+
+
+_default_classifier = None
+
+
+def get_classifier():
+    """Return the process-wide TitleClassifier, so its cache is shared across runs"""
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = TitleClassifier()
+    return _default_classifier
+
+
+def classify_titles(df, column, prefix="title_"):
+    """Append title classification columns to a DataFrame
+
+    Args:
+        df: DataFrame containing a headline/title column
+        column: Name of the column to classify
+        prefix: Prefix for the classification columns
+
+    Returns:
+        Copy of df with classification columns appended
+    """
+    classes = get_classifier().classify_series(df[column], prefix=prefix)
+    return pd.concat([df.drop(columns=[c for c in classes.columns if c in df.columns]), classes], axis=1)
@@ -1,17 +1,54 @@
 import time
 import streamlit as st
-import json
 import pandas as pd
-import io
+import numpy as np
 import os
 import sys
 import requests
 import time
 from src.config import Config
 from src.api.linkedin_api import LinkedInAPI
+from src.api.sharded_search import ShardedPostSearch, ShardedEmployeeExport
+from src.api.company_enrichment import CompanyEnricher
 from src.data.data_processor import DataProcessor
+from src.data.title_taxonomy import DECISION_MAKER_KEYWORDS, classify_titles
+from src.data.linkedin_urls import shared_url_index, profile_key, company_key
+from src.data.dataset_store import DatasetStore
+from src.data.export_formats import export_filename, export_mime
+from src.data.export_cache import export_key, shared_export_cache
+from src.data.output_manager import OutputManager
+from src.data.result_store import ResultHandle, get_result_store
+from src.data.ingestion import UPLOAD_TYPES, read_upload
+from src.data.record_flattener import RecordFlattener, flatten_payloads
+from src.data.entity_store import EntityStore, DEFAULT_FRESHNESS_DAYS
+from src.data.keyword_monitor import KeywordMonitorStore
+from src.data.engagement_index import EngagementIndex, INTERACTION_TABLES, INTERACTION_TYPES
+from src.data.lead_scoring import LeadScorer
+from src.data.person_dedupe import dedupe_people
 from src.logger import app_logger
 
+# Stored result types whose rows are people, in order of preference for the People Directory
+PERSON_RESULT_TYPES = [
+    "people_search", "batch_profiles", "company_company_employees", "company_personnel",
+    "post_search", "keyword_posts", "keyword_monitor_posts",
+]
+
+# Columns shown for batch profile results; the export keeps every column
+BATCH_DISPLAY_COLUMNS = [
+    "lead_rank", "lead_score", "liPublicProfileURL", "profile_firstName", "profile_lastName", "profile_headline",
+    "profile_companyName", "profile_jobTitle", "profile_headcountRange", "profile_locationArea",
+    "profile_connectionDegree", "profile_isPremium", "company_name", "company_industry",
+]
+
+# Help of the sharded search option; shards vary only the keyword and, unless fixed, the sort order
+SHARDED_SEARCH_HELP = (
+    "Run one search per keyword variant and sort order (date posted, relevance) concurrently and merge the posts "
+    "without duplicates. Without keyword variants this is at most two overlapping runs, or one when Sort By is set."
+)
+
+EXPORT_FORMAT_LABELS = {"excel": "Excel", "csv": "CSV", "jsonl": "JSON Lines", "parquet": "Parquet"}
+
+
 class LinkedInExtractorApp:
     """Main Streamlit application class for LinkedIn Data Extractor"""
     
@@ -19,6 +56,11 @@ class LinkedInExtractorApp:
         """Initialize the application"""
         self.linkedin_api = LinkedInAPI()
         self.data_processor = DataProcessor()
+        self.dataset_store = DatasetStore()
+        self.entity_store = EntityStore()
+        self.monitor_store = KeywordMonitorStore()
+        self.output_manager = OutputManager()
+        self.result_store = get_result_store()
         app_logger.debug("Initializing LinkedIn Extractor App")
         
     def setup_page(self):
@@ -531,6 +573,9 @@ class LinkedInExtractorApp:
             ("Company Extraction", "Extract data from a LinkedIn company page"),
             ("Profile Extraction (by Keyword)", "Extract LinkedIn profiles by keyword search"),
             ("Post Extraction (By Keyword)", "End-to-end workflow: search, extract, merge, filter, export"),
+            ("Keyword Monitors", "Re-run saved keyword searches and keep only posts not seen before"),
+            ("Engagement Insights", "Find the people engaging across all extracted posts"),
+            ("People Directory", "Combine people from all stored results into one record per person"),
             ("Profile Batch Extraction", "Upload an Excel file and extract profile data for all listed URLs"),
             ("Comment Generator", "Generate comments for post content from Excel file"),
         ]
@@ -574,6 +619,152 @@ class LinkedInExtractorApp:
         connected_account_id = "68340dc4e7bb1f6b5af36e98"
         return automation_id, connected_account_id
 
+    def _sharded_post_search(self, api_inputs, keyword_variants_text=""):
+        """Run a post search as concurrent shards, show the per-shard report and return the merged posts"""
+        searcher = ShardedPostSearch(self.linkedin_api, self._get_automation_and_account("keyword search")[1])
+        keyword_variants = [line.strip() for line in keyword_variants_text.splitlines() if line.strip()]
+        total = api_inputs.get("maxCountPostSearch", 10)
+        shards = searcher.plan_shards(api_inputs, total, keyword_variants=keyword_variants)
+        posts_df, report_df = searcher.run(shards, total=total)
+        if len(posts_df) < total:
+            st.warning(
+                f"Found {len(posts_df)} unique posts of {total} requested: the shards returned "
+                f"{int(report_df['returned'].sum())} posts, of which the rest were duplicates or not available."
+            )
+        with st.expander(f"Search shards ({len(shards)})", expanded=False):
+            st.dataframe(self.clean_dataframe_for_streamlit(report_df), use_container_width=True)
+        return posts_df
+
+    def _download_tables(self, tables, file_stem, label, key, job_id=None):
+        """Format picker plus download button for one or several result tables
+
+        The tables are handed to the process-wide result store first, so the
+        session keeps only result handles (a preview each) rather than the
+        full frames, which may be spilled to disk under memory pressure.
+
+        Args:
+            tables: Dict of table name to DataFrame or ResultHandle
+            file_stem: Download file name without extension
+            label: Download button label
+            key: Unique widget key prefix
+            job_id: When given, the export is also kept as a file of this output job and served from it
+        """
+        handles = {
+            name: df if isinstance(df, ResultHandle) else self.result_store.put(df, name)
+            for name, df in tables.items() if df is not None and not df.empty
+        }
+        self._download_handles(handles, file_stem, label, key, job_id)
+
+    @st.fragment
+    def _download_handles(self, handles, file_stem, label, key, job_id=None):
+        """Download widgets of _download_tables; runs as a fragment so changing the format does not rerun the page"""
+        format_col, compression_col = st.columns(2)
+        with format_col:
+            export_format = st.selectbox(
+                "Export format", list(EXPORT_FORMAT_LABELS), format_func=EXPORT_FORMAT_LABELS.get, key=f"{key}_format"
+            )
+        with compression_col:
+            compression = st.selectbox(
+                "Compression", [None, "gzip", "zstd"], format_func=lambda c: c or "none",
+                key=f"{key}_compression", disabled=export_format == "excel"
+            )
+        if export_format == "excel":
+            compression = None
+
+        zipped = export_format != "excel" and len(handles) > 1
+        file_name = export_filename(file_stem, export_format, compression, zipped=zipped)
+        mime = export_mime(export_format, zipped=zipped)
+
+        # The export is built only when the button is clicked and its bytes are
+        # cached by content, so reruns and repeated clicks on an unchanged
+        # result are served from memory without rebuilding or reading the file
+        cache = shared_export_cache()
+
+        def build():
+            # Spilled tables are streamed from disk chunk by chunk
+            tables = {name: handle.iter_chunks() for name, handle in handles.items()}
+            data = self.data_processor.export_tables(tables, export_format, compression=compression)[0]
+            if job_id is not None:
+                # Kept as a job output too; the download itself is served from the built bytes
+                self.output_manager.write_bytes(job_id, file_name, data)
+            return data, len(data)
+
+        def export_data():
+            return cache.get_or_create(export_key(handles, export_format, compression, job_id), build)
+
+        st.download_button(
+            label=label, data=export_data, file_name=file_name, mime=mime, key=f"{key}_download", on_click="ignore"
+        )
+
+    def _show_employee_shards(self, report_df):
+        failed = int((report_df["status"] != "ok").sum())
+        label = f"Employee export shards ({len(report_df)}, {failed} failed)" if failed else f"Employee export shards ({len(report_df)})"
+        with st.expander(label, expanded=bool(failed)):
+            st.dataframe(self.clean_dataframe_for_streamlit(report_df), use_container_width=True)
+
+    def _sharded_employee_export(self, company_url, connected_account_id, shard_size):
+        """Export company employees in concurrent title-group shards and keep the run for retries"""
+        exporter = ShardedEmployeeExport(self.linkedin_api, connected_account_id)
+        shards = exporter.plan_shards(DECISION_MAKER_KEYWORDS, shard_size=shard_size)
+        employees_df, report_df = exporter.run(company_url, shards)
+        st.session_state["employee_export_shards"] = {
+            "company_url": company_url,
+            "connected_account_id": connected_account_id,
+            "shards": shards,
+            # Only a handle is kept in the session; the table lives in the result store
+            "employees": self.result_store.put(employees_df, "company_employees"),
+            "report_df": report_df,
+        }
+        self._show_employee_shards(report_df)
+        return employees_df
+
+    def _retry_employee_shards(self, company_url):
+        """Offer to re-run only the failed shards of the last sharded employee export for this company"""
+        state = st.session_state.get("employee_export_shards")
+        if not state or state["company_url"] != company_url:
+            return
+        failed = int((state["report_df"]["status"] != "ok").sum())
+        if not failed or not st.button(f"Retry {failed} failed employee shard(s)"):
+            return
+        with st.spinner("Retrying failed employee shards..."):
+            exporter = ShardedEmployeeExport(self.linkedin_api, state["connected_account_id"])
+            employees_df, report_df = exporter.retry_failed(
+                company_url, state["shards"], state["employees"].to_frame(), state["report_df"]
+            )
+        state.update(employees=self.result_store.put(employees_df, "company_employees"), report_df=report_df)
+        self._show_employee_shards(report_df)
+        if employees_df.empty:
+            st.warning("No employees found.")
+            return
+        employees_df = self.remove_empty_columns(employees_df)
+        self._record_results("company", {"company_employees": employees_df}, source=company_url)
+        st.subheader(f"Company Employees ({len(employees_df)})")
+        st.dataframe(self.clean_dataframe_for_streamlit(employees_df), use_container_width=True)
+        self._download_tables({"company_employees": employees_df}, "linkedin_company_employees", "Download Company Employees", key="company_employees")
+
+    def _lead_scoring_controls(self, key, default_min_score=40):
+        """Lead scoring settings shared by the pipeline pages; returns (LeadScorer, minimum score)"""
+        with st.expander("Lead Scoring", expanded=False):
+            min_score = st.slider(
+                "Minimum lead score", min_value=0, max_value=100, value=default_min_score, key=f"{key}_min_score",
+                help="Leads are scored 0-100 from title seniority, company headcount, engagement, connection degree, location and premium status"
+            )
+            target_locations = st.text_input(
+                "Target locations (comma-separated, optional)", key=f"{key}_target_locations",
+                help="Leads located in any of these places score higher"
+            )
+        return LeadScorer(target_locations=target_locations.split(",")), min_score
+
+    def _record_results(self, result_type, data, source=None):
+        """Append extraction results to the local dataset store without interrupting the page"""
+        try:
+            if isinstance(data, dict):
+                self.dataset_store.append_tables(result_type, data, source=source)
+            else:
+                self.dataset_store.append(result_type, data, source=source)
+        except Exception as e:
+            app_logger.warning("Could not store {} results: {}", result_type, str(e))
+
     def clean_dataframe_for_streamlit(self, df):
         """
         Clean DataFrame to prevent PyArrow serialization errors in Streamlit.
@@ -628,37 +819,57 @@ class LinkedInExtractorApp:
         if df.empty:
             return df
         
-        # Remove columns where all values are empty (NaN or empty string)
-        df_cleaned = df.dropna(axis=1, how='all').loc[:, ~(df == '').all(axis=0)]
-        
         # Clean the DataFrame for Streamlit/PyArrow compatibility
-        df_cleaned = self.clean_dataframe_for_streamlit(df_cleaned)
-        
-        return df_cleaned
+        return self.clean_dataframe_for_streamlit(self.drop_empty_columns(df))
+
+    @staticmethod
+    def drop_empty_columns(df):
+        """Remove columns where all values are empty (NaN or empty string), without cleaning"""
+        if df.empty:
+            return df
+        df = df.dropna(axis=1, how='all')
+        return df.loc[:, ~(df == '').all(axis=0)]
+
+    def _rank_projected(self, raw_df, scorer, min_score, display_columns, title_column=None):
+        """Rank leads using only the columns scoring and display need
+
+        Title classification, scoring and Streamlit cleaning run on a narrow
+        projection; the full-width rows are only gathered for the export.
+
+        Args:
+            raw_df: Full-width result DataFrame
+            scorer: LeadScorer
+            min_score: Drop leads scoring below this (0-100)
+            display_columns: Columns shown on the page, in order
+            title_column: Headline column to classify before scoring
+
+        Returns:
+            Tuple of (cleaned display DataFrame, ranked full-width export DataFrame)
+        """
+        needed = ([title_column] if title_column else []) + list(scorer.signal_columns(raw_df).values()) + display_columns
+        needed = list(dict.fromkeys(col for col in needed if col in raw_df.columns))
+        working = raw_df[needed].assign(_row=np.arange(len(raw_df)))
+        if title_column in working.columns:
+            working = classify_titles(working, title_column)
+        ranked = scorer.rank(working, min_score=min_score)
+
+        rows = ranked.pop("_row").to_numpy()
+        derived = ranked.drop(columns=needed + ["lead_rank"])
+        export_df = pd.concat([
+            ranked[["lead_rank"]],
+            raw_df.iloc[rows].reset_index(drop=True),
+            derived.drop(columns=[col for col in derived.columns if col in raw_df.columns]),
+        ], axis=1)
+        display_df = self.clean_dataframe_for_streamlit(ranked[[col for col in display_columns if col in ranked.columns]])
+        return display_df, export_df
 
     def expand_profiles_to_df(self, profiles):
         """
         Robustly expand a list of profile results (which may be JSON strings or dicts, or lists of dicts)
         into a columnar DataFrame. Handles nested lists and mixed types.
         """
-        if not profiles:
-            return pd.DataFrame()
-        expanded = []
-        for p in profiles:
-            if isinstance(p, str):
-                try:
-                    obj = json.loads(p)
-                except Exception:
-                    continue
-            else:
-                obj = p
-            if isinstance(obj, list):
-                expanded.extend(obj)
-            else:
-                expanded.append(obj)
-        
-        df = pd.json_normalize(expanded)
-        return self.clean_dataframe_for_streamlit(df)
+        # Cleaning for display is left to the columns that are shown
+        return flatten_payloads(profiles)
 
     def keyword_search_page(self):
         st.markdown("<div class='section-header'>Search LinkedIn Posts by Keywords</div>", unsafe_allow_html=True)
@@ -693,6 +904,11 @@ class LinkedInExtractorApp:
                     "Post Extraction Limit (Max. 2500)",
                     min_value=1, max_value=2500, value=10, step=1, format="%d"
                 )
+            sharded_search = st.checkbox(
+                "Sharded search",
+                help=SHARDED_SEARCH_HELP
+            )
+            keyword_variants = st.text_area("Keyword variants (one per line, sharded search only)", key="keyword_search_variants")
         
         if st.button("Extract Posts", help="Start extraction based on your search criteria"):
             if not search_input:
@@ -710,25 +926,30 @@ class LinkedInExtractorApp:
                         api_inputs["postedBy"] = {"1st CONNECTION": "first", "ME": "me", "PEOPLE YOU FOLLOW": "following"}[posted_by]
                     if extract_limit:
                         api_inputs["maxCountPostSearch"] = int(extract_limit)
-                    result = self.linkedin_api.run_automation(
-                        name="Post Search Export",
-                        description="Export LinkedIn posts by keywords",
-                        automation_id=automation_id,
-                        connected_account_id=connected_account_id,
-                        timezone="Asia/Kolkata",
-                        inputs=api_inputs
-                    )
-                    data = result.get("data", {})
-                    execution_id = data.get("id") or data.get("workflowId")
-                    final_result = None
-                    if execution_id:
-                        for _ in range(120):
-                            final_result = self.linkedin_api.get_execution_result(execution_id)
-                            if final_result.get("data"):
-                                break
-                            time.sleep(1)
-                    if final_result and "data" in final_result:
-                        df = pd.json_normalize(final_result["data"])
+                    df = None
+                    if sharded_search:
+                        df = self._sharded_post_search(api_inputs, keyword_variants)
+                    else:
+                        result = self.linkedin_api.run_automation(
+                            name="Post Search Export",
+                            description="Export LinkedIn posts by keywords",
+                            automation_id=automation_id,
+                            connected_account_id=connected_account_id,
+                            timezone="Asia/Kolkata",
+                            inputs=api_inputs
+                        )
+                        data = result.get("data", {})
+                        execution_id = data.get("id") or data.get("workflowId")
+                        final_result = None
+                        if execution_id:
+                            for _ in range(120):
+                                final_result = self.linkedin_api.get_execution_result(execution_id)
+                                if final_result.get("data"):
+                                    break
+                                time.sleep(1)
+                        if final_result and "data" in final_result:
+                            df = self.data_processor.normalize_records(final_result["data"])
+                    if df is not None and not df.empty:
                         df = self.remove_empty_columns(df)
                         
                         # Display metrics
@@ -740,17 +961,8 @@ class LinkedInExtractorApp:
                         """, unsafe_allow_html=True)
                         
                         st.dataframe(self.clean_dataframe_for_streamlit(df), use_container_width=True)
-                        excel_buffer = io.BytesIO()
-                        with pd.ExcelWriter(excel_buffer, engine="openpyxl") as writer:
-                            if not df.empty:
-                                df.to_excel(writer, sheet_name="keyword_posts", index=False)
-                        excel_buffer.seek(0)
-                        st.download_button(
-                            label="Download Excel Report",
-                            data=excel_buffer.getvalue(),
-                            file_name="linkedin_keyword_posts.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                        )
+                        self._record_results("keyword_posts", df, source=search_input)
+                        self._download_tables({"keyword_posts": df}, "linkedin_keyword_posts", "Download Report", key="keyword_posts")
                     else:
                         st.warning("No posts found matching the search criteria.")
 
@@ -764,6 +976,7 @@ class LinkedInExtractorApp:
         
         if st.button("Extract Post Data"):
             if post_url and "linkedin.com" in post_url:
+                post_url = shared_url_index().canonicalize(post_url)
                 try:
                     app_logger.info("Extracting data for post: {}", post_url)
                     with st.spinner("Extracting post data..."):
@@ -846,21 +1059,14 @@ class LinkedInExtractorApp:
                                     if not comments_df.empty:
                                         st.subheader(f"Comments Export ({len(comments_df)})")
                                         st.dataframe(self.clean_dataframe_for_streamlit(comments_df), use_container_width=True)
-                            # Download as Excel (multi-sheet)
-                            excel_buffer = io.BytesIO()
-                            with pd.ExcelWriter(excel_buffer, engine="openpyxl") as writer:
-                                for sheet_name, df in dfs.items():
-                                    if not df.empty:
-                                        df.to_excel(writer, sheet_name=sheet_name, index=False)
-                            excel_buffer.seek(0)
-                            if st.download_button(
-                                label="Download Complete Report",
-                                data=excel_buffer.getvalue(),
-                                file_name=f"linkedin_post_data.xlsx",
-                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                            ):
-                                filepath = self.data_processor.export_to_excel(dfs, "post")
-                                st.markdown(f"<p class='success-msg'>Report generated successfully</p>", unsafe_allow_html=True)
+                            engagers = {name: dfs.get(name) for name in INTERACTION_TABLES}
+                            if sum(df is not None and not df.empty for df in engagers.values()) > 1:
+                                dfs["people"] = dedupe_people(engagers)
+                                st.subheader(f"Unique People Engaging ({len(dfs['people'])})")
+                                st.dataframe(self.clean_dataframe_for_streamlit(dfs["people"]), use_container_width=True)
+                            self._record_results("post", dfs, source=post_url)
+                            # Download in the chosen format (Excel: one sheet per table)
+                            self._download_tables(dfs, "linkedin_post_data", "Download Complete Report", key="post_data")
                         else:
                             st.warning("No data found for this post URL.")
                 except Exception as e:
@@ -891,6 +1097,7 @@ class LinkedInExtractorApp:
         
         if st.button("Extract Profile Data"):
             if profile_url and "linkedin.com/in/" in profile_url:
+                profile_url = shared_url_index().canonicalize(profile_url)
                 try:
                     app_logger.info("Extracting data for profile: {}", profile_url)
                     with st.spinner("Extracting profile data..."):
@@ -1022,21 +1229,9 @@ class LinkedInExtractorApp:
                                     st.subheader(f"Profile Posts ({len(posts_df)})")
                                     st.dataframe(self.clean_dataframe_for_streamlit(posts_df), use_container_width=True)
                                     all_dfs["profile_posts"] = posts_df
-                    # Download as Excel (multi-sheet)
-                    excel_buffer = io.BytesIO()
-                    with pd.ExcelWriter(excel_buffer, engine="openpyxl") as writer:
-                        for sheet_name, df in all_dfs.items():
-                            if not df.empty:
-                                df.to_excel(writer, sheet_name=sheet_name, index=False)
-                    excel_buffer.seek(0)
-                    if st.download_button(
-                        label="Download Complete Profile Report",
-                        data=excel_buffer.getvalue(),
-                        file_name=f"linkedin_profile_data.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    ):
-                        filepath = self.data_processor.export_to_excel(all_dfs, "profile")
-                        st.markdown(f"<p class='success-msg'>Profile report generated successfully</p>", unsafe_allow_html=True)
+                    self._record_results("profile", all_dfs, source=profile_url)
+                    # Download in the chosen format (Excel: one sheet per table)
+                    self._download_tables(all_dfs, "linkedin_profile_data", "Download Complete Profile Report", key="profile_data")
                 except Exception as e:
                     app_logger.error("Error in profile extraction: {}", str(e))
                     st.error(f"An error occurred: {str(e)}")
@@ -1048,33 +1243,60 @@ class LinkedInExtractorApp:
         
         company_url = st.text_input("LinkedIn Company URL", placeholder="https://www.linkedin.com/company/...")
         extract_employees = st.checkbox("Extract company employees")
+        sharded_employees = False
+        if extract_employees:
+            col1, col2 = st.columns(2)
+            with col1:
+                sharded_employees = st.checkbox(
+                    "Sharded employee export",
+                    help="Split the decision-maker title list into groups exported concurrently; failed groups can be retried on their own"
+                )
+            with col2:
+                titles_per_shard = st.number_input("Titles per shard", min_value=5, max_value=len(DECISION_MAKER_KEYWORDS), value=20, step=5)
         extract_activity = st.checkbox("Extract recent posts/activity")
         
         if st.button("Extract Company Data"):
             if company_url and "linkedin.com/company/" in company_url:
+                # Numeric company IDs resolve to the vanity slug of companies scraped before
+                url_index = shared_url_index()
+                company_url = url_index.canonicalize(company_url)
                 try:
                     app_logger.info("Extracting data for company: {}", company_url)
                     with st.spinner("Extracting company data..."):
                         # Use correct automation ID and input key for LinkedIn Company Scraper
                         automation_id = "63f742037022e05c11a9440e"  # LinkedIn Company Scraper
                         connected_account_id = self._get_automation_and_account("company extraction")[1]
-                        result = self.linkedin_api.run_automation(
-                            name="Company Extraction",
-                            description="Extract LinkedIn company data",
-                            automation_id=automation_id,
-                            connected_account_id=connected_account_id,
-                            timezone="Asia/Kolkata", 
-                            inputs={"liCompanyUrl": company_url}
-                        )
-                        data = result.get("data", {})
-                        execution_id = data.get("id") or data.get("workflowId")
+                        entity_id = company_key(company_url)
+                        fresh_companies, _ = self.entity_store.split_by_freshness("company", [entity_id])
                         final_result = None
-                        if execution_id:
-                            for _ in range(120):
-                                final_result = self.linkedin_api.get_execution_result(execution_id)
-                                if final_result.get("data"):
-                                    break
-                                time.sleep(1)
+                        if entity_id in fresh_companies:
+                            st.info(f"Using company data scraped within the last {DEFAULT_FRESHNESS_DAYS:g} days.")
+                            final_result = {"data": fresh_companies[entity_id]}
+                        else:
+                            result = self.linkedin_api.run_automation(
+                                name="Company Extraction",
+                                description="Extract LinkedIn company data",
+                                automation_id=automation_id,
+                                connected_account_id=connected_account_id,
+                                timezone="Asia/Kolkata", 
+                                inputs={"liCompanyUrl": company_url}
+                            )
+                            data = result.get("data", {})
+                            execution_id = data.get("id") or data.get("workflowId")
+                            if execution_id:
+                                for _ in range(120):
+                                    final_result = self.linkedin_api.get_execution_result(execution_id)
+                                    if final_result.get("data"):
+                                        break
+                                    time.sleep(1)
+                        changes_df = pd.DataFrame()
+                        if final_result and final_result.get("data") and entity_id not in fresh_companies:
+                            url_index.register_company(final_result["data"], company_url)
+                            entity_id = company_key(url_index.canonicalize(company_url))
+                            try:
+                                changes_df = self.entity_store.upsert_with_changes("company", [(entity_id, final_result["data"])])
+                            except Exception as e:
+                                app_logger.warning("Could not detect company changes: {}", str(e))
                         dfs = {}
                         if final_result and "data" in final_result:
                             dfs = self.data_processor.convert_to_dataframe(final_result, "company")
@@ -1085,56 +1307,62 @@ class LinkedInExtractorApp:
                             if not dfs["personnel"].empty:
                                 st.subheader("Key Personnel")
                                 st.dataframe(self.clean_dataframe_for_streamlit(dfs["personnel"]), use_container_width=True)
+                            if not changes_df.empty:
+                                st.subheader("Changes Since Last Scrape")
+                                st.dataframe(self.clean_dataframe_for_streamlit(changes_df), use_container_width=True)
+                                dfs["changes"] = changes_df
                         
                     # Optionally extract company employees
                     if extract_employees:
                         with st.spinner("Extracting company employees..."):
-                            # Predefined keywords for decision makers and key positions
-                            decision_maker_keywords = "founder,co-founder,chairman,executive chairman,president,executive vice president,ceo,chief executive officer,group chief executive officer,chief executive office,coo,chief operating officer,group chief operating officer,cfo,chief financial officer,group chief financial officer,cto,chief technology officer,chief innovation officer,chief technology & strategy officer,chief digital officer,chief information officer,cio,chief information architect,chief technology architect,chief digital & information officer,chro,chief human resources officer,chief people officer,chief people and sustainability officer,chief human resources and corporate officer,interim chief people and culture officer,group director of people & purpose,head of talent,head of talent acquisition,svp of people & culture,cpo,chief product officer,chief product & customer officer,chief customer officer,chief merchandising officer,chief supply chain officer,chief supply chain and industrial officer,cro,chief revenue officer,chief commercial officer,group chief commercial officer,group managing director, business development,vp - sales,svp of sales,cmo,chief marketing officer,group brand director,marketing director,head of marketing,marketing manager,vp of global marketing,clo,chief legal officer,group general counsel,general counsel,chief legal counsel,chief risk officer,chief compliance officer,group chief risk and regulatory officer,chief strategy officer,group strategy director,chief analytics officer,vp strategy,director of strategy,strategic advisor,chief growth officer,group corporate development director,finance director,head of finance,group cfo,vp of finance,finance manager,chief data officer,chief information security officer,group ciso,group it infrastructure manager,chief scientific officer,chief medical officer,vp of it and mis,vp of engineering,chief technology & chief analytics officer,lcms technical manager,senior lc technical specialist,group communication director,vp of communications,media enquiries lead,director of production and content,chief sustainability officer,group esg,sustainable development director,chief policy officer,head of operations,vp of operations,head of membership and marketing,customer experience manager,chief operations officer,head of quality,svp customer services,group senior legal manager,board member,managing director,group managing director,business unit director,director,director of strategy & programmers,associate director,deputy director,svp,senior vice president,vp,vice president,avp,assistant vice president,head of hr,head of hr & engagement,head of finance & operations,head of china & asia,head of event content,head of marketing and data,head of commercial banking,chief administrative officer,chief development officer,chief transformation officer,chief science officer,group advisory leader,global assurance leader,global chairman,vp of product,vp of global demand generation,customer experience director,senior business specialist,business development manager,director of insurance & partnerships"
+                            employees_df = pd.DataFrame()
+                            if sharded_employees:
+                                employees_df = self._sharded_employee_export(company_url, connected_account_id, titles_per_shard)
+                            else:
+                                # Predefined keywords for decision makers and key positions
+                                decision_maker_keywords = ",".join(DECISION_MAKER_KEYWORDS)
                             
-                            employees_automation_id = "645e38f5f74978ad3262f00d"  # LinkedIn Company Employees Export
-                            employees_inputs = {
-                                "liCompanyUrl": company_url,
-                                "keyword": decision_maker_keywords  # Send predefined keywords in backend
-                            }
+                                employees_automation_id = "645e38f5f74978ad3262f00d"  # LinkedIn Company Employees Export
+                                employees_inputs = {
+                                    "liCompanyUrl": company_url,
+                                    "keyword": decision_maker_keywords  # Send predefined keywords in backend
+                                }
                             
-                            employees_result = self.linkedin_api.run_automation(
-                                name="Company Employees Export",
-                                description="Export LinkedIn company employees",
-                                automation_id=employees_automation_id,
-                                connected_account_id=connected_account_id,
-                                timezone="Asia/Kolkata",
-                                inputs=employees_inputs
-                            )
-                            employees_data = employees_result.get("data", {})
-                            employees_execution_id = employees_data.get("id") or employees_data.get("workflowId")
-                            employees_final_result = None
-                            if employees_execution_id:
-                                for _ in range(600):  # wait up to 10 minutes
-                                    employees_final_result = self.linkedin_api.get_execution_result(employees_execution_id)
-                                    if employees_final_result.get("data"):
-                                        break
-                                    time.sleep(1)
-                            if employees_final_result and "data" in employees_final_result:
-                                employees_data = employees_final_result["data"]
-                                if isinstance(employees_data, list):
-                                    employees_df = pd.json_normalize(employees_data)
-                                elif isinstance(employees_data, dict):
-                                    employees_df = pd.json_normalize([employees_data])
+                                employees_result = self.linkedin_api.run_automation(
+                                    name="Company Employees Export",
+                                    description="Export LinkedIn company employees",
+                                    automation_id=employees_automation_id,
+                                    connected_account_id=connected_account_id,
+                                    timezone="Asia/Kolkata",
+                                    inputs=employees_inputs
+                                )
+                                employees_data = employees_result.get("data", {})
+                                employees_execution_id = employees_data.get("id") or employees_data.get("workflowId")
+                                employees_final_result = None
+                                if employees_execution_id:
+                                    for _ in range(600):  # wait up to 10 minutes
+                                        employees_final_result = self.linkedin_api.get_execution_result(employees_execution_id)
+                                        if employees_final_result.get("data"):
+                                            break
+                                        time.sleep(1)
+                                if employees_final_result and "data" in employees_final_result:
+                                    employees_data = employees_final_result["data"]
+                                    if isinstance(employees_data, (list, dict)):
+                                        employees_df = self.data_processor.normalize_records(employees_data)
+                            if not employees_df.empty:
                                 employees_df = self.remove_empty_columns(employees_df)
-                                if not employees_df.empty:
-                                    st.subheader(f"Company Employees ({len(employees_df)})")
-                                    
-                                    # Display metrics
-                                    st.markdown(f"""
-                                    <div class='metric-display'>
-                                        <div class='metric-value'>{len(employees_df)}</div>
-                                        <div class='metric-label'>Decision-Maker Employees Found</div>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                    
-                                    st.dataframe(self.clean_dataframe_for_streamlit(employees_df), use_container_width=True)
-                                    dfs["company_employees"] = employees_df
+                                st.subheader(f"Company Employees ({len(employees_df)})")
+                                
+                                # Display metrics
+                                st.markdown(f"""
+                                <div class='metric-display'>
+                                    <div class='metric-value'>{len(employees_df)}</div>
+                                    <div class='metric-label'>Decision-Maker Employees Found</div>
+                                </div>
+                                """, unsafe_allow_html=True)
+                                
+                                st.dataframe(self.clean_dataframe_for_streamlit(employees_df), use_container_width=True)
+                                dfs["company_employees"] = employees_df
                     
                     # Optionally extract company recent posts/activity
                     if extract_activity:
@@ -1186,20 +1414,8 @@ class LinkedInExtractorApp:
                     
                     # Export button
                     if dfs:
-                        excel_buffer = io.BytesIO()
-                        with pd.ExcelWriter(excel_buffer, engine="openpyxl") as writer:
-                            for sheet_name, df in dfs.items():
-                                if not df.empty:
-                                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-                        excel_buffer.seek(0)
-                        if st.download_button(
-                            label="Download Company Report",
-                            data=excel_buffer.getvalue(),
-                            file_name=f"linkedin_company_data.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                        ):
-                            filepath = self.data_processor.export_to_excel(dfs, "company")
-                            st.markdown(f"<p class='success-msg'>Company report generated successfully</p>", unsafe_allow_html=True)
+                        self._record_results("company", dfs, source=company_url)
+                        self._download_tables(dfs, "linkedin_company_data", "Download Company Report", key="company_data")
                     else:
                         st.warning("No data found for this company URL.")
                 except Exception as e:
@@ -1207,6 +1423,8 @@ class LinkedInExtractorApp:
                     st.error(f"An error occurred: {str(e)}")
             else:
                 st.warning("Please enter a valid LinkedIn company URL.")
+        elif company_url:
+            self._retry_employee_shards(shared_url_index().canonicalize(company_url))
 
     def profile_extraction_by_keyword_page(self):
         """Pipeline: Profile Extraction by Keyword or LinkedIn Search URL → Filter by Headline → Export"""
@@ -1215,6 +1433,7 @@ class LinkedInExtractorApp:
 
         keyword_or_url = st.text_input("Keyword or LinkedIn People Search URL", key="profile_pipeline_keyword")
         search_limit = st.number_input("Number of profiles to extract", min_value=1, max_value=1000, value=50, step=1, key="profile_pipeline_search_limit")
+        scorer, min_score = self._lead_scoring_controls("profile_pipeline")
         
         if st.button("Run Profile Extraction Pipeline", key="profile_pipeline_run"):
             if keyword_or_url:
@@ -1249,134 +1468,38 @@ class LinkedInExtractorApp:
                         st.error("No profiles found for the given input.")
                         return
 
-                    profiles_df = pd.json_normalize(final_result["data"])
-                    profiles_df = self.remove_empty_columns(profiles_df)
-
-                    # Step 2: Filter Decision-Makers (based on 'headline' column from API)
-                    keywords = [
-    # Founders, Chairs, Presidents
-    "founder", "co-founder", "chairman", "executive chairman", "president", "executive vice president",
-    
-    # CEO-level
-    "ceo", "chief executive officer", "group chief executive officer", "chief executive office",
-
-    # COO-level
-    "coo", "chief operating officer", "group chief operating officer",
-
-    # CFO-level
-    "cfo", "chief financial officer", "group chief financial officer",
-
-    # CTO/Technology/Innovation
-    "cto", "chief technology officer", "chief innovation officer", "chief technology & strategy officer", 
-    "chief digital officer", "chief information officer", "cio", "chief information architect", "chief technology architect",
-    "chief digital & information officer",
-
-    # CHRO / People / Culture / Talent
-    "chro", "chief human resources officer", "chief people officer", "chief people and sustainability officer",
-    "chief human resources and corporate officer", "interim chief people and culture officer",
-    "group director of people & purpose", "head of talent", "head of talent acquisition",
-    "svp of people & culture",
-
-    # Product & Customer
-    "cpo", "chief product officer", "chief product & customer officer", "chief customer officer", 
-    "chief merchandising officer", "chief supply chain officer", "chief supply chain and industrial officer",
-
-    # Revenue & Commercial
-    "cro", "chief revenue officer", "chief commercial officer", "group chief commercial officer",
-    "group managing director, business development", "vp - sales", "svp of sales",
-
-    # Marketing & Brand
-    "cmo", "chief marketing officer", "group brand director", "marketing director", "head of marketing",
-    "marketing manager", "vp of global marketing",
-
-    # Legal, Risk, Compliance
-    "clo", "chief legal officer", "group general counsel", "general counsel", "chief legal counsel",
-    "chief risk officer", "chief compliance officer", "group chief risk and regulatory officer",
-
-    # Strategy, Growth, Analytics
-    "chief strategy officer", "group strategy director", "chief analytics officer", "vp strategy",
-    "director of strategy", "strategic advisor", "chief growth officer", "group corporate development director",
-
-    # Finance / Accounting
-    "finance director", "head of finance", "group cfo", "vp of finance", "finance manager",
-
-    # Data / Security
-    "chief data officer", "chief information security officer", "group ciso", "group it infrastructure manager",
-
-    # Science / Technology / Medical
-    "chief scientific officer", "chief medical officer", "vp of it and mis", "vp of engineering", 
-    "chief technology & chief analytics officer", "lcms technical manager", "senior lc technical specialist",
-
-    # Communications / Media / Brand
-    "group communication director", "vp of communications", "media enquiries lead", "director of production and content",
-
-    # Sustainability / ESG / Policy
-    "chief sustainability officer", "group esg", "sustainable development director", "chief policy officer",
-
-    # Operations / Services
-    "head of operations", "vp of operations", "head of membership and marketing", "customer experience manager",
-    "chief operations officer", "head of quality", "svp customer services", "group senior legal manager",
-
-    # Board Members / Directors
-    "board member", "managing director", "group managing director", "business unit director",
-    "director", "director of strategy & programmers", "associate director", "deputy director", "Chief Architect",
-    
-    # Misc Executive Roles
-    "svp", "senior vice president", "vp", "vice president", "avp", "assistant vice president",
-
-    # Functional Heads
-    "head of hr", "head of hr & engagement", "head of finance & operations", "head of china & asia",
-    "head of event content", "head of marketing and data", "head of commercial banking",
-
-    # Misc Titles from List
-    "chief administrative officer", "chief development officer", "chief transformation officer",
-    "chief science officer", "group advisory leader", "global assurance leader", "global chairman",
-    "vp of product", "vp of global demand generation", "customer experience director",
-    "senior business specialist", "business development manager", "director of insurance & partnerships"
-]
-
-
-                    if "headline" in profiles_df.columns:
-                        profiles_df["headline"] = profiles_df["headline"].astype(str).str.lower()
-                        mask = profiles_df["headline"].apply(lambda x: any(k.lower() in x for k in keywords))
-                        filtered_df = profiles_df[mask]
-                    else:
-                        st.warning("'headline' column not found. No filtering applied.")
-                        filtered_df = profiles_df
+                    profiles_df = self.drop_empty_columns(self.data_processor.normalize_records(final_result["data"]))
+                    self._record_results("people_search", profiles_df, source=keyword_or_url)
+                    # Step 2: Rank leads (title classification based on 'headline' column from API)
+                    if "headline" not in profiles_df.columns:
+                        st.warning("'headline' column not found. Titles are not scored.")
 
                     # Define important columns in order
                     important_columns = [
-                        "liPublicProfileUrl", "firstName", "lastName", "companyName", "jobTitle", "headline",
+                        "lead_rank", "lead_score", "liPublicProfileUrl", "firstName", "lastName", "companyName", "jobTitle", "headline", "title_function", "title_seniority",
                         "locationArea", "connectionDegree", "emailAddressPersonal", "liProfileUrl", "liProfileImageUrl", "liProfilePublicId",
                         "snProfileUrl", "isPremium", "pastJobTitle", "hashtags", "serviceProvider"
                     ]
-
-                    display_df = filtered_df[[col for col in important_columns if col in filtered_df.columns]]
+                    # Only the scored and displayed columns are classified and cleaned
+                    display_df, filtered_df = self._rank_projected(
+                        profiles_df, scorer, min_score, important_columns, title_column="headline"
+                    )
                     
                     # Display metrics
                     st.markdown(f"""
                     <div class='metric-display'>
                         <div class='metric-value'>{len(filtered_df)}</div>
-                        <div class='metric-label'>Decision-Maker Profiles</div>
+                        <div class='metric-label'>Leads Scoring {min_score}+</div>
                     </div>
                     """, unsafe_allow_html=True)
                     
-                    st.dataframe(self.clean_dataframe_for_streamlit(display_df), use_container_width=True)
+                    st.dataframe(display_df, use_container_width=True)
 
                     # Download filtered data
-                    output_dir = "outputs"
-                    os.makedirs(output_dir, exist_ok=True)
-                    filtered_data_path = os.path.join(output_dir, "filtered_profiles.xlsx")
-                    with pd.ExcelWriter(filtered_data_path, engine="openpyxl") as writer:
-                        filtered_df.to_excel(writer, sheet_name="filtered_profiles", index=False)
-
-                    with open(filtered_data_path, "rb") as f:
-                        st.download_button(
-                            label="Download Filtered Profiles",
-                            data=f,
-                            file_name="filtered_profiles.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                        )
+                    self._download_tables(
+                        {"filtered_profiles": filtered_df}, "filtered_profiles", "Download Filtered Profiles",
+                        key="filtered_profiles", job_id=self.output_manager.new_job("filtered_profiles")
+                    )
 
     def decision_maker_pipeline_page(self):
         """Simplified pipeline: Keyword Search → Filter by Headline → Export"""
@@ -1408,6 +1531,13 @@ class LinkedInExtractorApp:
                     "Number of posts to extract (Max. 2500)",
                     min_value=1, max_value=2500, value=10, step=1, key="pipeline_search_limit_auto"
                 )
+            sharded_search = st.checkbox(
+                "Sharded search",
+                help=SHARDED_SEARCH_HELP,
+                key="pipeline_sharded_search"
+            )
+            keyword_variants = st.text_area("Keyword variants (one per line, sharded search only)", key="pipeline_keyword_variants")
+        scorer, min_score = self._lead_scoring_controls("pipeline")
 
         if st.button("Run Pipeline", key="pipeline_run_all"):
             if keyword:
@@ -1426,170 +1556,271 @@ class LinkedInExtractorApp:
                     if search_limit:
                         api_inputs["maxCountPostSearch"] = int(search_limit)
 
-                    result = self.linkedin_api.run_automation(
-                        name="Pipeline Keyword Search",
-                        description="Pipeline: Search LinkedIn posts by keywords",
-                        automation_id=automation_id,
-                        connected_account_id=connected_account_id,
-                        timezone="Asia/Kolkata",
-                        inputs=api_inputs
-                    )
-                    data = result.get("data", {})
-                    execution_id = data.get("id") or data.get("workflowId")
-
-                    final_result = None
-                    if execution_id:
-                        for _ in range(120):
-                            final_result = self.linkedin_api.get_execution_result(execution_id)
-                            if final_result.get("data"):
-                                break
-                            time.sleep(1)
-
-                    if not (final_result and "data" in final_result):
-                        st.error("No posts found for the given keyword.")
-                        return
-
-                    posts_df = pd.json_normalize(final_result["data"])
-                    posts_df = self.remove_empty_columns(posts_df)
-
-                    # Step 2: Filter Decision-Makers (only using 'liProfileHeadline' column)
-                    keywords = [
-        # Founders, Chairs, Presidents
-        "founder", "co-founder", "chairman", "executive chairman", "president", "executive vice president",
-        
-        # CEO-level
-        "ceo", "chief executive officer", "group chief executive officer", "chief executive office",
-
-        # COO-level
-        "coo", "chief operating officer", "group chief operating officer",
-
-        # CFO-level
-        "cfo", "chief financial officer", "group chief financial officer",
-
-        # CTO/Technology/Innovation
-        "cto", "chief technology officer", "chief innovation officer", "chief technology & strategy officer", 
-        "chief digital officer", "chief information officer", "cio", "chief information architect", "chief technology architect",
-        "chief digital & information officer",
-
-        # CHRO / People / Culture / Talent
-        "chro", "chief human resources officer", "chief people officer", "chief people and sustainability officer",
-        "chief human resources and corporate officer", "interim chief people and culture officer",
-        "group director of people & purpose", "head of talent", "head of talent acquisition",
-        "svp of people & culture",
-
-        # Product & Customer
-        "cpo", "chief product officer", "chief product & customer officer", "chief customer officer", 
-        "chief merchandising officer", "chief supply chain officer", "chief supply chain and industrial officer",
-
-        # Revenue & Commercial
-        "cro", "chief revenue officer", "chief commercial officer", "group chief commercial officer",
-        "group managing director, business development", "vp - sales", "svp of sales",
-
-        # Marketing & Brand
-        "cmo", "chief marketing officer", "group brand director", "marketing director", "head of marketing",
-        "marketing manager", "vp of global marketing",
-
-        # Legal, Risk, Compliance
-        "clo", "chief legal officer", "group general counsel", "general counsel", "chief legal counsel",
-        "chief risk officer", "chief compliance officer", "group chief risk and regulatory officer",
-
-        # Strategy, Growth, Analytics
-        "chief strategy officer", "group strategy director", "chief analytics officer", "vp strategy",
-        "director of strategy", "strategic advisor", "chief growth officer", "group corporate development director",
-
-        # Finance / Accounting
-        "finance director", "head of finance", "group cfo", "vp of finance", "finance manager",
-
-        # Data / Security
-        "chief data officer", "chief information security officer", "group ciso", "group it infrastructure manager",
-
-        # Science / Technology / Medical
-        "chief scientific officer", "chief medical officer", "vp of it and mis", "vp of engineering", 
-        "chief technology & chief analytics officer", "lcms technical manager", "senior lc technical specialist",
-
-        # Communications / Media / Brand
-        "group communication director", "vp of communications", "media enquiries lead", "director of production and content",
-
-        # Sustainability / ESG / Policy
-        "chief sustainability officer", "group esg", "sustainable development director", "chief policy officer",
-
-        # Operations / Services
-        "head of operations", "vp of operations", "head of membership and marketing", "customer experience manager",
-        "chief operations officer", "head of quality", "svp customer services", "group senior legal manager",
-
-        # Board Members / Directors
-        "board member", "managing director", "group managing director", "business unit director",
-        "director", "director of strategy & programmers", "associate director", "deputy director", "Chief Architect",
-        
-        # Misc Executive Roles
-        "svp", "senior vice president", "vp", "vice president", "avp", "assistant vice president",
-
-        # Functional Heads
-        "head of hr", "head of hr & engagement", "head of finance & operations", "head of china & asia",
-        "head of event content", "head of marketing and data", "head of commercial banking",
+                    if sharded_search:
+                        posts_df = self._sharded_post_search(api_inputs, keyword_variants)
+                        if posts_df.empty:
+                            st.error("No posts found for the given keyword.")
+                            return
+                    else:
+                        result = self.linkedin_api.run_automation(
+                            name="Pipeline Keyword Search",
+                            description="Pipeline: Search LinkedIn posts by keywords",
+                            automation_id=automation_id,
+                            connected_account_id=connected_account_id,
+                            timezone="Asia/Kolkata",
+                            inputs=api_inputs
+                        )
+                        data = result.get("data", {})
+                        execution_id = data.get("id") or data.get("workflowId")
 
-        # Misc Titles from List
-        "chief administrative officer", "chief development officer", "chief transformation officer",
-        "chief science officer", "group advisory leader", "global assurance leader", "global chairman",
-        "vp of product", "vp of global demand generation", "customer experience director",
-        "senior business specialist", "business development manager", "director of insurance & partnerships"
-    ]
+                        final_result = None
+                        if execution_id:
+                            for _ in range(120):
+                                final_result = self.linkedin_api.get_execution_result(execution_id)
+                                if final_result.get("data"):
+                                    break
+                                time.sleep(1)
 
+                        if not (final_result and "data" in final_result):
+                            st.error("No posts found for the given keyword.")
+                            return
 
-                    if "liProfileHeadline" in posts_df.columns:
-                        posts_df["liProfileHeadline"] = posts_df["liProfileHeadline"].astype(str).str.lower()
-                        mask = posts_df["liProfileHeadline"].apply(lambda x: any(k.lower() in x for k in keywords))
-                        filtered_df = posts_df[mask]
-                    else:
-                        st.warning("'liProfileHeadline' column not found. No filtering applied.")
-                        filtered_df = posts_df
+                        posts_df = self.data_processor.normalize_records(final_result["data"])
+                    posts_df = self.drop_empty_columns(posts_df)
+                    self._record_results("post_search", posts_df, source=keyword)
+                    # Step 2: Rank post authors as leads (title classification from 'liProfileHeadline' column)
+                    if "liProfileHeadline" not in posts_df.columns:
+                        st.warning("'liProfileHeadline' column not found. Titles are not scored.")
 
                     # Define important columns in the specified order
                     important_columns = [
-                        "liPublicProfileUrl", "firstName", "lastName", "companyName", "liCompanyPublicUrl", "headcountRange",
-                        "jobLocationArea", "jobTitle", "jobTenure", "profileDescription", "liProfileHeadline", "emailAddressPersonal",
+                        "lead_rank", "lead_score", "liPublicProfileUrl", "firstName", "lastName", "companyName", "liCompanyPublicUrl", "headcountRange",
+                        "jobLocationArea", "jobTitle", "jobTenure", "profileDescription", "liProfileHeadline", "title_function", "title_seniority", "emailAddressPersonal",
                         "profileLocationCountry", "profileLocationCity", "profileLocationArea", "locationCountryCode", "industry"
                     ]
-
-                    display_df = filtered_df[[col for col in important_columns if col in filtered_df.columns]]
+                    # Only the scored and displayed columns are classified and cleaned
+                    display_df, filtered_df = self._rank_projected(
+                        posts_df, scorer, min_score, important_columns, title_column="liProfileHeadline"
+                    )
                     
                     # Display metrics
                     st.markdown(f"""
                     <div class='metric-display'>
                         <div class='metric-value'>{len(filtered_df)}</div>
-                        <div class='metric-label'>Decision-Maker Posts</div>
+                        <div class='metric-label'>Posts by Leads Scoring {min_score}+</div>
                     </div>
                     """, unsafe_allow_html=True)
                     
-                    st.dataframe(self.clean_dataframe_for_streamlit(display_df), use_container_width=True)
+                    st.dataframe(display_df, use_container_width=True)
 
                     # Download filtered data
-                    output_dir = "outputs"
-                    os.makedirs(output_dir, exist_ok=True)
-                    filtered_data_path = os.path.join(output_dir, "decision_makers.xlsx")
-                    with pd.ExcelWriter(filtered_data_path, engine="openpyxl") as writer:
-                        filtered_df.to_excel(writer, sheet_name="decision_makers", index=False)
-
-                    with open(filtered_data_path, "rb") as f:
-                        st.download_button(
-                            label="Download Decision-Makers Report",
-                            data=f,
-                            file_name="decision_makers.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                        )
+                    self._download_tables(
+                        {"decision_makers": filtered_df}, "decision_makers", "Download Decision-Makers Report",
+                        key="decision_makers", job_id=self.output_manager.new_job("decision_makers")
+                    )
+
+    def keyword_monitor_page(self):
+        """Saved keyword searches that fetch only posts published since the last run"""
+        st.markdown("<div class='section-header'>Keyword Monitors</div>", unsafe_allow_html=True)
+        st.caption("Save recurring keyword searches. Each run requests the narrowest time window since its last run and keeps only new posts.")
+
+        with st.expander("Create Monitor", expanded=False):
+            col1, col2 = st.columns(2)
+            with col1:
+                monitor_keyword = st.text_input("Keyword or LinkedIn Search URL", key="monitor_keyword")
+                monitor_sort_by = st.selectbox(
+                    "Sort By",
+                    ["", "DATE POSTED", "RELEVANCE"],
+                    format_func=lambda x: x if x else "-- Default --",
+                    key="monitor_sort_by"
+                )
+            with col2:
+                monitor_posted_by = st.selectbox(
+                    "Posted By",
+                    ["", "1st CONNECTION", "ME", "PEOPLE YOU FOLLOW"],
+                    format_func=lambda x: x if x else "-- Anyone --",
+                    key="monitor_posted_by"
+                )
+                monitor_limit = st.number_input(
+                    "Posts per run (Max. 2500)",
+                    min_value=1, max_value=2500, value=100, step=1, key="monitor_limit"
+                )
+            if st.button("Save Monitor", key="monitor_create"):
+                if monitor_keyword:
+                    self.monitor_store.create(
+                        monitor_keyword,
+                        max_count=monitor_limit,
+                        sort_by={"DATE POSTED": "date_posted", "RELEVANCE": "relevance"}.get(monitor_sort_by),
+                        posted_by={"1st CONNECTION": "first", "ME": "me", "PEOPLE YOU FOLLOW": "following"}.get(monitor_posted_by)
+                    )
+                    st.success(f"Monitor saved for '{monitor_keyword}'.")
+                else:
+                    st.error("Please enter a keyword or LinkedIn search URL.")
+
+        monitors = self.monitor_store.list()
+        if monitors.empty:
+            st.info("No monitors saved yet.")
+            return
+
+        st.dataframe(self.clean_dataframe_for_streamlit(monitors), use_container_width=True)
+        monitor_id = st.selectbox(
+            "Monitor",
+            monitors["monitor_id"].tolist(),
+            format_func=lambda i: f"#{i} - {monitors.loc[monitors['monitor_id'] == i, 'keyword'].iloc[0]}",
+            key="monitor_select"
+        )
+        col1, col2 = st.columns(2)
+        with col1:
+            run_monitor = st.button("Run Monitor", key="monitor_run")
+        with col2:
+            if st.button("Delete Monitor", key="monitor_delete"):
+                self.monitor_store.delete(monitor_id)
+                st.rerun()
+
+        if run_monitor:
+            monitor = self.monitor_store.get(monitor_id)
+            api_inputs = self.monitor_store.search_inputs(monitor)
+            st.write(f"Searching with time window: {api_inputs.get('startTime', 'all time')}")
+            with st.spinner("Running monitor..."):
+                final_result = self.linkedin_api.run_and_wait(
+                    name="Keyword Monitor",
+                    description=f"Monitor: search LinkedIn posts for {monitor['keyword']}",
+                    automation_id="64099c6e0936e46db5d76f4c",
+                    connected_account_id=self._get_automation_and_account("keyword search")[1],
+                    inputs=api_inputs,
+                    max_wait=120
+                )
+            if not final_result:
+                st.error("The search did not return results in time. The monitor was not updated.")
+                return
+
+            posts_df = self.data_processor.normalize_records(final_result["data"])
+            new_posts_df = self.monitor_store.record_run(monitor_id, posts_df)
+            new_posts_df = self.remove_empty_columns(new_posts_df)
+            self._record_results("keyword_monitor_posts", new_posts_df, source=monitor["keyword"])
+
+            st.markdown(f"""
+            <div class='metric-display'>
+                <div class='metric-value'>{len(new_posts_df)}</div>
+                <div class='metric-label'>New Posts ({len(posts_df)} returned)</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+            if not new_posts_df.empty:
+                st.dataframe(self.clean_dataframe_for_streamlit(new_posts_df), use_container_width=True)
+                self._download_tables({"new_posts": new_posts_df}, f"linkedin_monitor_{monitor_id}_new_posts", "Download New Posts", key="monitor_new_posts")
+
+    def _engagement_index(self):
+        """Return the engagement index over stored post extractions, rebuilt only when new posts were stored"""
+        runs = self.dataset_store.list_runs()
+        version = int(runs["result_type"].isin([f"post_{name}" for name in INTERACTION_TABLES]).sum())
+        cached = st.session_state.get("engagement_index")
+        if cached is None or cached[0] != version:
+            cached = (version, EngagementIndex.from_dataset_store(self.dataset_store))
+            st.session_state["engagement_index"] = cached
+        return cached[1]
+
+    def engagement_insights_page(self):
+        """Cross-post engagement: top engagers and people engaging with several posts"""
+        st.markdown("<div class='section-header'>Engagement Insights</div>", unsafe_allow_html=True)
+        st.caption("Reactors, commenters and likers of every post extracted on the Post Extraction page, linked across posts.")
+
+        index = self._engagement_index()
+        if not len(index):
+            st.info("No post engagement extracted yet. Extract posts with likers or comments first.")
+            return
+
+        col1, col2, col3 = st.columns(3)
+        for col, value, label in (
+            (col1, len(index.post_keys), "Posts"),
+            (col2, len(index.person_keys), "People"),
+            (col3, len(index), "Interactions"),
+        ):
+            with col:
+                st.markdown(f"""
+                <div class='metric-display'>
+                    <div class='metric-value'>{value}</div>
+                    <div class='metric-label'>{label}</div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        selected_posts = st.multiselect("Posts (all if empty)", index.post_keys, key="engagement_posts")
+        selected_interactions = st.multiselect(
+            "Interactions", INTERACTION_TYPES, default=INTERACTION_TYPES, key="engagement_interactions"
+        )
+        col1, col2 = st.columns(2)
+        with col1:
+            top_n = st.number_input("Top engagers", min_value=1, max_value=1000, value=20, step=5)
+        with col2:
+            min_posts = st.number_input("Engaged with at least N posts", min_value=1, max_value=1000, value=3, step=1)
+
+        post_keys = selected_posts or None
+        top_df = index.top_engagers(top_n, post_keys=post_keys, interactions=selected_interactions)
+        repeat_df = index.engaged_with_at_least(min_posts, post_keys=post_keys, interactions=selected_interactions)
+
+        st.subheader(f"Top Engagers ({len(top_df)})")
+        st.dataframe(self.clean_dataframe_for_streamlit(top_df), use_container_width=True)
+        st.subheader(f"Engaged With {min_posts}+ Posts ({len(repeat_df)})")
+        st.dataframe(self.clean_dataframe_for_streamlit(repeat_df), use_container_width=True)
+
+        self._download_tables({"top_engagers": top_df, "repeat_engagers": repeat_df}, "linkedin_engagement", "Download Engagement Report", key="engagement")
+
+    def people_directory_page(self):
+        """Merge people found by every extraction into one deduplicated export"""
+        st.markdown("<div class='section-header'>People Directory</div>", unsafe_allow_html=True)
+        st.caption("People from searches, post authors, engagers and company employees, matched by profile URL and by name within the same company.")
+
+        stored_types = set(self.dataset_store.result_types())
+        person_types = [
+            rtype for rtype in PERSON_RESULT_TYPES + [f"post_{name}" for name in INTERACTION_TABLES]
+            if rtype in stored_types
+        ]
+        if not person_types:
+            st.info("No people extracted yet.")
+            return
+        selected_types = st.multiselect("Sources (earlier sources win on conflicting values)", person_types, default=person_types)
+        col1, col2 = st.columns(2)
+        with col1:
+            start_date = st.date_input("Extracted from", value=None, key="people_directory_start")
+        with col2:
+            name_threshold = st.slider("Name similarity threshold", min_value=0.5, max_value=1.0, value=0.85, step=0.05)
+
+        if st.button("Build People Directory", key="people_directory_build") and selected_types:
+            with st.spinner("Merging people across sources..."):
+                frames = {rtype: self.dataset_store.query(rtype, start=start_date) for rtype in selected_types}
+                total_rows = sum(len(df) for df in frames.values())
+                people_df = dedupe_people(frames, name_threshold=name_threshold)
+            st.markdown(f"""
+            <div class='metric-display'>
+                <div class='metric-value'>{len(people_df)}</div>
+                <div class='metric-label'>Unique People (from {total_rows} rows)</div>
+            </div>
+            """, unsafe_allow_html=True)
+            st.dataframe(self.clean_dataframe_for_streamlit(people_df), use_container_width=True)
+            self._download_tables({"people": people_df}, "linkedin_people_directory", "Download People Directory", key="people_directory")
 
     def profile_batch_extraction_page(self):
-        """Upload an Excel file, extract profile data for all liPublicProfileUrl, filter headcount > 450, and export."""
+        """Upload an Excel file, extract profile data for all liPublicProfileUrl, rank them as leads, and export."""
         st.markdown("<div class='section-header'>Profile Batch Extraction</div>", unsafe_allow_html=True)
-        st.caption("Upload Excel file with profile URLs for batch processing and automated filtering")
+        st.caption("Upload an Excel, CSV or Parquet file with profile URLs for batch processing and automated filtering")
 
-        uploaded_file = st.file_uploader("Upload Excel file with 'liPublicProfileUrl' column", type=["xlsx"])
+        uploaded_file = st.file_uploader("Upload Excel, CSV or Parquet file with 'liPublicProfileURL' column", type=UPLOAD_TYPES)
+        freshness_days = st.number_input(
+            "Re-scrape profiles older than (days)",
+            min_value=0.0, value=float(DEFAULT_FRESHNESS_DAYS), step=1.0,
+            help="Profiles scraped more recently are reused from the local entity store. Use 0 to re-scrape everything."
+        )
+        enrich_companies = st.checkbox(
+            "Enrich with company data",
+            help="Scrape each distinct company of the extracted profiles once (reusing recently scraped companies) and add its details to every profile row"
+        )
+        scorer, min_score = self._lead_scoring_controls("batch", default_min_score=0)
         
         if uploaded_file:
             try:
-                input_df = pd.read_excel(uploaded_file)
+                input_df = read_upload(uploaded_file, usecols=["liPublicProfileURL"])
             except Exception as e:
-                st.error(f"Failed to read Excel file: {e}")
+                st.error(f"Failed to read uploaded file: {e}")
                 return
 
             if "liPublicProfileURL" not in input_df.columns:
@@ -1597,14 +1828,26 @@ class LinkedInExtractorApp:
                 return
 
             url_col_input = "liPublicProfileURL"
-            profile_urls = input_df[url_col_input].dropna().unique().tolist()
-
-            st.info(f"Found {len(profile_urls)} unique profile URLs. Starting extraction...")
-            profile_data = []
+            profile_urls, duplicate_count = shared_url_index().dedupe(input_df[url_col_input])
+
+            url_keys = {url: profile_key(url) for url in profile_urls}
+            fresh_profiles, stale_keys = self.entity_store.split_by_freshness("profile", url_keys.values(), freshness_days)
+            stale_keys = set(stale_keys)
+            urls_to_scrape = [url for url in profile_urls if url_keys[url] in stale_keys]
+
+            st.info(
+                f"Found {len(profile_urls)} unique profiles"
+                + (f" ({duplicate_count} duplicate URLs collapsed)" if duplicate_count else "")
+                + (f", reusing {len(fresh_profiles)} scraped within the last {freshness_days:g} days" if fresh_profiles else "")
+                + f". Extracting {len(urls_to_scrape)} profiles..."
+            )
+            # Profiles are flattened as they arrive rather than all at the end
+            profile_data = RecordFlattener().extend(fresh_profiles.values())
+            scraped_profiles = []
             extraction_errors = []
 
-            for idx, url in enumerate(profile_urls):
-                st.write(f"Extracting profile {idx+1}/{len(profile_urls)}: {url}")
+            for idx, url in enumerate(urls_to_scrape):
+                st.write(f"Extracting profile {idx+1}/{len(urls_to_scrape)}: {url}")
                 try:
                     result = self.linkedin_api.run_automation(
                         name="Batch Profile Extraction",
@@ -1624,7 +1867,8 @@ class LinkedInExtractorApp:
                                 break
                             time.sleep(1)
                     if final_result and "data" in final_result:
-                        profile_data.append(final_result["data"])
+                        profile_data.add(final_result["data"])
+                        scraped_profiles.append((url_keys[url], final_result["data"]))
                     else:
                         extraction_errors.append(f"No data for {url}")
                         st.error(f"Profile extraction failed or limit reached for: {url}. Try again later.")
@@ -1634,62 +1878,79 @@ class LinkedInExtractorApp:
                     st.error(f"Profile extraction failed for: {url}. Error: {e}")
                     break
 
-            if profile_data:
-                profiles_df = self.expand_profiles_to_df(profile_data)
-                profiles_df = self.remove_empty_columns(profiles_df)
-
-                profiles_df = profiles_df.rename(columns={
-                    col: (f"profile_{col}" if col.lower() != url_col_input.lower() else col)
-                    for col in profiles_df.columns
-                })
-
-                n = min(len(input_df), len(profiles_df))
-                merged_df = pd.concat([input_df.iloc[:n].reset_index(drop=True), profiles_df.iloc[:n].reset_index(drop=True)], axis=1)
-                merged_df = merged_df.loc[:, ~merged_df.columns.duplicated()]
-
-                # Auto filter: Headcount > 450
-                if 'profile_headcountRange' in merged_df.columns:
-                    def parse_headcount(x):
-                        try:
-                            parts = str(x).replace("+","").replace(",","").split("-")
-                            if len(parts) == 2:
-                                return int(parts[1].strip())
-                            elif parts[0].strip().isdigit():
-                                return int(parts[0].strip())
-                        except:
-                            return 0
-                        return 0
-
-                    merged_df['parsed_headcount'] = merged_df['profile_headcountRange'].apply(parse_headcount)
-                    filtered_df = merged_df[merged_df['parsed_headcount'] > 450].drop(columns=['parsed_headcount'])
-
-                    # Display metrics
-                    st.markdown(f"""
-                    <div class='metric-display'>
-                        <div class='metric-value'>{len(filtered_df)}</div>
-                        <div class='metric-label'>Large Companies (>450 employees)</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.warning("No 'profile_headcountRange' column found. Exporting full merged result.")
-                    filtered_df = merged_df
-
-                st.dataframe(self.clean_dataframe_for_streamlit(filtered_df), use_container_width=True)
-
-                output_dir = "outputs"
-                os.makedirs(output_dir, exist_ok=True)
-                merged_data_path = os.path.join(output_dir, "batch_profiles_filtered.xlsx")
-
-                with pd.ExcelWriter(merged_data_path, engine="openpyxl") as writer:
-                    filtered_df.to_excel(writer, sheet_name="profiles", index=False)
-
-                with open(merged_data_path, "rb") as f:
-                    st.download_button(
-                        label="Download Batch Processing Report",
-                        data=f,
-                        file_name="batch_profiles_filtered.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            try:
+                changes_df = self.entity_store.upsert_with_changes("profile", scraped_profiles)
+            except Exception as e:
+                # Change detection must not cost the user the profiles just scraped
+                app_logger.warning("Could not detect profile changes: {}", str(e))
+                changes_df = pd.DataFrame()
+            if not changes_df.empty:
+                st.subheader(f"Profile Changes Since Last Scrape ({changes_df['entity_id'].nunique()} profiles)")
+                st.dataframe(self.clean_dataframe_for_streamlit(changes_df), use_container_width=True)
+                self._record_results("entity_changes", changes_df, source=uploaded_file.name)
+
+            if len(profile_data):
+                profiles_df = self.drop_empty_columns(profile_data.to_frame())
+
+                # Only the URL column was needed to scrape; the report keeps every uploaded column
+                try:
+                    input_df = read_upload(uploaded_file)
+                except Exception as e:
+                    app_logger.warning("Could not re-read all uploaded columns, reporting URLs only: {}", str(e))
+                merged_df, unmatched_inputs, unmatched_profiles = self.data_processor.join_on_profile_key(
+                    input_df, url_col_input, profiles_df, prefix="profile_"
+                )
+                if not unmatched_inputs.empty or not unmatched_profiles.empty:
+                    st.warning(
+                        f"{len(unmatched_inputs)} uploaded rows have no extracted profile and "
+                        f"{len(unmatched_profiles)} extracted profiles could not be matched to an uploaded URL."
+                    )
+                    with st.expander("Unmatched rows", expanded=False):
+                        if not unmatched_inputs.empty:
+                            st.caption("Uploaded rows without an extracted profile")
+                            st.dataframe(self.clean_dataframe_for_streamlit(unmatched_inputs), use_container_width=True)
+                        if not unmatched_profiles.empty:
+                            st.caption("Extracted profiles without a matching uploaded URL")
+                            st.dataframe(self.clean_dataframe_for_streamlit(unmatched_profiles), use_container_width=True)
+                if enrich_companies:
+                    with st.spinner("Enriching profiles with company data..."):
+                        enricher = CompanyEnricher(
+                            self.linkedin_api, self.entity_store,
+                            self._get_automation_and_account("company extraction")[1],
+                            max_age_days=freshness_days
+                        )
+                        merged_df, enrichment_report = enricher.enrich(merged_df)
+                    cached = int((enrichment_report["status"] == "cached").sum())
+                    failed = int(enrichment_report["status"].isin(["timeout", "error"]).sum())
+                    st.info(
+                        f"Enriched with {len(enrichment_report)} distinct companies"
+                        f" ({cached} reused, {len(enrichment_report) - cached - failed} scraped, {failed} failed)."
                     )
+                    if failed:
+                        with st.expander("Company enrichment failures", expanded=False):
+                            st.dataframe(self.clean_dataframe_for_streamlit(
+                                enrichment_report[enrichment_report["status"].isin(["timeout", "error"])]
+                            ), use_container_width=True)
+                self._record_results("batch_profiles", merged_df, source=uploaded_file.name)
+
+                # Rank profiles as leads (headcount, title, connection degree, ...)
+                if 'profile_headcountRange' not in merged_df.columns:
+                    st.warning("No 'profile_headcountRange' column found. Headcount is not scored.")
+                display_df, filtered_df = self._rank_projected(merged_df, scorer, min_score, BATCH_DISPLAY_COLUMNS)
+
+                # Display metrics
+                st.markdown(f"""
+                <div class='metric-display'>
+                    <div class='metric-value'>{len(filtered_df)}</div>
+                    <div class='metric-label'>Leads Scoring {min_score}+</div>
+                </div>
+                """, unsafe_allow_html=True)
+
+                st.dataframe(display_df, use_container_width=True)
+                self._download_tables(
+                    {"profiles": filtered_df, "changes": changes_df}, "batch_profiles_filtered", "Download Batch Processing Report",
+                    key="batch_profiles_filtered", job_id=self.output_manager.new_job("batch_profiles")
+                )
 
     def comment_generator_page(self):
         """Display comment generator page for LinkedIn post content"""
@@ -1698,21 +1959,21 @@ class LinkedInExtractorApp:
         from src.config import Config
         
         st.markdown("<div class='section-header'>Generate Comments for LinkedIn Posts</div>", unsafe_allow_html=True)
-        st.caption("Upload Excel file with post content to generate AI-powered professional comments")
+        st.caption("Upload an Excel, CSV or Parquet file with post content to generate AI-powered professional comments")
         
-        # File uploader for Excel file
-        uploaded_file = st.file_uploader("Upload Excel file with post content", type=["xlsx", "xls"])
+        # File uploader for Excel, CSV or Parquet file
+        uploaded_file = st.file_uploader("Upload Excel, CSV or Parquet file with post content", type=UPLOAD_TYPES)
         
         if uploaded_file is not None:
             try:
-                # Load the Excel file
-                df = pd.read_excel(uploaded_file)
+                # Every uploaded column is kept so the report maps comments back to their posts
+                df = read_upload(uploaded_file)
                 
                 # Check if 'liPostContent' column exists
                 if 'liPostContent' not in df.columns:
-                    st.error("The Excel file must contain a column named 'liPostContent'.")
+                    st.error("The uploaded file must contain a column named 'liPostContent'.")
                 else:
-                    st.success(f"Successfully loaded Excel file with {len(df)} rows.")
+                    st.success(f"Successfully loaded file with {len(df)} rows.")
                     
                     # Display the dataframe
                     st.subheader("Preview of uploaded data")
@@ -1842,29 +2103,20 @@ class LinkedInExtractorApp:
                                 </div>
                                 """, unsafe_allow_html=True)
                                 
+                                self._record_results("generated_comments", df, source=uploaded_file.name)
                                 st.subheader("Results with Generated Comments")
                                 st.dataframe(self.clean_dataframe_for_streamlit(df), use_container_width=True)
                                 
                                 # Download button
-                                excel_buffer = io.BytesIO()
-                                with pd.ExcelWriter(excel_buffer, engine="openpyxl") as writer:
-                                    df.to_excel(writer, sheet_name="posts_with_comments", index=False)
-                                excel_buffer.seek(0)
-                                
-                                st.download_button(
-                                    label="Download Comments Report",
-                                    data=excel_buffer.getvalue(),
-                                    file_name="linkedin_posts_with_comments.xlsx",
-                                    mime="application/vnd.openxmlformats-officedocument.spreadsheetsheet"
-                                )
+                                self._download_tables({"posts_with_comments": df}, "linkedin_posts_with_comments", "Download Comments Report", key="posts_with_comments")
                                 
                             except Exception as e:
                                 st.error(f"An error occurred: {str(e)}")
                                 app_logger.error(f"Error in comment generation: {str(e)}")
                                 
             except Exception as e:
-                st.error(f"Error reading the Excel file: {str(e)}")
-                app_logger.error(f"Error reading Excel file: {str(e)}")
+                st.error(f"Error reading the uploaded file: {str(e)}")
+                app_logger.error(f"Error reading uploaded file: {str(e)}")
     def run(self):
         """Run the Streamlit application"""
         self.setup_page()
@@ -1882,6 +2134,12 @@ class LinkedInExtractorApp:
             self.profile_extraction_by_keyword_page()
         elif selected_page == "Post Extraction (By Keyword)":
             self.decision_maker_pipeline_page()
+        elif selected_page == "Keyword Monitors":
+            self.keyword_monitor_page()
+        elif selected_page == "Engagement Insights":
+            self.engagement_insights_page()
+        elif selected_page == "People Directory":
+            self.people_directory_page()
         elif selected_page == "Profile Batch Extraction":
             self.profile_batch_extraction_page()
         elif selected_page == "Comment Generator":